@@ -40,9 +40,8 @@ from handlers.message_handler import (  # noqa: E402
 from server_manager import create_server_manager  # noqa: E402
 from service_manager import create_service_manager  # noqa: E402
 from services.otiedote_json_service import (  # noqa: E402
-    get_otiedote_filters,
-    get_otiedote_target_filters,
-    otiedote_release_matches_filters,
+    OtiedoteReleaseFields,
+    load_otiedote_filters,
 )
 from state_utils import backup_json_atomic  # noqa: E402
 from word_tracking import DataManager  # noqa: E402
@@ -107,6 +106,11 @@ class BotManager:
             bot_name, self.stop_event, self.config
         )
 
+        # Run the midnight dream job on the service manager's scheduler
+        scheduler = getattr(self.service_manager, "scheduler", None)
+        if scheduler is not None and hasattr(self.server_manager, "set_scheduler"):
+            self.server_manager.set_scheduler(scheduler)
+
         # Set remaining dependencies in console manager
         self.console_manager.set_service_manager(self.service_manager)
         self.console_manager.set_message_handler(self.message_handler)
@@ -579,12 +583,13 @@ class BotManager:
         state_file = getattr(self.otiedote_service, "state_file", None) or getattr(
             get_config(), "state_file", None
         )
-        filters = get_otiedote_filters(state_file)
+        filters = load_otiedote_filters(state_file)
+        release_fields = OtiedoteReleaseFields(release)
 
         # Announce to all subscribed servers/channels
         for nick_or_channel, server_name in subscribers:
-            target_filters = get_otiedote_target_filters(filters, nick_or_channel)
-            if not otiedote_release_matches_filters(release, target_filters):
+            target_filter = filters.for_target(nick_or_channel)
+            if not target_filter.matches(release_fields):
                 self.logger.info(
                     f"Skipping Otiedote #{release['id']} for {nick_or_channel} "
                     f"on {server_name}: filters did not match"
@@ -4,6 +4,8 @@ Privileged Admin Commands for LeetIRCPythonBot
 This module contains administrative commands that require password authentication.
 """
 
+from datetime import date, datetime, timedelta
+
 from command_registry import CommandContext, CommandScope, command
 from config import get_config, get_config_manager
 from state_utils import update_json_file
@@ -573,6 +575,108 @@ def reload_status_command(context: CommandContext, bot_functions):
         return f"❌ Error getting status: {str(e)}"
 
 
+LOGSEARCH_LIMIT = 20
+_LOGSEARCH_TIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d",
+    "%H:%M:%S",
+    "%H:%M",
+)
+
+
+def _parse_log_time(text: str, today: date) -> datetime | None:
+    """Parse a local time as YYYY-MM-DD[THH:MM[:SS]] or HH:MM[:SS] (today)."""
+    for fmt in _LOGSEARCH_TIME_FORMATS:
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if not fmt.startswith("%Y"):
+            parsed = datetime.combine(today, parsed.time())
+        return parsed
+    return None
+
+
+@command(
+    "logsearch",
+    description="Search the structured log by time range (admin only)",
+    usage="!logsearch <password> <from> <to> [pattern]",
+    examples=[
+        "!logsearch mypass 13:30 13:45",
+        "!logsearch mypass 2026-10-17T13:37 2026-10-17T13:38 PRIVMSG",
+    ],
+    admin_only=True,
+    requires_args=True,
+)
+def logsearch_command(context: CommandContext, bot_functions):
+    """Show structured log records between two local times."""
+    args = list(context.args or [])
+    if context.is_console:
+        if verify_admin_password(args):
+            args = args[1:]
+    else:
+        if not verify_admin_password(args):
+            return "❌ Invalid admin password"
+        args = args[1:]
+
+    if len(args) < 2:
+        return "Usage: !logsearch <password> <from> <to> [pattern]"
+
+    today = datetime.now().date()
+    start = _parse_log_time(args[0], today)
+    end = _parse_log_time(args[1], today)
+    if start is None or end is None:
+        return "❌ Invalid time. Use YYYY-MM-DDTHH:MM[:SS] or HH:MM[:SS]"
+    if ":" not in args[1]:
+        end += timedelta(days=1, microseconds=-1)  # a date covers the whole day
+    elif end < start and "-" not in args[1]:
+        end += timedelta(days=1)  # "23:50 00:10" spans midnight
+    pattern = " ".join(args[2:]) or None
+
+    try:
+        import logger
+        import structured_log
+        from config import LOG_ROTATION_COUNT, STRUCTURED_LOG_FILE
+
+        sink = logger.get_structured_sink()
+        if sink is not None:
+            logger.flush_structured_log(timeout=1.0)
+            path, max_count = sink.path, sink.max_count
+        else:
+            path, max_count = STRUCTURED_LOG_FILE, LOG_ROTATION_COUNT
+
+        records, total = structured_log.search(
+            path,
+            int(start.timestamp() * 1_000_000_000),
+            int(end.timestamp() * 1_000_000_000),
+            pattern=pattern,
+            limit=LOGSEARCH_LIMIT,
+            max_count=max_count,
+        )
+    except Exception as e:
+        return f"❌ Log search error: {str(e)}"
+
+    if not total:
+        return "🔎 No log records in that range"
+
+    header = f"🔎 {total} log records"
+    if pattern:
+        header += f" matching '{pattern}'"
+    lines = [header]
+    for record in records:
+        ts = datetime.fromtimestamp(record["ts"] / 1_000_000_000)
+        parts = [ts.strftime("%Y-%m-%d %H:%M:%S"), f"[{record.get('level')}]"]
+        for value in (record.get("server"), record.get("channel")):
+            if value:
+                parts.append(f"[{value}]")
+        parts.append(str(record.get("message", "")).replace("\n", " | ")[:300])
+        lines.append(" ".join(parts))
+    if total > len(records):
+        lines.append(f"... {total - len(records)} more, narrow the range")
+    return "\n".join(lines)
+
+
 # Import this module to register the commands
 def register_admin_commands():
     """Register all admin commands. Called automatically when module is imported."""
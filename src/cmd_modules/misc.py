@@ -22,6 +22,14 @@ from command_registry import (
     process_command_message,
 )
 from config import PROJECT_ROOT, QUOTES_FILE, get_config
+from datasets import (
+    QuoteLines,
+    build_name_days,
+    build_other_name_days,
+    build_quote_lines,
+    get_dataset,
+    invalidate_dataset,
+)
 from logger import get_logger
 from word_tracking.data_manager import get_data_manager
 
@@ -353,21 +361,6 @@ def np_command(context: CommandContext, bot_functions):
         !np <name> - Search for a name
         !np date - Show when name days were last scraped
     """
-    import json
-
-    def parse_month_day(date_str):
-        parts = date_str.split("-")
-        try:
-            if len(parts) == 2:
-                month, day = parts
-            elif len(parts) == 3:
-                _, month, day = parts
-            else:
-                return None
-            return int(month), int(day)
-        except ValueError:
-            return None
-
     category_map = {
         "ruotsi": "Ruotsiksi",
         "saame": "Saameksi",
@@ -380,10 +373,10 @@ def np_command(context: CommandContext, bot_functions):
         month_day_date = f"{month:02d}-{day:02d}"
         results = []
         for category, display_name in category_map.items():
-            category_dates = others_data.get(category)
-            if not isinstance(category_dates, dict):
+            index = other_categories.get(category)
+            if index is None:
                 continue
-            names = category_dates.get(month_day_date)
+            names = index.names_on(month_day_date)
             if names and names != [": -"]:
                 results.append((display_name, names))
         return results
@@ -394,17 +387,14 @@ def np_command(context: CommandContext, bot_functions):
         return "Name day data file not found"
 
     try:
-        with open(np_file, "r", encoding="utf-8") as f:
-            nimipaivat = json.load(f)
+        name_days = get_dataset(np_file, build_name_days)
     except Exception:
         return "Error loading name day data"
 
-    # Handle _scrape_timestamp if present - skip it from the dict for date lookups
-    # This key is used for metadata only
+    nimipaivat = name_days.entries
     timestamps = {}
-    if "_scrape_timestamp" in nimipaivat:
-        timestamps["viralliset"] = nimipaivat["_scrape_timestamp"]
-        del nimipaivat["_scrape_timestamp"]
+    if name_days.timestamp is not None:
+        timestamps["viralliset"] = name_days.timestamp
 
     # Get today's date info
     now = datetime.now()
@@ -412,16 +402,14 @@ def np_command(context: CommandContext, bot_functions):
     today_day = now.day
 
     # Load additional name day data (Swedish, Sami, Orthodox)
-    others_data = {}
+    other_categories = {}
     others_file = os.path.join("data", "nimipaivat_others.json")
     if os.path.exists(others_file):
         try:
-            with open(others_file, "r", encoding="utf-8") as f:
-                others_data = json.load(f)
-                # Extract timestamp from others data
-                if "_scrape_timestamp" in others_data:
-                    timestamps["muut"] = others_data["_scrape_timestamp"]
-                    del others_data["_scrape_timestamp"]
+            others = get_dataset(others_file, build_other_name_days)
+            other_categories = others.categories
+            if others.timestamp is not None:
+                timestamps["muut"] = others.timestamp
         except Exception:
             pass  # Silently skip if file can't be loaded
 
@@ -502,48 +490,28 @@ def np_command(context: CommandContext, bot_functions):
         if arg.isdigit():
             day = int(arg)
             # Show all name days for that day number (any month)
-            results = []
-            for date_str, entry in nimipaivat.items():
-                if date_str == "_scrape_timestamp":
-                    continue
-                month_day = parse_month_day(date_str)
-                if not month_day:
-                    continue
-                m, d = month_day
-                if d == day:
-                    names = entry.get("official", [])
-                    if names:
-                        results.append(f"{day}.{m}: {', '.join(names)}")
+            results = [
+                f"{day}.{m}: {', '.join(names)}"
+                for m, names in name_days.official.by_day.get(day, [])
+            ]
             if results:
                 return " | ".join(results)
             return f"No name day found for day {day}"
 
         # Search by name
         search_name = arg
-        results = []
-        for date_str, entry in nimipaivat.items():
-            if date_str == "_scrape_timestamp":
-                continue
-            names = entry.get("official", [])
-            for name in names:
-                if search_name in name.lower():
-                    month_day = parse_month_day(date_str)
-                    if month_day:
-                        month, day = month_day
-                        results.append(f"{day}.{month}: {name}")
-
+        results = [
+            f"{day}.{month}: {name}"
+            for month, day, name in name_days.official.search(search_name)
+        ]
         for category, display_name in category_map.items():
-            category_dates = others_data.get(category)
-            if not isinstance(category_dates, dict):
+            index = other_categories.get(category)
+            if index is None:
                 continue
-            for date_str, names in category_dates.items():
-                month_day = parse_month_day(date_str)
-                if not month_day:
-                    continue
-                month, day = month_day
-                for name in names:
-                    if search_name in name.lower():
-                        results.append(f"{day}.{month}: {name} ({display_name})")
+            results.extend(
+                f"{day}.{month}: {name} ({display_name})"
+                for month, day, name in index.search(search_name)
+            )
         if results:
             return " | ".join(results[:10])  # Limit results
         return f"No name found: {search_name}"
@@ -712,6 +680,7 @@ def quote_command(context: CommandContext, bot_functions):
                     # Append the quote to the file
                     with open(quotes_source, "a", encoding="utf-8") as f:
                         f.write(quote_text + "\n")
+                    invalidate_dataset(quotes_source)
 
                 return f'✅ Quote added: "{quote_text}"'
             except Exception as e:
@@ -719,6 +688,7 @@ def quote_command(context: CommandContext, bot_functions):
 
         # Handle reading/displaying quotes
         lines = []
+        quote_lines = None
 
         if quotes_source.startswith("http://") or quotes_source.startswith("https://"):
             # Handle URL source
@@ -741,8 +711,8 @@ def quote_command(context: CommandContext, bot_functions):
                     return "Quotes file not found."
             else:
                 try:
-                    with open(quotes_source, "r", encoding="utf-8") as f:
-                        lines = [line.strip() for line in f if line.strip()]
+                    quote_lines = get_dataset(quotes_source, build_quote_lines)
+                    lines = quote_lines.lines
                 except Exception as e:
                     return f"Error reading quotes file: {e}"
 
@@ -754,15 +724,12 @@ def quote_command(context: CommandContext, bot_functions):
 
         if search_text:
             # Search for quotes containing the search text (case-insensitive)
-            matching_quotes = [
-                line for line in lines if search_text.lower() in line.lower()
-            ]
+            if quote_lines is None:
+                quote_lines = QuoteLines(lines)
+            quote = quote_lines.find(search_text)
 
-            if not matching_quotes:
+            if quote is None:
                 return f"No quotes found containing '{search_text}'"
-
-            # Return the first matching quote
-            quote = matching_quotes[0]
         else:
             # Select random quote
             quote = secure_random.choice(lines)
@@ -10,6 +10,7 @@ import os
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
 # Module-level imports for test compatibility
 # These allow tests to mock via cmd_modules.services.X paths
@@ -109,6 +110,7 @@ from command_registry import (
     CommandType,
     command,
 )
+from datasets import build_ecodes, get_dataset
 
 
 def _get_default_city(context: CommandContext, bot_functions) -> str:
@@ -119,6 +121,116 @@ def _get_default_city(context: CommandContext, bot_functions) -> str:
     return city.strip() if isinstance(city, str) and city.strip() else "Joensuu"
 
 
+# !alko ranking keywords -> AlkoService.query_products metric
+_ALKO_RANKINGS = {
+    "halvin": "value",
+    "cheapest": "value",
+    "hinta": "price",
+    "price": "price",
+    "litrahinta": "litre",
+    "litre": "litre",
+    "vahvin": "abv",
+    "strongest": "abv",
+}
+_ALKO_RANKING_HEADERS = {
+    "value": "🍺 Halvimmat juomat arvoltaan:",
+    "price": "🍺 Halvimmat juomat hinnaltaan:",
+    "litre": "🍺 Halvimmat juomat litrahinnaltaan:",
+    "abv": "🍺 Vahvimmat juomat:",
+}
+# English product words -> fragment of the Finnish Alko product type
+_ALKO_TYPE_ALIASES = {
+    "cider": "siider",
+    "ciders": "siider",
+    "beer": "olu",
+    "beers": "olu",
+    "wine": "viini",
+    "wines": "viini",
+    "red": "punaviini",
+    "white": "valkoviini",
+    "sparkling": "kuohuviini",
+    "whisky": "viski",
+    "whiskey": "viski",
+    "rum": "rommi",
+    "liqueur": "likööri",
+    "cognac": "konjak",
+    "vodka": "vodka",
+    "gin": "gin",
+}
+_ALKO_BELOW = {"alle", "under", "<"}
+_ALKO_ABOVE = {"yli", "over", ">"}
+_ALKO_COUNTRY = {"maa", "from"}
+
+
+def _parse_alko_amount(token: str) -> Tuple[str, float]:
+    """Parse "6%", "0.5l", "33cl" or "500ml" into ("abv"|"size", value)."""
+    token = token.lower().replace(",", ".")
+    for suffix, kind, scale in (
+        ("%", "abv", 1.0),
+        ("ml", "size", 0.001),
+        ("cl", "size", 0.01),
+        ("l", "size", 1.0),
+    ):
+        if token.endswith(suffix):
+            return kind, float(token[: -len(suffix)]) * scale
+    raise ValueError(token)
+
+
+def _parse_alko_ranking(words: List[str]) -> Tuple[str, int, Dict[str, Any]]:
+    """
+    Parse "halvin 5 siiderit alle 6%" style arguments.
+
+    Returns (metric, limit, query_products filters); raises ValueError with a
+    user-facing message on bad input.
+    """
+    metric = _ALKO_RANKINGS[words[0].lower()]
+    limit = 5
+    filters: Dict[str, Any] = {}
+    type_words: List[str] = []
+    country_words: List[str] = []
+
+    tokens = iter(words[1:])
+    for word in tokens:
+        lower = word.lower()
+        if lower.isdigit():
+            limit = int(lower)
+            if limit < 1 or limit > 10:
+                raise ValueError("🍺 Limit must be between 1 and 10")
+        elif lower in _ALKO_BELOW | _ALKO_ABOVE or lower[0] in "<>":
+            below = lower[0] == "<" or lower in _ALKO_BELOW
+            # "alle 6%" / "< 6%" take the next word, "<6%" is one word
+            amount = lower[1:] if len(lower) > 1 and lower[0] in "<>" else ""
+            amount = amount or next(tokens, "")
+            try:
+                kind, value = _parse_alko_amount(amount)
+            except ValueError:
+                raise ValueError(
+                    f"🍺 Invalid filter: {word} {amount}".rstrip()
+                ) from None
+            key = "max_abv" if kind == "abv" else "max_size"
+            if not below:
+                key = key.replace("max", "min")
+            filters[key] = value
+        elif lower in _ALKO_COUNTRY:
+            country_words.append(next(tokens, ""))
+        else:
+            try:
+                kind, value = _parse_alko_amount(lower)
+            except ValueError:
+                type_words.append(_ALKO_TYPE_ALIASES.get(lower, lower))
+                continue
+            if kind == "size":
+                filters["min_size"] = filters["max_size"] = value
+            else:
+                filters["min_abv"] = filters["max_abv"] = value
+
+    if type_words:
+        filters["product_type"] = " ".join(type_words)
+    if any(country_words):
+        filters["country"] = " ".join(w for w in country_words if w)
+    return metric, limit, filters
+
+
 @command(
     "s",
     aliases=["sää", "weather"],
@@ -1089,7 +1201,8 @@ def leetwinners_command(context: CommandContext, bot_functions):
     description="Get Eurojackpot information",
     usage=(
         "!eurojackpot [next|tulokset|last|date <DD.MM.YY|DD.MM.YYYY|YYYY-MM-DD>|"
-        "freq [--extended|--ext] [--limit N]|stats|hot|cold|pairs|trends|streaks|help]"
+        "freq [--extended|--ext] [--limit N]|stats|hot|cold|pairs|trends|streaks|"
+        "backtest <hot|cold|pairs|random> [window]|help]"
     ),
     admin_only=False,
 )
@@ -1185,6 +1298,24 @@ def command_eurojackpot(context, bot_functions):
                 res = service.get_streaks()
                 return res.get("message", "📊 Virhe putkitilastoissa")
 
+        # Strategy backtest over the stored history
+        if args[0] == "backtest":
+            if len(args) < 2:
+                return "Usage: !eurojackpot backtest <hot|cold|pairs|random> [window]"
+            from services.eurojackpot_service import get_eurojackpot_service
+
+            service = get_eurojackpot_service()
+            window = 50
+            if len(args) > 2:
+                try:
+                    window = int(args[2])
+                except ValueError:
+                    return (
+                        "Usage: !eurojackpot backtest <hot|cold|pairs|random> [window]"
+                    )
+            res = service.backtest_strategy(args[1], window=window)
+            return res.get("message", "🎯 Virhe backtestissä")
+
         if args[0] in ["scrape"]:
             from services.eurojackpot_service import get_eurojackpot_service
 
@@ -1195,7 +1326,7 @@ def command_eurojackpot(context, bot_functions):
         if args[0] == "help":
             return (
                 "Usage: !eurojackpot [next|tulokset|last|date <date>|freq [--extended] [--limit N]|"
-                "stats|hot|cold|pairs|trends|streaks|help]"
+                "stats|hot|cold|pairs|trends|streaks|backtest <strategy> [window]|help]"
             )
 
         # Fallback: treat as date
@@ -1211,8 +1342,8 @@ def command_eurojackpot(context, bot_functions):
 
 @command(
     "alko",
-    description="Search Alko product information or find cheapest by value",
-    usage="!alko <drink name> [bottle size] or <product number> or !alko halvin [limit]",
+    description="Search Alko product information or rank products by value, price or strength",
+    usage="!alko <drink name> [bottle size] or <product number> or !alko halvin|hinta|litrahinta|vahvin [limit] [type] [alle|yli N%|Nl] [maa <country>]",
     examples=[
         "!alko karhu",
         "!alko lapin kulta",
@@ -1220,11 +1351,14 @@ def command_eurojackpot(context, bot_functions):
         "!alko 319027",
         "!alko halvin",
         "!alko halvin 3",
+        "!alko halvin 5 siiderit alle 6%",
+        "!alko litrahinta viinit 3l",
+        "!alko vahvin 3 viskit maa skotlanti",
     ],
     requires_args=True,
 )
 def alko_command(context: CommandContext, bot_functions):
-    """Search for drink information from Alko product database or find cheapest by value."""
+    """Search for drink information from Alko product database or rank products."""
     if not context.args_text:
         return "Usage: !alko <drink name or product number> or !alko halvin [limit]"
 
@@ -1232,43 +1366,40 @@ def alko_command(context: CommandContext, bot_functions):
     if not query:
         return "Usage: !alko <drink name or product number> or !alko halvin [limit]"
 
-    # Check for "halvin" command (Finnish for "cheapest")
-    if query.lower().startswith("halvin"):
-        # Parse limit parameter
-        parts = query.split()
-        limit = 5  # default limit
-
-        if len(parts) > 1:
-            try:
-                limit = int(parts[1])
-                if limit < 1 or limit > 10:
-                    return "🍺 Limit must be between 1 and 10"
-            except ValueError:
-                return "🍺 Invalid limit. Usage: !alko halvin [limit]"
+    # Ranking queries: halvin (cheapest by value), hinta, litrahinta, vahvin
+    words = query.split()
+    if words[0].lower() in _ALKO_RANKINGS:
+        try:
+            metric, limit, filters = _parse_alko_ranking(words)
+        except ValueError as e:
+            return str(e)
 
         # Get the Alko service from bot functions or create directly
         get_alko_service = bot_functions.get("get_alko_service")
-        if not get_alko_service:
+        alko_service = get_alko_service() if get_alko_service else None
+        if alko_service is None:
             # Create service directly
             from services.alko_service import AlkoService
 
             alko_service = AlkoService()
-        else:
-            alko_service = get_alko_service()
 
         try:
-            cheapest_products = alko_service.find_cheapest_by_value(limit)
+            if metric == "value" and not filters:
+                products = alko_service.find_cheapest_by_value(limit)
+            else:
+                products = alko_service.query_products(metric, limit, **filters)
 
-            if not cheapest_products:
+            if not products:
+                if filters:
+                    return "🍺 Ei hakuehtoja vastaavia tuotteita"
                 return "🍺 No alcoholic products found in database"
 
             # Format results
             results = []
-            for i, product in enumerate(cheapest_products, 1):
+            for i, product in enumerate(products, 1):
                 name = product.get("name", "Unknown")
                 price = product.get("price", 0)
                 alcohol_grams = product.get("alcohol_grams", 0)
-                value_ratio = product.get("value_ratio", 0)
 
                 # Format bottle size
                 bottle_size_raw = product.get("bottle_size_raw")
@@ -1285,19 +1416,26 @@ def alko_command(context: CommandContext, bot_functions):
                 else:
                     alcohol_info = ""
 
-                # Format value ratio
+                # Format the ranked metric
+                if metric == "value":
+                    value_ratio = product.get("value_ratio", 0)
+                    metric_info = f" (arvo: {value_ratio:.2f}g/€)"
+                elif metric == "litre" and product.get("price_per_litre"):
+                    metric_info = f" ({product['price_per_litre']:.2f}€/l)"
+                else:
+                    metric_info = ""
+
                 results.append(
-                    f"{i}. {name}{size_info}{alcohol_info} - {price:.2f}€ "
-                    f"(arvo: {value_ratio:.2f}g/€)"
+                    f"{i}. {name}{size_info}{alcohol_info} - {price:.2f}€{metric_info}"
                 )
 
-            return "🍺 Halvimmat juomat arvoltaan:\n" + "\n".join(results)
+            return _ALKO_RANKING_HEADERS[metric] + "\n" + "\n".join(results)
 
         except Exception as e:
             import logging
 
             logger = logging.getLogger(__name__)
-            logger.error(f"Error in alko halvin command: {e}")
+            logger.error(f"Error in alko {words[0].lower()} command: {e}")
             return f"🍺 Error finding cheapest products: {str(e)}"
 
     # Regular product search
@@ -1833,8 +1971,7 @@ def ecode_command(context: CommandContext, bot_functions):
         if not data_file.exists():
             return CommandResponse.error_msg("E-codes database not found")
 
-        with open(data_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        ecodes = get_dataset(str(data_file), build_ecodes)
 
         ecode_input = context.args_text.strip().upper()
         if not ecode_input:
@@ -1846,18 +1983,14 @@ def ecode_command(context: CommandContext, bot_functions):
         if not ecode.startswith("E"):
             ecode = "E" + ecode
 
-        if ecode not in data["ecodes"]:
-            ecode = next(
-                (key for key in data["ecodes"] if key.upper() == ecode),
-                ecode,
-            )
-
-        if ecode not in data["ecodes"]:
+        resolved = ecodes.resolve(ecode)
+        if resolved is None:
             return CommandResponse.error_msg(f"E-code {ecode} not found in database")
+        ecode = resolved
 
-        ecode_data = data["ecodes"][ecode]
-        symbol_defs = data["symbol_definitions"]
-        indicator_defs = data["indicator_definitions"]
+        ecode_data = ecodes.ecodes[ecode]
+        symbol_defs = ecodes.symbol_definitions
+        indicator_defs = ecodes.indicator_definitions
         category_symbols = ""
         category_explanation = ""
 
@@ -10,10 +10,12 @@ import secrets
 
 from command_registry import CommandContext, CommandResponse, CommandType, command
 from config import SANANMUUNNOKSET_FILE
+from datasets import build_transformations, get_dataset, invalidate_dataset
 from tamagotchi import TamagotchiBot
 
 # Import lazy getters from word_tracking module directly
 from word_tracking import DataManager, DrinkTracker, GeneralWords
+from word_tracking.drink_tracker import count_buckets_since
 
 secure_random = secrets.SystemRandom()
 
@@ -120,9 +122,8 @@ def command_topwords(context, bot_functions):
     words = _get_from_bot_functions(bot_functions, "general_words", _get_general_words)
     dm = _get_from_bot_functions(bot_functions, "data_manager", _get_data_manager)
     server_name = _context_server_name(context, bot_functions)
-    servers = [server_name]
-    if not _has_explicit_server_context(context, bot_functions):
-        servers = dm.get_all_servers()
+    explicit_server = _has_explicit_server_context(context, bot_functions)
+    servers = [server_name] if explicit_server else dm.get_all_servers()
 
     if args:  # User-specific top words
         nick = " ".join(args).strip()
@@ -136,15 +137,12 @@ def command_topwords(context, bot_functions):
                 return f"{nick}@{search_server}: {word_list}"
         return f"Käyttäjää '{nick}' ei löydy."
 
-    word_counts = {}
-    for search_server in servers:
-        server_stats = words.get_server_stats(search_server)
-        for word, count in server_stats.get("top_words", []):
-            word_counts[word] = word_counts.get(word, 0) + count
-    if word_counts:
-        top_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)[
-            :limit
-        ]
+    # Server or global top words from the tracker's running aggregates
+    if explicit_server:
+        top_words = words.get_server_stats(server_name, limit).get("top_words", [])
+    else:
+        top_words = words.get_top_words(limit)
+    if top_words:
         word_list = ", ".join(f"{word}: {count}" for word, count in top_words)
         return f"Top {limit} sanat: {word_list}"
     return "Ei vielä tilastoja saatavilla."
@@ -995,11 +993,11 @@ def muunnos_command(context: CommandContext, bot_functions):
     # Load the transformation data
     data_file = SANANMUUNNOKSET_FILE
     try:
-        with open(data_file, "r", encoding="utf-8") as f:
-            transformations = json.load(f)
+        index = get_dataset(data_file, build_transformations)
     except (FileNotFoundError, IOError) as e:
         result = f"Virhe ladattaessa sananmuunnoksia: {e}"
         return _send_muunnos_response(context, bot_functions, result)
+    transformations = index.transformations
 
     # Check for 'search' or 's' command
     if context.args and context.args[0].lower() in ("search", "s"):
@@ -1012,10 +1010,7 @@ def muunnos_command(context: CommandContext, bot_functions):
             return _send_muunnos_response(context, bot_functions, result)
 
         search_term = search_args[0].lower()
-        matches = []
-        for original, transformed in transformations.items():
-            if search_term in original.lower() or search_term in transformed.lower():
-                matches.append((original, transformed))
+        matches = index.search(search_term)
 
         if not matches:
             result = f'Ei löydy muunnoksia termillä: "{search_term}"'
@@ -1078,11 +1073,13 @@ def muunnos_command(context: CommandContext, bot_functions):
                 transformed = parts[3].strip()
 
                 if original and transformed:
+                    transformations = dict(transformations)
                     transformations[original] = transformed
                     # Save back to file
                     try:
                         with open(data_file, "w", encoding="utf-8") as f:
                             json.dump(transformations, f, ensure_ascii=False, indent=4)
+                        invalidate_dataset(data_file)
                         result = (
                             f'✅ Added transformation: "{original}" → "{transformed}"'
                         )
@@ -1102,7 +1099,7 @@ def muunnos_command(context: CommandContext, bot_functions):
             result = "Ei sananmuunnoksia saatavilla."
             return _send_muunnos_response(context, bot_functions, result)
 
-        original = secure_random.choice(list(transformations.keys()))
+        original = secure_random.choice(index.originals)
         transformed = transformations[original]
         result = f"{original} - {transformed}"
         return _send_muunnos_response(context, bot_functions, result)
@@ -1147,7 +1144,7 @@ def muunnos_command(context: CommandContext, bot_functions):
     # Fallback: try random transformations until one works
     max_attempts = 10
     for _ in range(max_attempts):
-        random_original = secure_random.choice(list(transformations.keys()))
+        random_original = secure_random.choice(index.originals)
         random_transformed = transformations[random_original]
         # Try to apply this transformation somehow - for now just return it
         result = f"{random_original} - {random_transformed}"
@@ -1200,45 +1197,24 @@ def krakstats_command(context: CommandContext, bot_functions):
     last_week = now - timedelta(days=7)
     last_24h = now - timedelta(hours=24)
 
-    count_30d = 0
-    count_week = 0
-    count_24h = 0
-
-    # Count by drink type and time periods
+    # Windowed counts come from the hour/day buckets kept at record time
+    buckets = user_stats.get("buckets", {})
+    drink_type_recent = {
+        "30d": count_buckets_since(buckets, last_30_days),
+        "week": count_buckets_since(buckets, last_week),
+        "24h": count_buckets_since(buckets, last_24h),
+    }
+    count_30d = sum(drink_type_recent["30d"].values())
+    count_week = sum(drink_type_recent["week"].values())
+    count_24h = sum(drink_type_recent["24h"].values())
+
+    # All-time counts by drink type
     drink_type_counts = {}
-    drink_type_recent = {"30d": {}, "week": {}, "24h": {}}
-
-    for drink_word, drink_data in user_stats.get("drink_words", {}).items():
-        for timestamp_entry in drink_data.get("timestamps", []):
-            timestamp_str = timestamp_entry.get("time", "")
-            try:
-                timestamp = datetime.fromisoformat(timestamp_str)
-                specific_drink = timestamp_entry.get("specific_drink", "unspecified")
-
-                # Count by time period
-                if timestamp >= last_30_days:
-                    count_30d += 1
-                    drink_type_recent["30d"][specific_drink] = (
-                        drink_type_recent["30d"].get(specific_drink, 0) + 1
-                    )
-                if timestamp >= last_week:
-                    count_week += 1
-                    drink_type_recent["week"][specific_drink] = (
-                        drink_type_recent["week"].get(specific_drink, 0) + 1
-                    )
-                if timestamp >= last_24h:
-                    count_24h += 1
-                    drink_type_recent["24h"][specific_drink] = (
-                        drink_type_recent["24h"].get(specific_drink, 0) + 1
-                    )
-
-                # Count by drink type
-                drink_type_counts[specific_drink] = (
-                    drink_type_counts.get(specific_drink, 0) + 1
-                )
-
-            except (ValueError, KeyError):
-                continue
+    for drink_data in user_stats.get("drink_words", {}).values():
+        for specific_drink, count in drink_data.get("drinks", {}).items():
+            drink_type_counts[specific_drink] = (
+                drink_type_counts.get(specific_drink, 0) + count
+            )
 
     # Format response in compact multi-line format
     response_parts = []
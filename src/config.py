@@ -44,6 +44,10 @@ LOG_ROTATION_TIME = (
     "00:00"  # Time of day for daily/weekly/monthly rotation (HH:MM format)
 )
 
+# Structured (JSON lines) log, enabled with STRUCTURED_LOG=true
+STRUCTURED_LOG_FILE = os.path.join(DATA_DIR, "leet.jsonl")
+STRUCTURED_LOG_INDEX_INTERVAL = 60  # Seconds between sparse index entries
+
 # Bot Configuration Settings
 BOT_NAME = "LeetIRCBot"  # Bot nickname
 LOG_LEVEL = "INFO"  # Logging level
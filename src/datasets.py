@@ -0,0 +1,275 @@
+"""
+Shared cache for the static data files behind lookup commands.
+
+Commands such as !np, !muunnos, !ecode and !quote answer from files in
+``data/`` that change rarely. ``get_dataset`` loads a file once, hands it to a
+builder that prepares the indexes the command needs, and keeps the result until
+the file's modification time or size changes. In steady state a command only
+stats its file instead of reading and parsing it.
+"""
+
+import json
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from logger import get_logger
+
+logger = get_logger("Datasets")
+
+
+class DatasetRegistry:
+    """Builder results keyed by file path, invalidated when the file changes."""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, Callable], Tuple[Tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, builder: Callable[[str], Any]) -> Any:
+        """
+        Return ``builder(path)``, rebuilding only when the file has changed.
+
+        Raises:
+            OSError: If the file cannot be read (FileNotFoundError if missing)
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (path, builder)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        value = builder(path)
+        with self._lock:
+            self._entries[key] = (signature, value)
+        logger.debug(f"Loaded dataset {os.path.basename(path)}")
+        return value
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop cached results for one file, or for every file."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            path = os.path.abspath(path)
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+
+_registry = DatasetRegistry()
+
+
+def get_dataset(path: str, builder: Callable[[str], Any]) -> Any:
+    """Load ``path`` through the shared registry (see DatasetRegistry.get)."""
+    return _registry.get(path, builder)
+
+
+def invalidate_dataset(path: Optional[str] = None) -> None:
+    """Forget cached results after writing to a dataset file."""
+    _registry.invalidate(path)
+
+
+def _load_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _trigrams(text: str) -> Iterable[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _parse_month_day(date_str: str) -> Optional[Tuple[int, int]]:
+    parts = date_str.split("-")
+    try:
+        if len(parts) == 2:
+            month, day = parts
+        elif len(parts) == 3:
+            _, month, day = parts
+        else:
+            return None
+        return int(month), int(day)
+    except ValueError:
+        return None
+
+
+# =====================
+# Name days
+# =====================
+
+
+class NameDayIndex:
+    """Date -> names and lower-cased name -> dates for one name list."""
+
+    def __init__(self, dates: Dict[str, Any]):
+        self.dates = dates
+        self.by_day: Dict[int, List[Tuple[int, List[str]]]] = defaultdict(list)
+        self._name_dates: Dict[str, List[Tuple[int, int, int, str]]] = defaultdict(list)
+        ordinal = 0
+        for date_str, names in dates.items():
+            month_day = _parse_month_day(date_str)
+            if not month_day or not isinstance(names, list):
+                continue
+            month, day = month_day
+            if names:
+                self.by_day[day].append((month, names))
+            for name in names:
+                self._name_dates[name.lower()].append((ordinal, month, day, name))
+                ordinal += 1
+
+    def names_on(self, month_day: str) -> List[str]:
+        """Names for an ``MM-DD`` key, or an empty list."""
+        names = self.dates.get(month_day)
+        return names if isinstance(names, list) else []
+
+    def search(self, term: str) -> List[Tuple[int, int, str]]:
+        """(month, day, name) for names containing ``term``, in file order."""
+        hits = [
+            hit
+            for lowered, entries in self._name_dates.items()
+            if term in lowered
+            for hit in entries
+        ]
+        hits.sort()
+        return [(month, day, name) for _, month, day, name in hits]
+
+
+class NameDays:
+    """Parsed nimipaivat.json with its scrape timestamp split off."""
+
+    def __init__(self, data: Any):
+        self.timestamp = None
+        if isinstance(data, dict):
+            data = dict(data)
+            self.timestamp = data.pop("_scrape_timestamp", None)
+            official = {
+                date_str: entry.get("official", [])
+                for date_str, entry in data.items()
+                if isinstance(entry, dict)
+            }
+        else:
+            official = {}
+        self.entries = data
+        self.official = NameDayIndex(official)
+
+
+class OtherNameDays:
+    """Parsed nimipaivat_others.json, one NameDayIndex per category."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.timestamp = data.get("_scrape_timestamp")
+        self.categories = {
+            category: NameDayIndex(dates)
+            for category, dates in data.items()
+            if isinstance(dates, dict)
+        }
+
+
+def build_name_days(path: str) -> NameDays:
+    return NameDays(_load_json(path))
+
+
+def build_other_name_days(path: str) -> OtherNameDays:
+    data = _load_json(path)
+    return OtherNameDays(data if isinstance(data, dict) else {})
+
+
+# =====================
+# Word transformations
+# =====================
+
+
+class TransformationIndex:
+    """Sananmuunnos pairs with a trigram index over both sides."""
+
+    def __init__(self, transformations: Dict[str, str]):
+        self.transformations = transformations
+        self.originals = list(transformations)
+        self._lowered = [
+            (original.lower(), transformed.lower())
+            for original, transformed in transformations.items()
+        ]
+        self._postings: Dict[str, set] = defaultdict(set)
+        for position, (original, transformed) in enumerate(self._lowered):
+            for trigram in _trigrams(original) | _trigrams(transformed):
+                self._postings[trigram].add(position)
+
+    def __len__(self) -> int:
+        return len(self.originals)
+
+    def search(self, term: str) -> List[Tuple[str, str]]:
+        """Pairs whose either side contains lower-cased ``term``, in file order."""
+        if len(term) >= 3:
+            postings = sorted(
+                (self._postings.get(trigram, set()) for trigram in _trigrams(term)),
+                key=len,
+            )
+            candidates = sorted(set.intersection(*postings))
+        else:
+            candidates = range(len(self._lowered))
+        matches = []
+        for position in candidates:
+            original, transformed = self._lowered[position]
+            if term in original or term in transformed:
+                key = self.originals[position]
+                matches.append((key, self.transformations[key]))
+        return matches
+
+
+def build_transformations(path: str) -> TransformationIndex:
+    return TransformationIndex(_load_json(path))
+
+
+# =====================
+# E-codes
+# =====================
+
+
+class ECodes:
+    """ecodes.json with a case-insensitive code lookup."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.ecodes = data["ecodes"]
+        self.symbol_definitions = data["symbol_definitions"]
+        self.indicator_definitions = data["indicator_definitions"]
+        self._codes: Dict[str, str] = {}
+        for code in self.ecodes:
+            self._codes.setdefault(code.upper(), code)
+
+    def resolve(self, code: str) -> Optional[str]:
+        """Database key for a code such as ``E160A``, or None."""
+        if code in self.ecodes:
+            return code
+        return self._codes.get(code.upper())
+
+
+def build_ecodes(path: str) -> ECodes:
+    return ECodes(_load_json(path))
+
+
+# =====================
+# Quotes
+# =====================
+
+
+class QuoteLines:
+    """Non-empty lines of a quotes file with lower-cased copies for search."""
+
+    def __init__(self, lines: List[str]):
+        self.lines = lines
+        self._lowered = [line.lower() for line in lines]
+
+    def find(self, text: str) -> Optional[str]:
+        """First line containing ``text`` case-insensitively."""
+        text = text.lower()
+        for line, lowered in zip(self.lines, self._lowered):
+            if text in lowered:
+                return line
+        return None
+
+
+def build_quote_lines(path: str) -> QuoteLines:
+    with open(path, "r", encoding="utf-8") as f:
+        return QuoteLines([line.strip() for line in f if line.strip()])
@@ -206,12 +206,11 @@ def check_cache_products():
     print("-" * 50)
 
     try:
-        import json
+        from pathlib import Path
 
-        with open("data/alko_cache.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
+        from services.alko_service import _ProductStore
 
-        products = data["products"]
+        products, _ = _ProductStore.load(Path("data/alko_cache.bin"))
 
         # Search for "paperikassi"
         matches = [p for p in products if "paperikassi" in p.get("name", "").lower()]
@@ -248,12 +248,30 @@ def main():
             else:
                 print("Failed to fetch interactions data.")
 
+        elif command == "pack":
+            from packed_json import pack_json_file
+            from services.drug_service import DRUG_INDEX_FIELDS
+
+            scraper = DrugScraper()
+            for source, fields in (
+                (scraper.drugs_file, DRUG_INDEX_FIELDS),
+                (scraper.data_dir / "interactions.json", ()),
+            ):
+                if source.exists():
+                    target = pack_json_file(source, index_fields=fields)
+                    print(f"Packed {source} -> {target}")
+                else:
+                    print(f"Skipping missing {source}")
+
         elif command in ["help", "-h", "--help"]:
             print("Usage:")
             print("  python debug_drugs.py            # Test the drug service")
             print(
                 "  python debug_drugs.py scrape     # Scrape drug data and interactions from TripSit GitHub repository"
             )
+            print(
+                "  python debug_drugs.py pack       # Pack drugs/interactions JSON into memory-mapped .pjson files"
+            )
             print("  python debug_drugs.py help       # Show this help")
 
         else:
@@ -32,9 +32,8 @@ from lemmatizer import Lemmatizer
 from logger import get_logger
 from server import Server
 from services.otiedote_json_service import (
-    get_otiedote_filters,
-    get_otiedote_target_filters,
-    otiedote_release_matches_filters,
+    OtiedoteReleaseFields,
+    load_otiedote_filters,
 )
 from state_utils import update_json_file
 from tamagotchi import TamagotchiBot
@@ -491,10 +490,11 @@ class MessageHandler(LatencyTrackerMixin, UrlHandlerMixin):
             state_file = getattr(otiedote_service, "state_file", None) or getattr(
                 self.data_manager, "state_file", None
             )
-            filters = get_otiedote_filters(state_file)
+            filters = load_otiedote_filters(state_file)
+            release_fields = OtiedoteReleaseFields(data)
             for nick_or_channel, server_name in subscribers:
-                target_filters = get_otiedote_target_filters(filters, nick_or_channel)
-                if not otiedote_release_matches_filters(data, target_filters):
+                target_filter = filters.for_target(nick_or_channel)
+                if not target_filter.matches(release_fields):
                     logger.info(
                         f"Skipping Otiedote for {nick_or_channel} on {server_name}: "
                         "filters did not match"
@@ -1345,6 +1345,11 @@ class MessageHandler(LatencyTrackerMixin, UrlHandlerMixin):
             "load_leet_winners": self._load_leet_winners,
             "save_leet_winners": self._save_leet_winners,
             "get_alko_product": self._get_alko_product,
+            "get_alko_service": lambda: (
+                self.service_manager.get_service("alko")
+                if self.service_manager
+                else None
+            ),
             "check_drug_interactions": self._check_drug_interactions,
             "check_prescription_interactions": self._check_prescription_interactions,
             "send_weather": self._send_weather,
@@ -17,16 +17,20 @@ Features:
     - Context-aware logging to distinguish between different bot components or servers.
     - Unicode-safe output for compatibility across platforms.
     - Convenient global logger and helper functions for quick logging.
+    - File logging off the caller's thread: records are queued and written in
+      batches by a background QueuedLogWriter.
 """
 
+import atexit
 import os
 import shutil
 import sys
 import threading
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
-
-# from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, List, Optional
 
 
 def _safe_console_print(text: str) -> None:
@@ -216,6 +220,142 @@ _LEVEL_ORDER = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _enabled_levels(log_level: str) -> frozenset:
+    """Levels that pass the given LOG_LEVEL, computed once per setting."""
+    threshold = _LEVEL_ORDER.index(log_level) if log_level in _LEVEL_ORDER else 0
+    enabled = set(_LEVEL_ORDER[threshold:])
+    # Only allow SERVER logs if LOG_LEVEL is DEBUG or SERVER
+    if log_level not in ("DEBUG", "SERVER"):
+        enabled.discard("SERVER")
+    return frozenset(enabled)
+
+
+class QueuedLogWriter:
+    """
+    Writes log records from a background thread.
+
+    ``submit`` only appends to a bounded deque, so callers such as the IRC
+    reader never wait for disk I/O. The writer thread hands queued records to
+    ``write_batch`` and calls ``flush`` once ``flush_every`` records have been
+    written, ``flush_interval`` seconds have passed, or an urgent record (an
+    ERROR) arrives. When the queue is full the oldest records are dropped and
+    counted in ``dropped``.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[Any]], None],
+        flush: Optional[Callable[[], None]] = None,
+        max_queue: int = 10000,
+        flush_every: int = 256,
+        flush_interval: float = 0.5,
+        name: str = "LogWriter",
+    ):
+        self.write_batch = write_batch
+        self.flush_hook = flush
+        self.max_queue = max_queue
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.name = name
+        self.dropped = 0
+        self._queue: deque = deque(maxlen=max_queue)
+        self._wakeup = threading.Event()
+        self._urgent = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, record: Any, urgent: bool = False) -> None:
+        """Queue a record; urgent records are written and flushed promptly."""
+        if self._closed:
+            return
+        if self._thread is None:
+            self._start()
+        if len(self._queue) >= self.max_queue:
+            self.dropped += 1
+        self._queue.append(record)
+        if urgent:
+            self._urgent = True
+        # Waking the writer costs a lock; otherwise it wakes on its timer
+        if urgent or len(self._queue) >= self.flush_every:
+            self._wakeup.set()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything submitted so far is written and flushed."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.append(done)
+        self._wakeup.set()
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out what is queued and stop the writer thread."""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        pending = 0
+        last_flush = time.monotonic()
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            # Taken before draining, so an urgent record is in this batch or
+            # its flag (and wakeup) is left for the next pass
+            urgent, self._urgent = self._urgent, False
+            batch: List[Any] = []
+            waiters: List[threading.Event] = []
+            while True:
+                try:
+                    record = self._queue.popleft()
+                except IndexError:
+                    break
+                if isinstance(record, threading.Event):
+                    waiters.append(record)
+                else:
+                    batch.append(record)
+            if batch:
+                try:
+                    self.write_batch(batch)
+                except Exception as e:
+                    _safe_console_print(f"[LOGGER ERROR] Log writer failed: {e}")
+                pending += len(batch)
+
+            now = time.monotonic()
+            if pending and (
+                waiters
+                or self._closed
+                or pending >= self.flush_every
+                or now - last_flush >= self.flush_interval
+                or urgent
+            ):
+                pending = 0
+                last_flush = now
+                if self.flush_hook is not None:
+                    try:
+                        self.flush_hook()
+                    except Exception as e:
+                        _safe_console_print(f"[LOGGER ERROR] Log flush failed: {e}")
+            for waiter in waiters:
+                waiter.set()
+            if self._closed and not self._queue:
+                return
+
+
 class PrecisionLogger:
     """
     High-precision logger with nanosecond timestamp accuracy.
@@ -249,11 +389,7 @@ class PrecisionLogger:
         level = level.upper()
         if level not in _LEVEL_ORDER:
             level = "DEBUG"  # fallback to default
-
-        # Only allow SERVER logs if LOG_LEVEL is DEBUG or SERVER
-        if level == "SERVER" and _LOG_LEVEL not in ["DEBUG", "SERVER"]:
-            return False
-        return _LEVEL_ORDER.index(level) >= _LEVEL_ORDER.index(_LOG_LEVEL)
+        return level in _enabled_levels(_LOG_LEVEL)
 
     def _get_timestamp(self, ns: int | None = None) -> str:
         """
@@ -303,32 +439,21 @@ class PrecisionLogger:
             if not self._should_log(level):  # Check log level
                 return  # skip lower-level messages
             timestamp_ns = time.time_ns()
-            timestamp = self._get_timestamp(timestamp_ns)
+            context = context if context else self.context  # Use instance context
+
+            # Queue for the file writers before any formatting; the writer
+            # threads build the lines
+            if _file_writer is not None or _structured_writer is not None:
+                level_name = level.upper()
+                record = (timestamp_ns, level_name, context, message)
+                urgent = level_name == "ERROR"
+                if _file_writer is not None:
+                    _file_writer.submit(record, urgent=urgent)
+                if _structured_writer is not None:
+                    _structured_writer.submit(record, urgent=urgent)
             timestamp_dt = datetime.fromtimestamp(
                 timestamp_ns // 1_000_000_000, tz=timezone.utc
             ).astimezone()
-            context = context if context else self.context  # Use instance context
-
-            # Build message
-            parts = []
-            if level:
-                parts.append(f"[{level.upper():<7}]")
-            if context:
-                parts.append(f"[{context}]")
-            parts.append(message)
-
-            # Only include string elements in parts
-            output = " ".join(str(p) for p in parts if isinstance(p, str))
-
-            # Forward to file if hook is set (always do this for file logging)
-            # Use lock to ensure thread-safe writes in correct order
-            if _file_hook:
-                try:
-                    with _file_lock:
-                        _file_hook(timestamp, level.upper(), output)
-                except Exception as e:
-                    # Don't let file hook errors break logging
-                    _safe_console_print(f"[LOGGER ERROR] File hook failed: {e}")
 
             # Forward to TUI if hook is set, otherwise print to console
             if _tui_hook:
@@ -357,6 +482,8 @@ class PrecisionLogger:
                     _safe_console_print(f"[LOGGER ERROR] TUI hook failed: {e}")
             else:
                 # Only print to console if TUI hook is not active
+                timestamp = self._get_timestamp(timestamp_ns)
+                output = format_log_line(level, context, message)
                 _safe_console_print(f"{timestamp} {output}")  # Main console log output
                 # Also buffer for TUI display later
                 source_type = "SYSTEM"
@@ -476,11 +603,12 @@ _global_logger = PrecisionLogger()
 # TUI hook for forwarding log messages
 _tui_hook = None
 
-# File hook for writing logs to file
-_file_hook = None
+# Background writer feeding the file hook
+_file_writer: Optional[QueuedLogWriter] = None
 
-# Lock for thread-safe file writing
-_file_lock = threading.Lock()
+# Background writer feeding the structured (JSON lines) log sink
+_structured_writer: Optional[QueuedLogWriter] = None
+_structured_sink = None
 
 # Buffer for logs before TUI starts
 _log_buffer = []
@@ -501,20 +629,106 @@ def get_and_clear_log_buffer():
     return buffer
 
 
-def set_file_hook(hook_function):
+def format_log_line(level: str, context: str, message: str) -> str:
+    """The "[LEVEL  ] [context] message" part of a log line."""
+    parts = []
+    if level:
+        parts.append(f"[{level.upper():<7}]")
+    if context:
+        parts.append(f"[{context}]")
+    parts.append(message)
+    # Only include string elements in parts
+    return " ".join(str(p) for p in parts if isinstance(p, str))
+
+
+def set_file_hook(hook_function, flush_function=None):
     """Set a hook function to forward log messages to file.
 
+    The hook runs on a background writer thread, once per record, and
+    ``flush_function`` after each batch that is due for flushing (see
+    QueuedLogWriter).
+
     Args:
         hook_function: Function that accepts (timestamp, level, message)
+        flush_function: Optional function called to flush written records
     """
-    global _file_hook
-    _file_hook = hook_function
+    global _file_writer
+
+    def write_batch(records):
+        for timestamp_ns, level, context, message in records:
+            try:
+                hook_function(
+                    _global_logger._get_timestamp(timestamp_ns),
+                    level,
+                    format_log_line(level, context, message),
+                )
+            except Exception as e:
+                # Don't let file hook errors break logging
+                _safe_console_print(f"[LOGGER ERROR] File hook failed: {e}")
+
+    previous = _file_writer
+    _file_writer = QueuedLogWriter(write_batch, flush_function, name="FileLogWriter")
+    if previous is not None:
+        previous.close()
 
 
 def clear_file_hook():
-    """Clear the file hook."""
-    global _file_hook
-    _file_hook = None
+    """Write out queued records and clear the file hook."""
+    global _file_writer
+    writer, _file_writer = _file_writer, None
+    if writer is not None:
+        writer.close()
+
+
+def flush_file_log(timeout: float = 5.0) -> bool:
+    """Wait until records logged so far have reached the file hook."""
+    writer = _file_writer
+    return writer.flush(timeout) if writer is not None else True
+
+
+def set_structured_sink(sink):
+    """Send every logged record to a structured log sink as well.
+
+    Args:
+        sink: Object with write_batch(records) and flush() methods, such as
+            structured_log.StructuredLogSink; records are
+            (timestamp_ns, level, context, message) tuples
+    """
+    global _structured_writer, _structured_sink
+    previous = _structured_writer
+    _structured_writer = QueuedLogWriter(
+        sink.write_batch, sink.flush, name="StructuredLogWriter"
+    )
+    _structured_sink = sink
+    if previous is not None:
+        previous.close()
+
+
+def get_structured_sink():
+    """The active structured log sink, or None."""
+    return _structured_sink
+
+
+def clear_structured_sink():
+    """Write out queued records and stop structured logging."""
+    global _structured_writer, _structured_sink
+    writer, _structured_writer = _structured_writer, None
+    sink, _structured_sink = _structured_sink, None
+    if writer is not None:
+        writer.close()
+    close = getattr(sink, "close", None)
+    if close is not None:
+        close()
+
+
+def flush_structured_log(timeout: float = 5.0) -> bool:
+    """Wait until records logged so far have reached the structured sink."""
+    writer = _structured_writer
+    return writer.flush(timeout) if writer is not None else True
+
+
+atexit.register(clear_file_hook)
+atexit.register(clear_structured_sink)
 
 
 def set_tui_hook(hook_function):
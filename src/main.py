@@ -100,22 +100,49 @@ def setup_file_logging(log_file: str = "data/leet.log"):
     # Open the log file in append mode
     _log_file_handle = open(log_file, "a", encoding="utf-8")
 
-    # Define the file hook function that writes to the file
+    # Define the file hook function that writes to the file. It runs on the
+    # logger's writer thread, which calls file_flush after each batch.
     def file_hook(timestamp, level, message):
-        """Write log message to file with size and time checking."""
-        # Check both size and time-based rotation
-        check_log_rotation(log_file, max_size, interval, rotation_time)
-
-        # Write the log entry
+        """Write log message to file."""
         _log_file_handle.write(f"{timestamp} {message}\n")
-        _log_file_handle.flush()  # Ensure it's written immediately
+
+    def file_flush():
+        """Flush written entries and check size and time-based rotation."""
+        _log_file_handle.flush()
+        check_log_rotation(log_file, max_size, interval, rotation_time)
 
     # Register the file hook with the logger
-    logger.set_file_hook(file_hook)
+    logger.set_file_hook(file_hook, file_flush)
 
     return _log_file_handle
 
 
+def setup_structured_logging():
+    """
+    Start the structured JSON lines log (data/leet.jsonl) when STRUCTURED_LOG
+    is true. It runs alongside leet.log and keeps logging once the TUI starts.
+    """
+    if os.getenv("STRUCTURED_LOG", "false").split("#")[0].strip().lower() != "true":
+        return None
+
+    from config import (
+        LOG_ROTATION_COUNT,
+        LOG_ROTATION_SIZE,
+        STRUCTURED_LOG_FILE,
+        STRUCTURED_LOG_INDEX_INTERVAL,
+    )
+    from structured_log import StructuredLogSink
+
+    sink = StructuredLogSink(
+        STRUCTURED_LOG_FILE,
+        index_interval=STRUCTURED_LOG_INDEX_INTERVAL,
+        max_size=LOG_ROTATION_SIZE,
+        max_count=LOG_ROTATION_COUNT,
+    )
+    logger.set_structured_sink(sink)
+    return sink
+
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -217,6 +244,7 @@ def main():
 
     # Set up file logging FIRST to capture all logs from startup
     setup_file_logging()
+    setup_structured_logging()
 
     # Parse command line arguments
     args = parse_arguments()
@@ -0,0 +1,223 @@
+"""
+Packed, memory-mapped form of large read-only JSON object files.
+
+A JSON file whose top level is an object (``{"key": record, ...}``) can be
+packed into a ``.pjson`` file next to it. The packed file holds a key table,
+a key order sorted for binary search and one compact JSON blob per record,
+all read through ``mmap``. Opening it costs a header read, and each record is
+decoded only when it is looked up, so rarely used datasets stay on disk
+instead of living in memory as nested dicts.
+
+Indexes over the records usually need only a few small fields of each one.
+Those fields can be named when packing; they are then stored again as a
+small per-record summary, so an index can be built without decoding the
+full records (see ``indexed_items``).
+
+Layout (little-endian uint32 unless noted)::
+
+    MAGIC (8 bytes) | count | field list length | key offsets (count + 1) |
+    record offsets (count + 1) | summary offsets (count + 1) | sorted
+    positions (count) | field list (JSON) | key blob | record blob |
+    summary blob
+"""
+
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from logger import get_logger
+
+logger = get_logger("PackedJson")
+
+MAGIC = b"PJSON002"
+_U32 = struct.Struct("<I")
+
+
+def packed_path(source: Union[str, Path]) -> Path:
+    """Location of the packed form of a JSON file (``x.json`` -> ``x.pjson``)."""
+    return Path(source).with_suffix(".pjson")
+
+
+def pack_json_file(
+    source: Union[str, Path],
+    target: Optional[Union[str, Path]] = None,
+    index_fields: Sequence[str] = (),
+) -> Path:
+    """
+    Pack a JSON object file for use with PackedJson.
+
+    Args:
+        source: JSON file whose top level is an object
+        target: Output path, defaults to packed_path(source)
+        index_fields: Record fields to store again as per-record summaries
+
+    Returns:
+        Path of the written packed file
+    """
+    source = Path(source)
+    target = Path(target) if target else packed_path(source)
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{source} does not contain a JSON object")
+
+    keys = [key.encode("utf-8") for key in data]
+    records = [_dump(value) for value in data.values()]
+    summaries = [
+        _dump(
+            {field: value[field] for field in index_fields if field in value}
+            if isinstance(value, dict)
+            else {}
+        )
+        for value in data.values()
+    ]
+    fields = _dump(list(index_fields))
+    sorted_positions = sorted(range(len(keys)), key=keys.__getitem__)
+
+    def offsets(chunks):
+        table = [0]
+        for chunk in chunks:
+            table.append(table[-1] + len(chunk))
+        return table
+
+    count = len(keys)
+    tables = offsets(keys) + offsets(records) + offsets(summaries) + sorted_positions
+    tmp_path = target.with_suffix(target.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<2I", count, len(fields)))
+        f.write(struct.pack(f"<{len(tables)}I", *tables))
+        f.write(fields)
+        f.write(b"".join(keys))
+        f.write(b"".join(records))
+        f.write(b"".join(summaries))
+    os.replace(tmp_path, target)
+    logger.info(f"Packed {count} records from {source.name} into {target.name}")
+    return target
+
+
+def _dump(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class PackedJson(Mapping):
+    """Read-only mapping over a packed file; values are decoded per lookup."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[: len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{self.path} is not a packed JSON file")
+
+        count, fields_size = struct.unpack_from("<2I", self._mm, len(MAGIC))
+        self._count = count
+        self._key_offsets = len(MAGIC) + 8
+        self._record_offsets = self._key_offsets + 4 * (count + 1)
+        self._summary_offsets = self._record_offsets + 4 * (count + 1)
+        self._sorted = self._summary_offsets + 4 * (count + 1)
+        fields_start = self._sorted + 4 * count
+        self._key_blob = fields_start + fields_size
+        self._record_blob = self._key_blob + self._entry(self._key_offsets, count)
+        self._summary_blob = self._record_blob + self._entry(
+            self._record_offsets, count
+        )
+        self.index_fields: Tuple[str, ...] = tuple(
+            json.loads(self._mm[fields_start : self._key_blob])
+        )
+
+    def _entry(self, table: int, i: int) -> int:
+        return _U32.unpack_from(self._mm, table + 4 * i)[0]
+
+    def _key_bytes(self, i: int) -> bytes:
+        start = self._key_blob + self._entry(self._key_offsets, i)
+        end = self._key_blob + self._entry(self._key_offsets, i + 1)
+        return self._mm[start:end]
+
+    def _value(self, i: int) -> Any:
+        start = self._record_blob + self._entry(self._record_offsets, i)
+        end = self._record_blob + self._entry(self._record_offsets, i + 1)
+        return json.loads(self._mm[start:end])
+
+    def _summary(self, i: int) -> Any:
+        start = self._summary_blob + self._entry(self._summary_offsets, i)
+        end = self._summary_blob + self._entry(self._summary_offsets, i + 1)
+        return json.loads(self._mm[start:end])
+
+    def _find(self, key: Any) -> Optional[int]:
+        """Position of ``key`` via binary search over the sorted key order."""
+        if not isinstance(key, str):
+            return None
+        wanted = key.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            position = self._entry(self._sorted, mid)
+            current = self._key_bytes(position)
+            if current == wanted:
+                return position
+            if current < wanted:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        position = self._find(key)
+        if position is None:
+            raise KeyError(key)
+        return self._value(position)
+
+    def __contains__(self, key: object) -> bool:
+        return self._find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._key_bytes(i).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def summaries(self) -> Iterator[Tuple[str, Any]]:
+        """(key, index_fields of the record) pairs in file order."""
+        for i in range(self._count):
+            yield self._key_bytes(i).decode("utf-8"), self._summary(i)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._mm.close()
+
+
+def load_json_mapping(source: Union[str, Path]) -> Any:
+    """
+    Load a JSON object file, preferring its packed form when that is present
+    and at least as new as the JSON (or the JSON is gone).
+    """
+    source = Path(source)
+    packed = packed_path(source)
+    if packed.exists() and (
+        not source.exists() or packed.stat().st_mtime >= source.stat().st_mtime
+    ):
+        try:
+            return PackedJson(packed)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable packed file {packed}: {e}")
+    with open(source, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def indexed_items(data: Any, fields: Iterable[str]) -> Iterable[Tuple[str, Any]]:
+    """
+    (key, record) pairs for building an index that reads only ``fields``.
+
+    A PackedJson packed with those fields yields its small summaries instead
+    of decoding every record; anything else yields its full items.
+    """
+    if isinstance(data, PackedJson) and set(fields) <= set(data.index_fields):
+        return data.summaries()
+    return data.items()
@@ -0,0 +1,269 @@
+"""
+Periodic job scheduler for the bot's background monitors.
+
+A single thread keeps a heap of due times and hands due jobs to a small worker
+pool, so the pollers no longer each need a thread that mostly sleeps. Each job
+has its own interval (or a function computing the next delay), optional
+jitter, and an optional timeout. A job that is still running when it falls due
+again is skipped rather than started twice. A ``next_delay`` job is asked for
+its next delay only once its run has returned, since the answer usually
+depends on what the run did. Python threads cannot be killed, so a run that
+exceeds its timeout is only logged and counted, and the job is not started
+again until that run returns.
+"""
+
+import heapq
+import itertools
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from logger import get_logger
+
+logger = get_logger("Scheduler")
+
+secure_random = secrets.SystemRandom()
+
+
+class ScheduledJob:
+    """A periodic job and its run-time metrics."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: Optional[float] = None,
+        next_delay: Optional[Callable[[], float]] = None,
+        jitter: float = 0.0,
+        timeout: Optional[float] = None,
+        initial_delay: Optional[float] = None,
+    ):
+        if interval is None and next_delay is None:
+            raise ValueError(f"Job {name} needs an interval or next_delay")
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.next_delay = next_delay
+        self.jitter = jitter
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+
+        self.next_run: Optional[float] = None  # time.monotonic() value
+        self.running = False
+        self.started_at: Optional[float] = None
+        self.runs = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.skipped = 0
+        self.last_run: Optional[float] = None  # time.time() of the last finish
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._timeout_reported = False
+
+    def delay(self, first: bool = False) -> float:
+        """Seconds until the next run, jitter included."""
+        if first and self.initial_delay is not None:
+            base = self.initial_delay
+        elif first and self.next_delay is None:
+            base = 0.0
+        elif self.next_delay is not None:
+            base = self.next_delay()
+        else:
+            base = self.interval
+        if self.jitter:
+            base += secure_random.uniform(0, self.jitter)
+        return max(0.0, base)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the job's metrics; ``next_run`` is a wall-clock time."""
+        next_run = None
+        if self.next_run is not None:
+            next_run = time.time() + max(0.0, self.next_run - time.monotonic())
+        return {
+            "interval": self.interval,
+            "running": self.running,
+            "runs": self.runs,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "last_run": self.last_run,
+            "last_duration": self.last_duration,
+            "last_error": self.last_error,
+            "next_run": next_run,
+        }
+
+
+class Scheduler:
+    """Runs ScheduledJobs from one timer thread and a bounded worker pool."""
+
+    def __init__(self, max_workers: int = 4, name: str = "Scheduler"):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def add_job(self, name: str, func: Callable[[], Any], **options) -> ScheduledJob:
+        """
+        Add or replace a job. Options are those of ScheduledJob: ``interval``
+        or ``next_delay``, ``jitter``, ``timeout`` and ``initial_delay``.
+        Interval jobs first run right away, ``next_delay`` jobs when it says.
+        """
+        job = ScheduledJob(name, func, **options)
+        with self._cond:
+            self._jobs[name] = job
+            if self._running:
+                self._push(job, job.delay(first=True))
+            self._cond.notify()
+        return job
+
+    def remove_job(self, name: str) -> bool:
+        """Stop scheduling a job; a run in progress is left to finish."""
+        with self._cond:
+            job = self._jobs.pop(name, None)
+            if job is not None:
+                job.next_run = None
+            self._cond.notify()
+        return job is not None
+
+    def get_job(self, name: str) -> Optional[ScheduledJob]:
+        return self._jobs.get(name)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics for every job, keyed by job name."""
+        with self._cond:
+            return {name: job.stats() for name, job in self._jobs.items()}
+
+    def start(self) -> None:
+        """Start the timer thread; every job runs after its initial delay."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._heap = []
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix=f"{self.name}Worker"
+            )
+            for job in self._jobs.values():
+                self._push(job, job.delay(first=True))
+            self._thread = threading.Thread(
+                target=self._loop, name=self.name, daemon=True
+            )
+            self._thread.start()
+        logger.info(f"{self.name} started with {len(self._jobs)} jobs")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop scheduling. Runs in progress are not waited for; jobs should
+        watch their own stop flags.
+        """
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+            thread, executor = self._thread, self._executor
+            self._thread = self._executor = None
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        logger.info(f"{self.name} stopped")
+
+    # ---------------- Internals (hold self._cond) ----------------
+    def _push(self, job: ScheduledJob, delay: float) -> None:
+        job.next_run = time.monotonic() + delay
+        heapq.heappush(self._heap, (job.next_run, next(self._sequence), job))
+
+    def _loop(self) -> None:
+        with self._cond:
+            while self._running:
+                now = time.monotonic()
+                deadline = self._check_timeouts(now)
+                if self._heap and self._heap[0][0] <= now:
+                    _, _, job = heapq.heappop(self._heap)
+                    if self._jobs.get(job.name) is job:
+                        self._dispatch(job)
+                    continue
+                if self._heap:
+                    due = self._heap[0][0]
+                    deadline = due if deadline is None else min(deadline, due)
+                wait = None if deadline is None else max(0.0, deadline - now)
+                self._cond.wait(wait)
+
+    def _check_timeouts(self, now: float) -> Optional[float]:
+        """Report overdue runs; return the next time a run will be overdue."""
+        deadline = None
+        for job in self._jobs.values():
+            if not job.running or not job.timeout or job._timeout_reported:
+                continue
+            overdue_at = job.started_at + job.timeout
+            if now >= overdue_at:
+                job._timeout_reported = True
+                job.timeouts += 1
+                logger.warning(
+                    f"Job {job.name} has run over its {job.timeout:g}s timeout"
+                )
+            elif deadline is None or overdue_at < deadline:
+                deadline = overdue_at
+        return deadline
+
+    def _reschedule(self, job: ScheduledJob) -> None:
+        try:
+            delay = job.delay()
+        except Exception as e:
+            logger.error(f"Could not schedule next run of {job.name}: {e}")
+            delay = job.interval or 60.0
+        self._push(job, delay)
+
+    def _dispatch(self, job: ScheduledJob) -> None:
+        if job.next_delay is None:
+            self._reschedule(job)
+        else:
+            job.next_run = None  # _run reschedules once the run returns
+        if job.running:
+            job.skipped += 1
+            logger.debug(f"Skipping {job.name}: previous run still in progress")
+            return
+        job.running = True
+        job.started_at = time.monotonic()
+        job._timeout_reported = False
+        try:
+            self._executor.submit(self._run, job)
+        except RuntimeError:
+            job.running = False
+
+    def _run(self, job: ScheduledJob) -> None:
+        error = None
+        try:
+            job.func()
+        except Exception as e:
+            error = e
+            logger.error(f"Scheduled job {job.name} failed: {e}")
+        finally:
+            with self._cond:
+                job.running = False
+                job.runs += 1
+                job.last_run = time.time()
+                job.last_duration = time.monotonic() - job.started_at
+                if error is not None:
+                    job.failures += 1
+                    job.last_error = str(error)
+                if (
+                    job.next_delay is not None
+                    and job.next_run is None
+                    and self._running
+                    and self._jobs.get(job.name) is job
+                ):
+                    self._reschedule(job)
+                self._cond.notify()
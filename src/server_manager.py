@@ -7,10 +7,12 @@ extracted from bot_manager.py.
 
 import os
 import threading
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 from config import AUTO_CONNECT, get_config
 from logger import get_logger
+from scheduler import Scheduler
 from server import Server
 
 logger = get_logger("ServerManager")
@@ -28,6 +30,8 @@ class ServerManager:
     - Connection pooling
     """
 
+    MIDNIGHT_JOB = "midnight_dreams"
+
     def __init__(self, bot_name: str, stop_event: threading.Event, bot_config=None):
         """
         Initialize the server manager.
@@ -67,9 +71,11 @@ class ServerManager:
         else:
             self.quit_message = os.getenv("QUIT_MESSAGE", "Disconnecting")
 
-        # Midnight scheduler
-        self.midnight_scheduler_thread = None
-        self._scheduler_running = False
+        # Midnight dreams run as a job on the shared scheduler (see
+        # set_scheduler); without one, a private scheduler is started.
+        self.scheduler: Optional[Scheduler] = None
+        self._owns_scheduler = False
+        self._last_dream_date = None
 
         # Load server configurations
         self._load_server_configurations()
@@ -524,55 +530,47 @@ class ServerManager:
         except Exception as e:
             logger.error(f"Error in server manager wait loop: {e}")
 
+    def set_scheduler(self, scheduler: Scheduler):
+        """Use a shared scheduler for the midnight dream job."""
+        self.scheduler = scheduler
+
     def _start_midnight_scheduler(self):
-        """Start the midnight scheduler thread."""
-        if self._scheduler_running:
+        """Schedule the daily lag measurement and dream sending."""
+        if self.scheduler is None:
+            self.scheduler = Scheduler(max_workers=1, name="MidnightScheduler")
+            self._owns_scheduler = True
+        elif self.scheduler.get_job(self.MIDNIGHT_JOB) is not None:
             logger.warning("Midnight scheduler already running")
             return
 
-        self._scheduler_running = True
-        self.midnight_scheduler_thread = threading.Thread(
-            target=self._midnight_scheduler_loop, name="MidnightScheduler", daemon=True
+        self.scheduler.add_job(
+            self.MIDNIGHT_JOB,
+            self._measure_and_send_dreams,
+            next_delay=self._seconds_until_dream_window,
+            timeout=60.0,
         )
-        self.midnight_scheduler_thread.start()
+        if self._owns_scheduler:
+            self.scheduler.start()
         logger.info("🌙 Midnight scheduler started")
 
-    def _midnight_scheduler_loop(self):
-        """Main loop for midnight scheduler."""
-        import time
-        from datetime import datetime, timedelta
-
-        while not self.stop_event.is_set() and self._scheduler_running:
-            try:
-                # Check if it's time for lag measurement (1:01:00.010101010 - 1:01:01.010101010)
-                now = datetime.now()
-
-                # Target time: 1:01:01.010101010 AM
-                target_time = now.replace(hour=1, minute=1, second=1, microsecond=10101)
-
-                # If we've passed 1:01:01 today, target tomorrow's 1:01:01
-                if now > target_time:
-                    target_time = target_time + timedelta(days=1)
-
-                # Calculate time until target
-                time_until_target = target_time - now
-
-                # If we're in the 10-second window before target time, measure lag
-                if 0 < time_until_target.total_seconds() <= 10:
-                    self._measure_and_send_dreams()
-
-                # Sleep for 1 second to avoid busy waiting
-                self.stop_event.wait(1)
-
-            except Exception as e:
-                logger.error(f"Error in midnight scheduler: {e}")
-                self.stop_event.wait(1)
+    @staticmethod
+    def _next_dream_time(now: datetime) -> datetime:
+        """Next 1:01:01.010101 at or after ``now``."""
+        target_time = now.replace(hour=1, minute=1, second=1, microsecond=10101)
+        if now > target_time:
+            target_time = target_time + timedelta(days=1)
+        return target_time
+
+    def _seconds_until_dream_window(self) -> float:
+        """Seconds until 10 s before the next dream time not yet handled."""
+        now = datetime.now()
+        target_time = self._next_dream_time(now)
+        if target_time.date() == self._last_dream_date:
+            target_time = target_time + timedelta(days=1)
+        return max(0.0, (target_time - timedelta(seconds=10) - now).total_seconds())
 
     def _measure_and_send_dreams(self):
         """Measure lag and send dreams at 1:01:01.010101010."""
-        import time
-        from datetime import datetime, timedelta
-
         try:
             # Measure lag to each connected server
             lag_measurements = {}
@@ -594,14 +592,8 @@ class ServerManager:
                 logger.warning("No lag measurements available")
 
             # Wait until exactly 1:01:01.010101010 minus average lag
-            now = datetime.now()
-
-            # Target time: 1:01:01.010101010 AM
-            target_time = now.replace(hour=1, minute=1, second=1, microsecond=10101)
-
-            # If we've passed 1:01:01 today, target tomorrow's 1:01:01
-            if now > target_time:
-                target_time = target_time + timedelta(days=1)
+            target_time = self._next_dream_time(datetime.now())
+            self._last_dream_date = target_time.date()
 
             # Calculate optimal send time
             send_time = target_time - timedelta(seconds=avg_lag_ns / 1_000_000_000)
@@ -711,9 +703,10 @@ class ServerManager:
         logger.info("Shutting down server manager...")
 
         # Stop midnight scheduler
-        self._scheduler_running = False
-        if self.midnight_scheduler_thread and self.midnight_scheduler_thread.is_alive():
-            self.midnight_scheduler_thread.join(timeout=1.0)
+        if self.scheduler is not None:
+            self.scheduler.remove_job(self.MIDNIGHT_JOB)
+            if self._owns_scheduler:
+                self.scheduler.stop(timeout=1.0)
 
         # Disconnect from all servers
         self.disconnect_from_servers(quit_message=quit_message)
@@ -8,7 +8,8 @@ and danger announcement services.
 
 import os
 import sys
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Callable, Dict, Optional
 
 # Add project root to path for imports before any src.* imports
 _project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -17,6 +18,7 @@ if _project_root not in sys.path:
 
 from config import get_api_key  # noqa: E402
 from logger import get_logger  # noqa: E402
+from scheduler import Scheduler  # noqa: E402
 
 logger = get_logger("ServiceManager")
 
@@ -30,11 +32,19 @@ class ServiceManager:
     - API key validation
     - Service availability checking
     - Graceful fallback when services are unavailable
+    - Running the polling monitors from one shared scheduler
     """
 
+    # Services polled by the scheduler, started and stopped in this order
+    POLLED_SERVICES = ("fmi_warning", "otiedote", "danger_announcement")
+
     def __init__(self):
         """Initialize the service manager."""
         self._bot_manager = None
+        self.scheduler = Scheduler(max_workers=4, name="ServiceScheduler")
+        # Services whose datasets are loaded on first get_service() call
+        self._lazy_services: Dict[str, Callable[[], None]] = {}
+        self._lazy_lock = threading.Lock()
         try:
             # Make sure config is loaded first (which loads .env)
             from config import get_config
@@ -49,9 +59,7 @@ class ServiceManager:
             self._initialize_electricity_service()
             self._initialize_youtube_service()
             self._initialize_crypto_service()
-            self._initialize_alko_service()
-            self._initialize_drug_service()
-            self._initialize_prescription_interaction_service()
+            self._register_lazy_services()
             self._initialize_leet_detector()
             self._initialize_fmi_warning_service()
             self._initialize_otiedote_service()
@@ -67,6 +75,36 @@ class ServiceManager:
             # Initialize empty services dict to prevent further errors
             self.services = {}
 
+    def _register_lazy_services(self):
+        """
+        Defer the services backed by large static datasets (Alko price list,
+        TripSit drugs and interactions, Flockhart table) until first use.
+        """
+        self._lazy_services = {
+            "alko": self._initialize_alko_service,
+            "drug": self._initialize_drug_service,
+            "prescription_interaction": (
+                self._initialize_prescription_interaction_service
+            ),
+        }
+        for name in self._lazy_services:
+            self.services.pop(name, None)
+
+    def _load_lazy_service(self, service_name: str) -> None:
+        """Run a deferred initializer once, even with concurrent callers."""
+        with self._lazy_lock:
+            if service_name in self.services:
+                return
+            initializer = self._lazy_services.get(service_name)
+            if initializer is None:
+                return
+            logger.info(f"Loading {service_name} service on first use...")
+            try:
+                initializer()
+            except Exception as e:
+                logger.warning(f"Lazy {service_name} service failed to load: {e}")
+                self.services[service_name] = None
+
     def set_bot_manager(self, bot_manager):
         """Set the bot manager reference for callbacks."""
         self._bot_manager = bot_manager
@@ -302,55 +340,36 @@ class ServiceManager:
             self.services["danger_announcement"] = None
 
     def start_background_services(self):
-        """Start services that need background monitoring."""
-        fmi = self.services.get("fmi_warning")
-        if fmi and hasattr(fmi, "start"):
-            try:
-                fmi.start()
-                logger.info("FMI warning background monitor started.")
-            except Exception as e:
-                logger.warning(f"Could not start FMI warning monitor: {e}")
-
-        otiedote = self.services.get("otiedote")
-        if otiedote and hasattr(otiedote, "start_background"):
-            try:
-                otiedote.start_background()
-                logger.info("📢 Otiedote background monitor started.")
-            except Exception as e:
-                logger.warning(f"Could not start otiedote monitor: {e}")
-
-        danger = self.services.get("danger_announcement")
-        if danger and hasattr(danger, "start"):
-            try:
-                danger.start()
-                logger.info("⚠️ Danger announcement background monitor started.")
-            except Exception as e:
-                logger.warning(f"Could not start danger announcement monitor: {e}")
+        """Schedule the polling monitors and start the shared scheduler."""
+        for name in self.POLLED_SERVICES:
+            service = self.services.get(name)
+            if service and hasattr(service, "schedule"):
+                try:
+                    service.schedule(self.scheduler)
+                    logger.info(f"Scheduled {name} background monitor.")
+                except Exception as e:
+                    logger.warning(f"Could not schedule {name} monitor: {e}")
+        self.scheduler.start()
 
     def stop_background_services(self):
-        """Stop services that run background monitors."""
-        fmi = self.services.get("fmi_warning")
-        if fmi and hasattr(fmi, "stop"):
-            try:
-                fmi.stop()
-            except Exception as e:
-                logger.warning(f"Could not stop FMI warning monitor cleanly: {e}")
+        """Stop the monitors and the shared scheduler that runs them."""
+        for name in self.POLLED_SERVICES:
+            service = self.services.get(name)
+            if service and hasattr(service, "unschedule"):
+                try:
+                    service.unschedule(self.scheduler)
+                except Exception as e:
+                    logger.warning(f"Could not stop {name} monitor cleanly: {e}")
+        self.scheduler.stop()
 
-        otiedote = self.services.get("otiedote")
-        if otiedote and hasattr(otiedote, "stop_background"):
-            try:
-                otiedote.stop_background()
-            except Exception as e:
-                logger.warning(f"Could not stop otiedote monitor cleanly: {e}")
+    def get_scheduler_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Run-time metrics of the scheduled jobs.
 
-        danger = self.services.get("danger_announcement")
-        if danger and hasattr(danger, "stop"):
-            try:
-                danger.stop()
-            except Exception as e:
-                logger.warning(
-                    f"Could not stop danger announcement monitor cleanly: {e}"
-                )
+        Returns:
+            Dict mapping job name to its last duration, next run, failures, etc.
+        """
+        return self.scheduler.stats()
 
     def _initialize_dream_service(self):
         """Initialize Dream service."""
@@ -380,6 +399,8 @@ class ServiceManager:
         Returns:
             Service instance or None if not available
         """
+        if service_name not in self.services and service_name in self._lazy_services:
+            self._load_lazy_service(service_name)
         return self.services.get(service_name)
 
     def is_service_available(self, service_name: str) -> bool:
@@ -392,12 +413,14 @@ class ServiceManager:
         Returns:
             True if service is available, False otherwise
         """
-        return self.services.get(service_name) is not None
+        return self.get_service(service_name) is not None
 
     def get_available_services(self) -> Dict[str, Any]:
         """
         Get all available services.
 
+        Lazily loaded services that nobody has used yet are not included.
+
         Returns:
             Dictionary of service name -> service instance for available services
         """
@@ -435,12 +458,6 @@ class ServiceManager:
             ("electricity", self._initialize_electricity_service),
             ("youtube", self._initialize_youtube_service),
             ("crypto", self._initialize_crypto_service),
-            ("alko", self._initialize_alko_service),
-            ("drug", self._initialize_drug_service),
-            (
-                "prescription_interaction",
-                self._initialize_prescription_interaction_service,
-            ),
             ("leet_detector", self._initialize_leet_detector),
             ("fmi_warning", self._initialize_fmi_warning_service),
             ("otiedote", self._initialize_otiedote_service),
@@ -479,6 +496,11 @@ class ServiceManager:
         # Clear existing services
         self.services.clear()
 
+        # Dataset-backed services load again on their next use
+        self._register_lazy_services()
+        for service_name in self._lazy_services:
+            results[service_name] = "reloaded"
+
         # Reinitialize all services
         for service_name, init_method in init_methods:
             try:
@@ -5,11 +5,14 @@ Provides Alko (Finnish alcohol monopoly) price and product information.
 Downloads and parses the Alko price list Excel file.
 """
 
+import json
+import re
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 import requests
 
 from logger import get_logger
@@ -17,6 +20,375 @@ from logger import get_logger
 logger = get_logger("AlkoService")
 
 
+def _has_value(value: Any) -> bool:
+    """True for a real cell value (not None, NaN or an empty string)."""
+    if value is None:
+        return False
+    if isinstance(value, float) and value != value:
+        return False
+    return not (isinstance(value, str) and not value.strip())
+
+
+class _ProductStore:
+    """
+    Compact, read-only columnar product table.
+
+    Numeric fields are float64 arrays (NaN = missing) and string fields are a
+    UTF-8 blob with int32 offsets plus a presence mask. On disk the columns
+    follow a small JSON header, so loading is a single read with zero-copy
+    ``np.frombuffer`` views and no per-product parsing. Rows are materialized
+    into plain dicts only when accessed.
+    """
+
+    MAGIC = b"ALKOCOL1"
+    FLOAT_FIELDS = ("price", "bottle_size", "alcohol_percent", "alcohol_grams")
+    STRING_FIELDS = ("name", "number", "bottle_size_raw", "type", "country")
+
+    def __init__(self, count: int, columns: Dict[str, np.ndarray]):
+        self._count = count
+        self._columns = columns
+
+    @classmethod
+    def from_products(cls, products: List[Dict[str, Any]]) -> "_ProductStore":
+        """Build a store from parsed product dicts."""
+        count = len(products)
+        columns: Dict[str, np.ndarray] = {}
+        for field in cls.FLOAT_FIELDS:
+            values = [product.get(field) for product in products]
+            columns[field] = np.array(
+                [float(v) if v is not None else np.nan for v in values],
+                dtype="<f8",
+            )
+        for field in cls.STRING_FIELDS:
+            present = np.zeros(count, dtype=bool)
+            offsets = np.zeros(count + 1, dtype="<i4")
+            chunks = []
+            position = 0
+            for i, product in enumerate(products):
+                value = product.get(field)
+                if value is not None:
+                    present[i] = True
+                    encoded = str(value).encode("utf-8")
+                    chunks.append(encoded)
+                    position += len(encoded)
+                offsets[i + 1] = position
+            columns[f"{field}.present"] = present
+            columns[f"{field}.offsets"] = offsets
+            columns[f"{field}.blob"] = np.frombuffer(b"".join(chunks), dtype=np.uint8)
+        return cls(count, columns)
+
+    @classmethod
+    def load(cls, path: Path) -> Tuple["_ProductStore", Optional[str]]:
+        """Load a store written by save(); returns (store, last_updated)."""
+        data = path.read_bytes()
+        if data[: len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f"{path} is not an Alko product store")
+        header_start = len(cls.MAGIC) + 4
+        header_len = int.from_bytes(data[len(cls.MAGIC) : header_start], "little")
+        header = json.loads(data[header_start : header_start + header_len])
+        base = header["data_offset"]
+        columns = {
+            name: np.frombuffer(
+                data,
+                dtype=np.dtype(spec["dtype"]),
+                count=spec["length"],
+                offset=base + spec["offset"],
+            )
+            for name, spec in header["columns"].items()
+        }
+        return cls(header["count"], columns), header.get("last_updated")
+
+    def save(self, path: Path, last_updated: Optional[str]) -> None:
+        """Write the store atomically (temporary file + replace)."""
+        specs = {}
+        offset = 0
+        for name, array in self._columns.items():
+            specs[name] = {
+                "dtype": array.dtype.str,
+                "offset": offset,
+                "length": len(array),
+            }
+            offset += -(-array.nbytes // 8) * 8  # keep columns 8-byte aligned
+
+        header = {
+            "count": self._count,
+            "last_updated": last_updated,
+            "columns": specs,
+            "data_offset": 0,
+        }
+        # data_offset depends on the header length, which depends on data_offset
+        encoded = b""
+        for _ in range(3):
+            encoded = json.dumps(header).encode("utf-8")
+            start = len(self.MAGIC) + 4 + len(encoded)
+            data_offset = -(-start // 8) * 8
+            if header["data_offset"] == data_offset:
+                break
+            header["data_offset"] = data_offset
+
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(len(encoded).to_bytes(4, "little"))
+            f.write(encoded)
+            f.write(b"\0" * (header["data_offset"] - f.tell()))
+            for name, array in self._columns.items():
+                raw = array.tobytes()
+                f.write(raw)
+                f.write(b"\0" * (-len(raw) % 8))
+        tmp_path.replace(path)
+
+    def floats(self, field: str) -> np.ndarray:
+        """Numeric column (NaN where the product has no value)."""
+        return self._columns[field]
+
+    def string(self, field: str, i: int) -> Optional[str]:
+        """Decode one string cell, or None if the product has no value."""
+        present = self._columns.get(f"{field}.present")
+        # Stores written before a field existed simply lack its columns
+        if present is None or not present[i]:
+            return None
+        offsets = self._columns[f"{field}.offsets"]
+        return (
+            self._columns[f"{field}.blob"][offsets[i] : offsets[i + 1]]
+            .tobytes()
+            .decode("utf-8")
+        )
+
+    def strings(self, field: str) -> List[Optional[str]]:
+        """Decode a whole string column."""
+        return [self.string(field, i) for i in range(self._count)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        product: Dict[str, Any] = {}
+        for field in self.STRING_FIELDS:
+            value = self.string(field, i)
+            if value is not None:
+                product[field] = value
+        for field in self.FLOAT_FIELDS:
+            value = self._columns[field][i]
+            if not np.isnan(value):
+                product[field] = float(value)
+        return product
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (_ProductStore, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+
+def _product_column(products: Any, field: str) -> List[Any]:
+    """One field for every product, read column-wise when the store allows it."""
+    if isinstance(products, _ProductStore):
+        if field in _ProductStore.STRING_FIELDS:
+            return products.strings(field)
+        return [None if v != v else float(v) for v in products.floats(field).tolist()]
+    return [product.get(field) for product in products]
+
+
+class _ProductIndex:
+    """
+    Search index over the product list, built once per cache load.
+
+    Holds the lower-cased names, trigram posting lists for substring queries,
+    bottle-size buckets (in centilitres), the product numbers and a map from
+    number to product. Product ids are positions in the products list, so posting intersections can be
+    verified in the original list order.
+    """
+
+    def __init__(self, products: Any):
+        self.names_lower: List[str] = []
+        self.trigrams: Dict[str, set] = {}
+        self.size_buckets: Dict[int, List[int]] = {}
+        self.numbers: Dict[str, int] = {}
+
+        names = _product_column(products, "name")
+        sizes = _product_column(products, "bottle_size")
+        numbers = _product_column(products, "number")
+        self.number_column: List[str] = [str(number or "") for number in numbers]
+        for pid, (name, size, number) in enumerate(zip(names, sizes, numbers)):
+            name = str(name or "").lower()
+            self.names_lower.append(name)
+            for i in range(len(name) - 2):
+                self.trigrams.setdefault(name[i : i + 3], set()).add(pid)
+
+            if size is not None:
+                self.size_buckets.setdefault(round(size * 100), []).append(pid)
+
+            number = str(number or "")
+            if number:
+                self.numbers.setdefault(number.lstrip("0") or "0", pid)
+
+    def id_with_number_ending(self, suffix: str) -> Optional[int]:
+        """First id whose product number ends with ``suffix``, or None."""
+        for pid, number in enumerate(self.number_column):
+            if number and number.endswith(suffix):
+                return pid
+        return None
+
+    def ids_with_size(self, size: float) -> set:
+        """Ids whose bottle size is within 0.01 l of ``size``."""
+        key = round(size * 100)
+        ids = set()
+        for bucket in (key - 1, key, key + 1):
+            ids.update(self.size_buckets.get(bucket, ()))
+        return ids
+
+    def ids_with_substring(self, word: str) -> Optional[set]:
+        """
+        Candidate ids whose name may contain ``word``; None if the word is too
+        short for the trigram index (callers then verify every candidate).
+        """
+        if len(word) < 3:
+            return None
+        postings = [
+            self.trigrams.get(word[i : i + 3], set()) for i in range(len(word) - 2)
+        ]
+        postings.sort(key=len)
+        result = set(postings[0])
+        for p in postings[1:]:
+            result &= p
+            if not result:
+                break
+        return result
+
+
+class _ProductRankings:
+    """
+    Value, price and strength rankings, built once per cache load.
+
+    Each ranking is a precomputed ordering of the product ids that have the
+    metric, so a faceted top-k query is a boolean facet mask gathered along
+    that ordering and cut at ``limit`` - no per-query sort or dict copies.
+    Types and countries are interned to small integer codes for the masks.
+    """
+
+    # metric -> (description, best first is highest)
+    METRICS = {
+        "value": ("alcohol grams per euro", True),
+        "price": ("price", False),
+        "litre": ("price per litre", False),
+        "abv": ("alcohol percent", True),
+    }
+
+    def __init__(self, products: Any):
+        def column(field: str) -> np.ndarray:
+            values = _product_column(products, field)
+            return np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+
+        self.price = column("price")
+        self.size = column("bottle_size")
+        self.abv = column("alcohol_percent")
+        grams = column("alcohol_grams")
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            has_price = self.price > 0
+            value = grams / self.price
+            litre = self.price / self.size
+            self.metrics = {
+                "value": np.where(has_price & (grams > 0), value, np.nan),
+                "price": np.where(has_price, self.price, np.nan),
+                "litre": np.where(has_price & (self.size > 0), litre, np.nan),
+                "abv": np.where(self.abv > 0, self.abv, np.nan),
+            }
+
+        self.orders = {}
+        for metric, values in self.metrics.items():
+            ids = np.flatnonzero(~np.isnan(values))
+            key = -values[ids] if self.METRICS[metric][1] else values[ids]
+            # Stable, so ties keep the price list order
+            self.orders[metric] = ids[np.argsort(key, kind="stable")]
+
+        self.type_names, self.type_codes = self._intern(
+            _product_column(products, "type")
+        )
+        self.country_names, self.country_codes = self._intern(
+            _product_column(products, "country")
+        )
+
+    @staticmethod
+    def _intern(values: List[Optional[str]]) -> Tuple[List[str], np.ndarray]:
+        """Lower-cased distinct values and a per-product code (-1 = missing)."""
+        names: List[str] = []
+        lookup: Dict[str, int] = {}
+        codes = np.full(len(values), -1, dtype=np.int32)
+        for i, value in enumerate(values):
+            if not value:
+                continue
+            key = value.lower()
+            code = lookup.get(key)
+            if code is None:
+                code = lookup[key] = len(names)
+                names.append(key)
+            codes[i] = code
+        return names, codes
+
+    @staticmethod
+    def _match_codes(names: List[str], wanted: str) -> List[int]:
+        """Codes whose name contains ``wanted`` (plural endings are optional)."""
+        wanted = wanted.lower().strip()
+        stems = {wanted}
+        for ending in ("it", "et", "t", "s"):
+            if wanted.endswith(ending) and len(wanted) - len(ending) >= 3:
+                stems.add(wanted[: -len(ending)])
+        return [
+            code
+            for code, name in enumerate(names)
+            if any(stem in name for stem in stems)
+        ]
+
+    def top(
+        self,
+        metric: str,
+        limit: int,
+        product_type: Optional[str] = None,
+        country: Optional[str] = None,
+        min_size: Optional[float] = None,
+        max_size: Optional[float] = None,
+        min_abv: Optional[float] = None,
+        max_abv: Optional[float] = None,
+    ) -> List[Tuple[int, float]]:
+        """Best ``limit`` (product id, metric value) pairs matching the facets."""
+        order = self.orders[metric]
+        mask = np.ones(len(self.price), dtype=bool)
+        if product_type:
+            codes = self._match_codes(self.type_names, product_type)
+            mask &= np.isin(self.type_codes, codes)
+        if country:
+            codes = self._match_codes(self.country_names, country)
+            mask &= np.isin(self.country_codes, codes)
+        # NaN comparisons are False, so products lacking the field drop out
+        if min_size is not None:
+            mask &= self.size >= min_size - 0.005
+        if max_size is not None:
+            mask &= self.size <= max_size + 0.005
+        if min_abv is not None:
+            mask &= self.abv >= min_abv
+        if max_abv is not None:
+            mask &= self.abv <= max_abv
+
+        ids = order[mask[order]][:limit]
+        values = self.metrics[metric][ids]
+        return [(int(i), float(v)) for i, v in zip(ids, values)]
+
+
 class AlkoService:
     """Service for fetching Alko product information from Excel price list."""
 
@@ -34,7 +406,11 @@ class AlkoService:
             "alkon-hinnasto-tekstitiedostona.xlsx"
         )
         self.local_excel_path = self.data_dir / "alkon-hinnasto-tekstitiedostona.xlsx"
-        self.cache_file = self.data_dir / "alko_cache.json"
+        self.cache_file = self.data_dir / "alko_cache.bin"
+        # Pre-columnar cache, migrated on first load
+        self.legacy_cache_file = self.data_dir / "alko_cache.json"
+        self._product_index: Optional[_ProductIndex] = None
+        self._product_rankings: Optional[_ProductRankings] = None
         self.products_cache: Optional[List[Dict[str, Any]]] = None
         self.cache_last_updated: Optional[str] = None
         self.last_update_check = None
@@ -99,37 +475,69 @@ class AlkoService:
                         "Use !alko update to refresh."
                     )
 
+    @property
+    def products_cache(self) -> Optional[Any]:
+        """
+        Loaded products: a columnar _ProductStore once persisted, or a plain
+        list of dicts fresh from parsing. Assigning invalidates the index and
+        rankings.
+        """
+        return self._products_cache
+
+    @products_cache.setter
+    def products_cache(self, products: Optional[Any]) -> None:
+        self._products_cache = products
+        self._product_index = None
+        self._product_rankings = None
+
+    def _get_index(self) -> _ProductIndex:
+        """Return the search index for the current products, building it once."""
+        if self._product_index is None:
+            self._product_index = _ProductIndex(self.products_cache or [])
+        return self._product_index
+
+    def _get_rankings(self) -> _ProductRankings:
+        """Return the value/price rankings for the current products."""
+        if self._product_rankings is None:
+            self._product_rankings = _ProductRankings(self.products_cache or [])
+        return self._product_rankings
+
     def _load_cache(self):
         """Load cached product data if available."""
         try:
             if self.cache_file.exists():
-                import json
-
-                with open(self.cache_file, "r", encoding="utf-8") as f:
+                store, last_updated = _ProductStore.load(self.cache_file)
+                self.products_cache = store
+                self.cache_last_updated = last_updated
+                logger.info(f"Loaded {len(store)} products from cache")
+            elif self.legacy_cache_file.exists():
+                with open(self.legacy_cache_file, "r", encoding="utf-8") as f:
                     cache_data = json.load(f)
-                    self.products_cache = cache_data.get("products", [])
-                    self.cache_last_updated = cache_data.get("last_updated")
-                    logger.info(
-                        f"Loaded {len(self.products_cache)} products from cache"
-                    )
+                self.products_cache = _ProductStore.from_products(
+                    cache_data.get("products", [])
+                )
+                self.cache_last_updated = cache_data.get("last_updated")
+                # Keep the original timestamp so the Excel freshness check still holds
+                self.products_cache.save(self.cache_file, self.cache_last_updated)
+                logger.info(
+                    f"Migrated {len(self.products_cache)} products from {self.legacy_cache_file.name} to columnar cache"
+                )
         except Exception as e:
             logger.warning(f"Failed to load cache: {e}")
             self.products_cache = None
             self.cache_last_updated = None
 
     def _save_cache(self):
-        """Save product data to cache."""
+        """Save product data to the columnar cache."""
         try:
-            import json
-
+            store = self.products_cache
+            if not isinstance(store, _ProductStore):
+                store = _ProductStore.from_products(store or [])
             self.cache_last_updated = datetime.now().isoformat()
-            cache_data = {
-                "products": self.products_cache,
-                "last_updated": self.cache_last_updated,
-            }
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved {len(self.products_cache)} products to cache")
+            store.save(self.cache_file, self.cache_last_updated)
+            # Drop the per-product dicts in favour of the compact columns
+            self.products_cache = store
+            logger.info(f"Saved {len(store)} products to cache")
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
 
@@ -297,91 +705,48 @@ class AlkoService:
 
             logger.info("Parsing Excel file...")
 
-            # Read Excel file without assuming header row
+            # Stream the first sheet once in read-only mode
             try:
-                # First, check what sheets are available
-                xl = pd.ExcelFile(self.local_excel_path, engine="openpyxl")
-                sheet_name = xl.sheet_names[0]  # Use first sheet
-
-                # Read the entire sheet without headers first to find the actual header row
-                df_raw = pd.read_excel(
-                    self.local_excel_path,
-                    sheet_name=sheet_name,
-                    header=None,
-                    engine="openpyxl",
-                )
-
-                logger.info(f"Read {len(df_raw)} rows from Excel sheet '{sheet_name}'")
-
-                # Find the header row by looking for rows that contain expected column names
-                header_row_idx = self._find_header_row(df_raw)
-                if header_row_idx is None:
-                    logger.error("Could not find header row in Excel file")
-                    return None
-
-                logger.info(f"Found header row at index {header_row_idx}")
+                from openpyxl import load_workbook
 
-                # Read the sheet again with the correct header row
-                df = pd.read_excel(
-                    self.local_excel_path,
-                    sheet_name=sheet_name,
-                    header=header_row_idx,
-                    engine="openpyxl",
+                workbook = load_workbook(
+                    self.local_excel_path, read_only=True, data_only=True
                 )
-
-                logger.info(f"Columns: {list(df.columns)}")
-
             except Exception as e:
                 logger.error(f"Failed to read Excel file: {e}")
                 return None
 
             products = []
+            try:
+                sheet = workbook.worksheets[0]
+                rows = sheet.iter_rows(values_only=True)
 
-            # Process each row
-            for idx, row in df.iterrows():
-                try:
-                    product = self._parse_product_row(row)
-                    if product:
-                        products.append(product)
-                        if (
-                            idx == 8453
-                        ):  # Debug for original row 8457 (df index 8453 = original 8457 - 4)
-                            logger.info(
-                                f"Row {idx + 1} (original 8457) parsed successfully"
-                            )
-                            logger.info(f"Parsed product: {product}")
-                    elif (
-                        idx == 8453
-                    ):  # Debug for original row 8457 (df index 8453 = original 8457 - 4)
-                        logger.info(
-                            f"Row {idx + 1} (original 8457) parsed but no product returned"
-                        )
-                        logger.info(f"Row data: {row.to_dict()}")
-                    elif (
-                        idx == 8474
-                    ):  # Debug for original row 8478 (df index 8474 = original 8478 - 4)
+                # Only the leading rows are buffered while looking for the header
+                head = list(islice(rows, 20))
+                header_row_idx = self._find_header_row(head)
+                if header_row_idx is None:
+                    logger.error("Could not find header row in Excel file")
+                    return None
+
+                logger.info(f"Found header row at index {header_row_idx}")
+                headers = [
+                    str(value).strip() if _has_value(value) else ""
+                    for value in head[header_row_idx]
+                ]
+                logger.info(f"Columns: {headers}")
+
+                for idx, values in enumerate(
+                    chain(head[header_row_idx + 1 :], rows), start=1
+                ):
+                    try:
+                        product = self._parse_product_row(dict(zip(headers, values)))
                         if product:
-                            logger.info(
-                                f"Row {idx + 1} (original 8478) parsed successfully"
-                            )
-                            logger.info(f"Parsed product: {product}")
-                        else:
-                            logger.info(
-                                f"Row {idx + 1} (original 8478) parsed but no product returned"
-                            )
-                            logger.info(f"Row data: {row.to_dict()}")
-                    elif (
-                        not product and idx == 8477
-                    ):  # Debug for original row 8481 (df index 8477 = original 8481 - 4)
-                        logger.info(
-                            f"Row {idx + 1} (original 8481) parsed but no product returned"
-                        )
-                        logger.info(f"Row data: {row.to_dict()}")
-                except Exception as e:
-                    logger.warning(f"Failed to parse row {idx + 1}: {e}")
-                    if idx == 8456:
-                        logger.info(f"Row {idx + 1} data: {row.to_dict()}")
-                    continue
+                            products.append(product)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse row {idx}: {e}")
+                        continue
+            finally:
+                workbook.close()
 
             logger.info(f"Parsed {len(products)} products from Excel file")
             return products
@@ -424,22 +789,24 @@ class AlkoService:
                 "Alkoholi-%",
             ]
             price_cols = ["Hinta", "Price"]
+            type_cols = ["Tyyppi", "Type"]
+            country_cols = ["Valmistusmaa", "Maa", "Country"]
 
             # Extract name
             for col in name_cols:
-                if col in row.index and pd.notna(row[col]):
+                if col in row and _has_value(row[col]):
                     product["name"] = str(row[col]).strip()
                     break
 
             # Extract number
             for col in number_cols:
-                if col in row.index and pd.notna(row[col]):
+                if col in row and _has_value(row[col]):
                     product["number"] = str(row[col]).strip()
                     break
 
             # Extract bottle size (in liters or cl)
             for col in size_cols:
-                if col in row.index and pd.notna(row[col]):
+                if col in row and _has_value(row[col]):
                     size_str = str(row[col]).strip()
                     product["bottle_size"] = self._parse_bottle_size(size_str)
                     product["bottle_size_raw"] = size_str
@@ -447,16 +814,28 @@ class AlkoService:
 
             # Extract alcohol percentage
             for col in alcohol_cols:
-                if col in row.index and pd.notna(row[col]):
+                if col in row and _has_value(row[col]):
                     alcohol_str = str(row[col]).strip()
                     product["alcohol_percent"] = self._parse_alcohol_percent(
                         alcohol_str
                     )
                     break
 
+            # Extract product type
+            for col in type_cols:
+                if col in row and _has_value(row[col]):
+                    product["type"] = str(row[col]).strip()
+                    break
+
+            # Extract country of origin
+            for col in country_cols:
+                if col in row and _has_value(row[col]):
+                    product["country"] = str(row[col]).strip()
+                    break
+
             # Extract price
             for col in price_cols:
-                if col in row.index and pd.notna(row[col]):
+                if col in row and _has_value(row[col]):
                     price_value = row[col]
                     if isinstance(price_value, (int, float)):
                         product["price"] = float(price_value)
@@ -492,12 +871,12 @@ class AlkoService:
 
         return None
 
-    def _find_header_row(self, df: pd.DataFrame) -> Optional[int]:
+    def _find_header_row(self, rows: List[tuple]) -> Optional[int]:
         """
         Find the header row in the Excel file by looking for rows that contain expected column names.
 
         Args:
-            df: Raw DataFrame without headers
+            rows: Leading raw sheet rows as value tuples
 
         Returns:
             Index of the header row, or None if not found
@@ -519,9 +898,8 @@ class AlkoService:
         ]
 
         # Check first 20 rows for header-like content
-        for idx in range(min(20, len(df))):
-            row = df.iloc[idx]
-            row_values = [str(val).strip() for val in row.values if pd.notna(val)]
+        for idx in range(min(20, len(rows))):
+            row_values = [str(val).strip() for val in rows[idx] if _has_value(val)]
 
             # Count how many expected headers are in this row
             matches = 0
@@ -538,10 +916,9 @@ class AlkoService:
 
         # Fallback: look for rows that don't contain numbers or dates in first column
         # Headers typically don't have numbers
-        import re
-
-        for idx in range(min(10, len(df))):
-            first_cell = str(df.iloc[idx, 0]).strip()
+        for idx in range(min(10, len(rows))):
+            row = rows[idx]
+            first_cell = str(row[0]).strip() if row and _has_value(row[0]) else ""
             # If first cell looks like a header (no numbers, not a date)
             if (
                 first_cell
@@ -708,31 +1085,46 @@ class AlkoService:
             # Split name query into words for matching
             query_words = name_query.split() if name_query else []
 
+            index = self._get_index()
+            candidates: Optional[set] = None
+            if bottle_size_filter is not None:
+                candidates = index.ids_with_size(bottle_size_filter)
+            # Intersect the most selective posting lists first
+            for word in sorted(query_words, key=len, reverse=True):
+                if candidates is not None and not candidates:
+                    break
+                postings = index.ids_with_substring(word)
+                if postings is None:
+                    continue
+                candidates = postings if candidates is None else candidates & postings
+
+            if candidates is None:
+                candidate_ids = range(len(self.products_cache))
+            else:
+                candidate_ids = sorted(candidates)
+
+            names = index.names_lower
             matches = []
 
-            for product in self.products_cache:
-                name = product.get("name", "").lower()
+            for pid in candidate_ids:
+                name = names[pid]
 
-                # Check name match
-                name_matches = not query_words or all(
-                    word in name for word in query_words
-                )
+                # Trigram hits are candidates only; confirm the substrings
+                if not all(word in name for word in query_words):
+                    continue
 
-                # Check bottle size match if filter is specified
-                size_matches = True
+                # Re-check the size tolerance (buckets are 1 cl wide)
                 if bottle_size_filter is not None:
-                    product_size = product.get("bottle_size")
-                    if product_size is not None:
-                        # Allow small tolerance for floating point comparison (0.01 liters)
-                        size_matches = abs(product_size - bottle_size_filter) < 0.01
-                    else:
-                        size_matches = False
-
-                # Product matches if both name and size criteria are met
-                if name_matches and size_matches:
-                    matches.append(product)
-                    if len(matches) >= limit:
-                        break
+                    product_size = self.products_cache[pid].get("bottle_size")
+                    if (
+                        product_size is None
+                        or abs(product_size - bottle_size_filter) >= 0.01
+                    ):
+                        continue
+
+                matches.append(self.products_cache[pid])
+                if len(matches) >= limit:
+                    break
 
             return matches
 
@@ -790,32 +1182,25 @@ class AlkoService:
             # Normalize the search number by removing leading zeros
             normalized_search = product_number.lstrip("0") or "0"
 
-            # Search for exact product number match (ignoring leading zeros)
-            for product in self.products_cache:
-                stored_number = product.get("number", "")
-                if stored_number:
-                    # Normalize stored number by removing leading zeros
-                    normalized_stored = stored_number.lstrip("0") or "0"
-                    if normalized_stored == normalized_search:
-                        return product
+            # Exact product number match (ignoring leading zeros)
+            pid = self._get_index().numbers.get(normalized_search)
+            if pid is not None:
+                return self.products_cache[pid]
 
             # If no exact match found, try to find products that end with the search number
             # This handles cases where users search for partial product numbers (e.g., "83" for "5183")
             if (
                 len(normalized_search) <= 4
             ):  # Only do partial matching for short search strings
-                matches = []
-                for product in self.products_cache:
-                    stored_number = product.get("number", "")
-                    if stored_number and stored_number.endswith(normalized_search):
-                        matches.append(product)
-
-                if matches:
+                # Scan the number column; only the matching product is decoded
+                pid = self._get_index().id_with_number_ending(normalized_search)
+                if pid is not None:
                     # Return the first match (could be enhanced with better ranking in the future)
+                    product = self.products_cache[pid]
                     logger.info(
-                        f"Found partial match for product number {product_number}: {matches[0]['number']}"
+                        f"Found partial match for product number {product_number}: {product['number']}"
                     )
-                    return matches[0]
+                    return product
 
             logger.info(f"Product number {product_number} not found")
             return None
@@ -893,44 +1278,69 @@ class AlkoService:
             "cache_file": str(self.cache_file),
         }
 
-    def find_cheapest_by_value(self, limit: int = 5) -> List[Dict[str, Any]]:
+    def query_products(
+        self,
+        metric: str = "value",
+        limit: int = 5,
+        product_type: Optional[str] = None,
+        country: Optional[str] = None,
+        min_size: Optional[float] = None,
+        max_size: Optional[float] = None,
+        min_abv: Optional[float] = None,
+        max_abv: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
         """
-        Find the cheapest drinks by value (alcohol content per euro).
+        Rank products by a precomputed metric, filtered by facets.
 
         Args:
+            metric: "value" (alcohol grams per euro), "price", "litre"
+                (price per litre) or "abv"
             limit: Maximum number of results to return
+            product_type: Substring of the Alko product type, e.g. "siideri"
+            country: Substring of the country of origin
+            min_size, max_size: Bottle size range in litres
+            min_abv, max_abv: Alcohol percent range
 
         Returns:
-            List of products sorted by best value (highest alcohol grams per euro)
+            Best-first product dicts with "value_ratio" and "price_per_litre"
+            added where available
         """
-        if not self.products_cache:
+        if not self.products_cache or metric not in _ProductRankings.METRICS:
             return []
 
-        # Filter out non-alcoholic products (alcohol_grams = 0) and products without price
-        alcoholic_products = [
-            product
-            for product in self.products_cache
-            if product.get("alcohol_grams", 0) > 0
-            and product.get("price") is not None
-            and product.get("price") > 0
-        ]
-
-        # Calculate value ratio (alcohol grams per euro) for each product
-        products_with_value = []
-        for product in alcoholic_products:
-            alcohol_grams = product.get("alcohol_grams", 0)
-            price = product.get("price", 0)
+        rankings = self._get_rankings()
+        results = []
+        for pid, _ in rankings.top(
+            metric,
+            limit,
+            product_type=product_type,
+            country=country,
+            min_size=min_size,
+            max_size=max_size,
+            min_abv=min_abv,
+            max_abv=max_abv,
+        ):
+            product = dict(self.products_cache[pid])
+            value_ratio = rankings.metrics["value"][pid]
+            if not np.isnan(value_ratio):
+                product["value_ratio"] = float(value_ratio)
+            price_per_litre = rankings.metrics["litre"][pid]
+            if not np.isnan(price_per_litre):
+                product["price_per_litre"] = float(price_per_litre)
+            results.append(product)
+        return results
 
-            if price > 0:
-                value_ratio = alcohol_grams / price
-                products_with_value.append({**product, "value_ratio": value_ratio})
+    def find_cheapest_by_value(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Find the cheapest drinks by value (alcohol content per euro).
 
-        # Sort by value ratio (highest first) and return top N
-        sorted_products = sorted(
-            products_with_value, key=lambda x: x["value_ratio"], reverse=True
-        )
+        Args:
+            limit: Maximum number of results to return
 
-        return sorted_products[:limit]
+        Returns:
+            List of products sorted by best value (highest alcohol grams per euro)
+        """
+        return self.query_products("value", limit)
 
 
 def create_alko_service() -> AlkoService:
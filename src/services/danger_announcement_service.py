@@ -26,6 +26,9 @@ class DangerAnnouncementService:
 
     URL = "https://112.fi/etusivu"
     DEFAULT_CHECK_INTERVAL = 5 * 60
+    JOB_NAME = "danger_announcement"
+    POLL_JITTER = 15.0  # seconds of random delay added to each scheduled poll
+    POLL_TIMEOUT = 120.0
 
     def __init__(
         self,
@@ -64,15 +67,35 @@ class DangerAnnouncementService:
                 logger.warning("Danger announcement monitor did not stop cleanly")
         logger.info("Danger announcement service stopped.")
 
+    def schedule(self, scheduler) -> None:
+        """Poll from a shared Scheduler instead of a dedicated thread."""
+        self.running = True
+        scheduler.add_job(
+            self.JOB_NAME,
+            self.poll,
+            interval=self.check_interval,
+            jitter=self.POLL_JITTER,
+            timeout=self.POLL_TIMEOUT,
+        )
+
+    def unschedule(self, scheduler) -> None:
+        """Remove the polling job added by schedule()."""
+        self.running = False
+        scheduler.remove_job(self.JOB_NAME)
+
+    def poll(self) -> None:
+        """Check once and pass any new announcements to the callback."""
+        try:
+            announcements = self.check_new_announcements()
+            if announcements:
+                self.callback(announcements)
+        except Exception as e:
+            logger.error(f"Error checking danger announcements: {e}")
+
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         while self.running:
-            try:
-                announcements = self.check_new_announcements()
-                if announcements:
-                    self.callback(announcements)
-            except Exception as e:
-                logger.error(f"Error checking danger announcements: {e}")
+            self.poll()
 
             remaining_sleep = self.check_interval
             while remaining_sleep > 0 and self.running:
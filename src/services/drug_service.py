@@ -4,16 +4,153 @@ Drug Service Module
 Provides drug information and interaction checking from TripSit data.
 """
 
-import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 
 sys.path.insert(0, "src")
 from logger import get_logger  # noqa: E402
+from packed_json import indexed_items, load_json_mapping, packed_path  # noqa: E402
 
 logger = get_logger("DrugService")
 
+# TripSit interaction statuses, most severe first
+INTERACTION_STATUSES = {
+    "Dangerous": {
+        "emoji": "☠️",
+        "definition": "These combinations are considered extremely harmful and should always be avoided. Reactions to these drugs taken in combination are highly unpredictable and have a potential to cause death.",
+    },
+    "Unsafe": {
+        "emoji": "🛑",
+        "definition": "There is considerable risk of physical harm when taking these combinations, they should be avoided where possible.",
+    },
+    "Caution": {
+        "emoji": "⚠️",
+        "definition": "These combinations are not usually physically harmful, but may produce undesirable effects, such as physical discomfort or overstimulation. Extreme use may cause physical health issues. Synergistic effects may be unpredictable. Care should be taken when choosing to use this combination.",
+    },
+    "Low Risk & Decrease": {
+        "emoji": "↘",
+        "definition": "Effects are subtractive. The combination is unlikely to cause any adverse or undesirable reaction beyond those that might ordinarily be expected from these drugs.",
+    },
+    "Low Risk & No Synergy": {
+        "emoji": "➡",
+        "definition": "Effects are additive. The combination is unlikely to cause any adverse or undesirable reaction beyond those that might ordinarily be expected from these drugs.",
+    },
+    "Low Risk & Synergy": {
+        "emoji": "↗",
+        "definition": "These drugs work together to cause an effect greater than the sum of its parts, and they aren't likely to cause an adverse or undesirable reaction when used carefully. Additional research should always be done before combining drugs.",
+    },
+    "Unknown": {"emoji": "❓", "definition": "Effects are unknown."},
+}
+
+
+def _status_rank(risk: str) -> int:
+    """Severity rank of a status string (0 = most severe, unknown last)."""
+    risk_lower = risk.lower()
+    for rank, status_name in enumerate(INTERACTION_STATUSES):
+        if status_name.lower() in risk_lower:
+            return rank
+    return len(INTERACTION_STATUSES)
+
+
+# Fields of a drugs.json record that _DrugIndex reads; packed drug files store
+# them as summaries so the index is built without decoding whole records.
+DRUG_INDEX_FIELDS = ("name", "aliases", "categories")
+
+
+class _DrugIndex:
+    """
+    Lookup structures over drugs.json, built once per load.
+
+    Holds lower-cased keys, names, aliases and categories, an alias -> drug
+    key map, and trigram postings over all of those strings. Drug ids are
+    positions in the data dict, so candidates can be verified in the same
+    order a plain scan would visit them.
+    """
+
+    def __init__(self, drugs_data: Mapping[str, Dict]):
+        self.keys: List[str] = []
+        self.keys_lower: List[str] = []
+        self.names_lower: List[str] = []
+        self.aliases_lower: List[Tuple[str, ...]] = []
+        self.categories_lower: List[Tuple[str, ...]] = []
+        self.alias_to_key: Dict[str, str] = {}
+        self.trigrams: Dict[str, set] = {}
+
+        items = indexed_items(drugs_data, DRUG_INDEX_FIELDS)
+        for drug_id, (key, info) in enumerate(items):
+            name = (info.get("name", "") or "").lower()
+            aliases = tuple(alias.lower() for alias in info.get("aliases", []))
+            categories = tuple(cat.lower() for cat in info.get("categories", []))
+            self.keys.append(key)
+            self.keys_lower.append(key.lower())
+            self.names_lower.append(name)
+            self.aliases_lower.append(aliases)
+            self.categories_lower.append(categories)
+
+            for alias in aliases:
+                # First drug wins, like the original in-order alias scan
+                self.alias_to_key.setdefault(alias, key)
+
+            for text in {key.lower(), name, *aliases, *categories}:
+                for i in range(len(text) - 2):
+                    self.trigrams.setdefault(text[i : i + 3], set()).add(drug_id)
+
+    def candidates(self, query: str) -> List[int]:
+        """
+        Ids whose indexed strings may contain ``query``, in data order.
+        Queries shorter than a trigram return every id.
+        """
+        if len(query) < 3:
+            return list(range(len(self.keys)))
+        postings = [
+            self.trigrams.get(query[i : i + 3], set()) for i in range(len(query) - 2)
+        ]
+        postings.sort(key=len)
+        result = set(postings[0])
+        for p in postings[1:]:
+            result &= p
+            if not result:
+                break
+        return sorted(result)
+
+
+class _InteractionIndex:
+    """
+    interactions.json as drug ids plus a symmetric (id_a, id_b) -> status map,
+    built in one pass when the dataset loads.
+
+    Names that only appear as targets get ids too. The source entries are
+    directed; where both directions are given, the pair keeps the status of
+    its own direction, so status(a, b) still prefers a's entry for b.
+    """
+
+    def __init__(self, interactions_data: Mapping[str, Dict]):
+        self.ids: Dict[str, int] = {}
+        self.pairs: Dict[Tuple[int, int], str] = {}
+        for name, targets in interactions_data.items():
+            a = self.ids.setdefault(name.lower(), len(self.ids))
+            if not isinstance(targets, dict):
+                continue
+            for other, record in targets.items():
+                b = self.ids.setdefault(other.lower(), len(self.ids))
+                status = record.get("status") if isinstance(record, dict) else None
+                if status:
+                    self.pairs.setdefault((a, b), status)
+        for (a, b), status in list(self.pairs.items()):
+            self.pairs.setdefault((b, a), status)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def status(self, a: str, b: str) -> Optional[str]:
+        """Status for a pair of lower-cased drug names."""
+        id_a = self.ids.get(a)
+        id_b = self.ids.get(b)
+        if id_a is None or id_b is None:
+            return None
+        return self.pairs.get((id_a, id_b))
+
 
 class DrugService:
     """Service for drug information and interaction checking."""
@@ -28,19 +165,52 @@ class DrugService:
         self.data_dir = Path(data_dir)
         self.drugs_file = self.data_dir / "drugs.json"
         self.interactions_file = self.data_dir / "interactions.json"
-        self.drugs_data: Dict[str, Dict] = {}
-        self.interactions_data: Dict[str, Dict] = {}
+        self._drug_index: Optional[_DrugIndex] = None
+        self._interaction_index: Optional[_InteractionIndex] = None
+        self.drugs_data: Mapping[str, Dict] = {}
+        self.interactions_data: Mapping[str, Dict] = {}
 
         # Load drug data
         self._load_drugs_data()
         self._load_interactions_data()
 
+    @property
+    def drugs_data(self) -> Mapping[str, Dict]:
+        """Drug data keyed by name; assigning a new dict invalidates the index."""
+        return self._drugs_data
+
+    @drugs_data.setter
+    def drugs_data(self, data: Mapping[str, Dict]) -> None:
+        self._drugs_data = data
+        self._drug_index = None
+
+    @property
+    def interactions_data(self) -> Mapping[str, Dict]:
+        """Pairwise interaction data; assigning invalidates the pair index."""
+        return self._interactions_data
+
+    @interactions_data.setter
+    def interactions_data(self, data: Mapping[str, Dict]) -> None:
+        self._interactions_data = data
+        self._interaction_index = None
+
+    def _get_interaction_index(self) -> _InteractionIndex:
+        """Return the interaction pair index, building it once."""
+        if self._interaction_index is None:
+            self._interaction_index = _InteractionIndex(self.interactions_data)
+        return self._interaction_index
+
+    def _get_index(self) -> _DrugIndex:
+        """Return the lookup index for the current drug data, building it once."""
+        if self._drug_index is None:
+            self._drug_index = _DrugIndex(self.drugs_data)
+        return self._drug_index
+
     def _load_drugs_data(self):
-        """Load drug data from JSON file."""
+        """Load drug data from JSON file (or its packed, memory-mapped form)."""
         try:
-            if self.drugs_file.exists():
-                with open(self.drugs_file, "r", encoding="utf-8") as f:
-                    self.drugs_data = json.load(f)
+            if self.drugs_file.exists() or packed_path(self.drugs_file).exists():
+                self.drugs_data = load_json_mapping(self.drugs_file)
                 logger.info(
                     f"Loaded {len(self.drugs_data)} drugs from {self.drugs_file}"
                 )
@@ -52,11 +222,14 @@ class DrugService:
             self.drugs_data = {}
 
     def _load_interactions_data(self):
-        """Load interactions data from JSON file."""
+        """Load interactions data from JSON file (or its packed form)."""
         try:
-            if self.interactions_file.exists():
-                with open(self.interactions_file, "r", encoding="utf-8") as f:
-                    self.interactions_data = json.load(f)
+            if (
+                self.interactions_file.exists()
+                or packed_path(self.interactions_file).exists()
+            ):
+                self.interactions_data = load_json_mapping(self.interactions_file)
+                self._get_interaction_index()
                 logger.info(
                     f"Loaded {len(self.interactions_data)} interaction entries from {self.interactions_file}"
                 )
@@ -87,19 +260,20 @@ class DrugService:
         if drug_name_lower in self.drugs_data:
             return self.drugs_data[drug_name_lower]
 
+        index = self._get_index()
+
         # Check aliases
-        for drug_key, drug_info in self.drugs_data.items():
-            aliases = drug_info.get("aliases", [])
-            if any(alias.lower() == drug_name_lower for alias in aliases):
-                return drug_info
+        alias_key = index.alias_to_key.get(drug_name_lower)
+        if alias_key is not None:
+            return self.drugs_data[alias_key]
 
         # Fuzzy match on name
-        for drug_key, drug_info in self.drugs_data.items():
-            if drug_name_lower in drug_key.lower():
-                return drug_info
-            name = drug_info.get("name", "")
-            if name and drug_name_lower in name.lower():
-                return drug_info
+        for drug_id in index.candidates(drug_name_lower):
+            if (
+                drug_name_lower in index.keys_lower[drug_id]
+                or drug_name_lower in index.names_lower[drug_id]
+            ):
+                return self.drugs_data[index.keys[drug_id]]
 
         return None
 
@@ -115,28 +289,21 @@ class DrugService:
             List of matching drug info dictionaries
         """
         query_lower = query.lower()
+        index = self._get_index()
         matches = []
 
-        for drug_key, drug_info in self.drugs_data.items():
-            # Check primary name
-            name = drug_info.get("name", "")
-            if query_lower in name.lower():
-                matches.append(drug_info)
-                continue
+        for drug_id in index.candidates(query_lower):
+            if len(matches) >= limit:
+                break
+            # Check primary name, aliases and categories
+            if (
+                query_lower in index.names_lower[drug_id]
+                or any(query_lower in alias for alias in index.aliases_lower[drug_id])
+                or any(query_lower in cat for cat in index.categories_lower[drug_id])
+            ):
+                matches.append(self.drugs_data[index.keys[drug_id]])
 
-            # Check aliases
-            aliases = drug_info.get("aliases", [])
-            if any(query_lower in alias.lower() for alias in aliases):
-                matches.append(drug_info)
-                continue
-
-            # Check categories
-            categories = drug_info.get("categories", [])
-            if any(query_lower in cat.lower() for cat in categories):
-                matches.append(drug_info)
-                continue
-
-        return matches[:limit]
+        return matches
 
     def check_interactions(
         self, drug_names: List[str]
@@ -150,128 +317,52 @@ class DrugService:
         Returns:
             Dictionary with interaction results:
             {
-                'interactions': [(drug1, drug2, risk_level), ...],
+                'interactions': [(drug1, drug2, risk_level), ...] (most severe first),
                 'warnings': [warning_messages],
                 'unknown_drugs': [drug_names_not_found]
             }
         """
         result = {"interactions": [], "warnings": [], "unknown_drugs": []}
+        index = self._get_interaction_index()
 
-        # Validate and normalize drug names
+        # Validate and normalize drug names, resolving each to an interaction name
         valid_drugs = []
         for drug_name in drug_names:
             drug_info = self.get_drug_info(drug_name)
-            drug_name_lower = drug_name.lower()
+            interaction_name = drug_name.lower()
+            if interaction_name not in index and drug_info:
+                # Aliases such as "weed" map to the canonical entry
+                canonical = (drug_info.get("name", "") or "").lower()
+                if canonical in index:
+                    interaction_name = canonical
 
             # Accept drug if it exists in drugs.json OR interactions.json
-            if drug_info or drug_name_lower in self.interactions_data:
-                valid_drugs.append((drug_name, drug_info))
+            if drug_info or interaction_name in index:
+                valid_drugs.append((drug_name, drug_info or {}, interaction_name))
             else:
                 result["unknown_drugs"].append(drug_name)
 
-        # Check all pairs for interactions using interactions.json data first
-        for i, (name1, info1) in enumerate(valid_drugs):
-            for j, (name2, info2) in enumerate(valid_drugs):
-                if i >= j:  # Avoid duplicate checks
-                    continue
-
-                interaction_found = False
-
-                # Try to find interaction in interactions.json data
-                if self.interactions_data:
-                    # Check drug1 -> drug2 in interactions.json
-                    drug1_interactions = self.interactions_data.get(name1.lower(), {})
-                    interaction_data = drug1_interactions.get(name2.lower())
-                    if interaction_data and isinstance(interaction_data, dict):
-                        risk = interaction_data.get("status")
-                        if risk:
-                            result["interactions"].append((name1, name2, risk))
-                            interaction_found = True
-                            continue
-
-                    # Check drug2 -> drug1 in interactions.json
-                    drug2_interactions = self.interactions_data.get(name2.lower(), {})
-                    interaction_data = drug2_interactions.get(name1.lower())
-                    if interaction_data and isinstance(interaction_data, dict):
-                        risk = interaction_data.get("status")
-                        if risk:
-                            result["interactions"].append((name1, name2, risk))
-                            interaction_found = True
-                            continue
-
-                # If not found in interactions.json, fall back to individual drug interactions
-                if not interaction_found:
-                    interactions1 = info1.get("interactions", {})
-
-                    # Check drug1 -> drug2 interaction
-                    risk1 = interactions1.get(name2)
-                    if risk1:
-                        result["interactions"].append((name1, name2, risk1))
-                        continue
-
-                    # Check drug2 -> drug1 interaction
-                    interactions2 = info2.get("interactions", {})
-                    risk2 = interactions2.get(name1)
-                    if risk2:
-                        result["interactions"].append((name1, name2, risk2))
-                        continue
-
-                    # Check aliases
-                    aliases1 = info1.get("aliases", [])
-                    aliases2 = info2.get("aliases", [])
-
-                    # Check if drug2 name matches any alias of drug1
-                    for alias in aliases1:
-                        if interactions1.get(alias):
-                            result["interactions"].append(
-                                (name1, name2, interactions1[alias])
-                            )
-                            break
-
-                    # Check if drug1 name matches any alias of drug2
-                    for alias in aliases2:
-                        if interactions2.get(alias):
-                            result["interactions"].append(
-                                (name1, name2, interactions2[alias])
-                            )
-                            break
+        # Check all pairs, using interactions.json data first
+        for i, (name1, info1, key1) in enumerate(valid_drugs):
+            for name2, info2, key2 in valid_drugs[i + 1 :]:
+                risk = index.status(key1, key2)
 
-        # Generate warnings based on risk levels with emojis and definitions
-        INTERACTION_STATUSES = {
-            "Dangerous": {
-                "emoji": "☠️",
-                "definition": "These combinations are considered extremely harmful and should always be avoided. Reactions to these drugs taken in combination are highly unpredictable and have a potential to cause death.",
-            },
-            "Unsafe": {
-                "emoji": "🛑",
-                "definition": "There is considerable risk of physical harm when taking these combinations, they should be avoided where possible.",
-            },
-            "Caution": {
-                "emoji": "⚠️",
-                "definition": "These combinations are not usually physically harmful, but may produce undesirable effects, such as physical discomfort or overstimulation. Extreme use may cause physical health issues. Synergistic effects may be unpredictable. Care should be taken when choosing to use this combination.",
-            },
-            "Low Risk & Decrease": {
-                "emoji": "↘",
-                "definition": "Effects are subtractive. The combination is unlikely to cause any adverse or undesirable reaction beyond those that might ordinarily be expected from these drugs.",
-            },
-            "Low Risk & No Synergy": {
-                "emoji": "➡",
-                "definition": "Effects are additive. The combination is unlikely to cause any adverse or undesirable reaction beyond those that might ordinarily be expected from these drugs.",
-            },
-            "Low Risk & Synergy": {
-                "emoji": "↗",
-                "definition": "These drugs work together to cause an effect greater than the sum of its parts, and they aren't likely to cause an adverse or undesirable reaction when used carefully. Additional research should always be done before combining drugs.",
-            },
-            "Unknown": {"emoji": "❓", "definition": "Effects are unknown."},
-        }
+                # Fall back to per-drug interaction lists in drugs.json
+                if not risk:
+                    risk = self._listed_interaction(info1, name2, info2)
+                    risk = risk or self._listed_interaction(info2, name1, info1)
+
+                if risk:
+                    result["interactions"].append((name1, name2, risk))
+
+        # Most severe first; equal severities keep their pair order
+        result["interactions"].sort(key=lambda item: _status_rank(item[2]))
 
+        # Generate warnings based on risk levels with emojis and definitions
+        statuses = list(INTERACTION_STATUSES.values())
         for drug1, drug2, risk in result["interactions"]:
-            # Find matching status (case-insensitive)
-            status_info = None
-            for status_name, status_data in INTERACTION_STATUSES.items():
-                if status_name.lower() in risk.lower():
-                    status_info = status_data
-                    break
+            rank = _status_rank(risk)
+            status_info = statuses[rank] if rank < len(statuses) else None
 
             if status_info:
                 emoji = status_info["emoji"]
@@ -281,6 +372,20 @@ class DrugService:
 
         return result
 
+    @staticmethod
+    def _listed_interaction(
+        info: Dict, other_name: str, other_info: Dict
+    ) -> Optional[str]:
+        """Risk from ``info``'s own interaction list for the other drug."""
+        interactions = info.get("interactions") or {}
+        if not interactions:
+            return None
+        names = (other_name, other_info.get("name"), *other_info.get("aliases", []))
+        for name in names:
+            if name and interactions.get(name):
+                return interactions[name]
+        return None
+
     def format_drug_info(self, drug_info: Dict) -> str:
         """
         Format drug information for display.
@@ -6,8 +6,7 @@ Supports caching, fetching prices for specific hours, 15-minute intervals, and s
 
 from datetime import datetime, time, timedelta
 from decimal import ROUND_HALF_UP, Decimal
-from io import StringIO
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pytz
 import requests
@@ -19,6 +18,8 @@ from logger import log
 class ElectricityService:
     """Service for fetching Finnish electricity price information."""
 
+    _RESOLUTION_MINUTES = {"PT15M": 15, "PT60M": 60}
+
     def __init__(self, api_key: str, cache_ttl_hours: int = 3):
         self.api_key = api_key
         self.cache_ttl_hours = cache_ttl_hours
@@ -267,7 +268,11 @@ class ElectricityService:
             utc_start = local_start.astimezone(pytz.utc)
             period_start = utc_start.strftime("%Y%m%d%H%M")
 
-            local_end = local_start + timedelta(days=1)
+            # Localize the next midnight separately so 23h/25h DST days get
+            # the correct UTC end instead of a naive +24h.
+            local_end = self.timezone.localize(
+                datetime.combine(requested_date + timedelta(days=1), time(0, 0))
+            )
             utc_end = local_end.astimezone(pytz.utc)
             period_end = utc_end.strftime("%Y%m%d%H%M")
 
@@ -286,29 +291,24 @@ class ElectricityService:
                 "periodEnd": period_end,
             }
 
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-
-            tree = ElementTree.parse(StringIO(response.text))
-            ns = {"ns": tree.getroot().tag.split("}")[0].strip("{")}
-
-            interval_prices: Dict[tuple[int, int], float] = {}
-            # Track dates found in the response to validate they match requested date
-            dates_found = set()
+            response = requests.get(
+                self.base_url, params=params, timeout=30, stream=True
+            )
+            try:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                interval_prices, dates_found, error_texts, has_timeseries = (
+                    self._parse_price_document(
+                        response.raw, requested_date, utc_start, utc_end
+                    )
+                )
+            finally:
+                response.close()
 
-            # Check for error messages in the XML response
             # ENTSO-E API may return error information in the XML even with HTTP 200
-            error_elements = tree.findall(".//ns:Reason", ns)
-            timeseries = tree.findall(".//ns:TimeSeries", ns)
-
-            if error_elements and not timeseries:
+            if error_texts and not has_timeseries:
                 # API returned an error and no TimeSeries data
-                error_texts = [
-                    elem.findtext("ns:text", "", ns) for elem in error_elements
-                ]
-                error_msg = (
-                    " | ".join(error_texts) if error_texts else "Unknown API error"
-                )
+                error_msg = " | ".join(error_texts)
                 log(
                     f"API returned error for {date_key}: {error_msg}",
                     level="WARNING",
@@ -318,60 +318,6 @@ class ElectricityService:
                     "error": True,
                     "message": f"No price data available for {date_key}. {error_msg}",
                 }
-            for ts in timeseries:
-                period = ts.find("ns:Period", ns)
-                if period is None:
-                    continue
-                ti = period.find("ns:timeInterval", ns)
-                start_str = ti.find("ns:start", ns).text
-                res = period.find("ns:resolution", ns).text
-
-                if res == "PT15M":
-                    res_min = 15
-                elif res == "PT60M":
-                    res_min = 60
-                else:
-                    continue  # Unsupported
-
-                start_time = datetime.strptime(start_str, "%Y-%m-%dT%H:%MZ").replace(
-                    tzinfo=pytz.utc
-                )
-
-                for point in period.findall("ns:Point", ns):
-                    pos = int(point.find("ns:position", ns).text)
-                    price = float(point.find("ns:price.amount", ns).text)
-                    minutes_offset = (pos - 1) * res_min
-                    interval_utc = start_time + timedelta(minutes=minutes_offset)
-                    interval_local = interval_utc.astimezone(self.timezone)
-                    # Validate that this interval belongs to the requested date
-                    interval_date = interval_local.date()
-                    dates_found.add(interval_date)
-                    # Only include intervals for the requested date
-                    if interval_date != requested_date:
-                        # Log only once per mismatched date to avoid spam
-                        if interval_date not in self._logged_skip_dates:
-                            self._logged_skip_dates.add(interval_date)
-                            log(
-                                f"Skipping price data for {interval_date} (requested {requested_date})",
-                                level="DEBUG",
-                                context="ELECTRICITY",
-                            )
-                        continue
-                    hour = interval_local.hour
-                    minute = interval_local.minute
-                    quarter = (minute // 15) + 1
-                    interval_prices[(hour, quarter)] = price
-
-            # If resolution is 60M, duplicate price for all quarters in the hour
-            if res == "PT60M":
-                for (h, q), price in list(interval_prices.items()):
-                    if q == 1:  # Only set for quarter 1 in hourly
-                        for extra_q in [2, 3, 4]:
-                            interval_prices[(h, extra_q)] = price
-
-            # Debug print all interval_prices
-            # for (h, q), price in interval_prices.items():
-            #     log(f"Interval: hour={h}, quarter={q}, price={price}")
 
             # Validate that we got data for the requested date
             if dates_found and requested_date not in dates_found:
@@ -424,6 +370,145 @@ class ElectricityService:
 
     # ---------- Helpers ----------
 
+    def _iter_price_document(self, source: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream an ENTSO-E publication document with iterparse.
+
+        Yields ("reason", text), ("timeseries", None) and
+        ("point", (period_start_utc, resolution_minutes, position, price))
+        events. Consumed elements are cleared immediately, so memory use stays
+        flat no matter how many periods the document covers.
+        """
+        root = None
+        in_period = False
+        period_start: Optional[datetime] = None
+        res_min: Optional[int] = None
+        position: Optional[int] = None
+        price: Optional[float] = None
+        reason_text = ""
+
+        for event, elem in ElementTree.iterparse(source, events=("start", "end")):
+            tag = elem.tag.rsplit("}", 1)[-1]
+            if event == "start":
+                if root is None:
+                    root = elem
+                elif tag == "Period":
+                    in_period = True
+                    period_start = None
+                    res_min = None
+                continue
+
+            if tag == "Point":
+                if (
+                    period_start is not None
+                    and res_min is not None
+                    and position is not None
+                    and price is not None
+                ):
+                    yield "point", (period_start, res_min, position, price)
+                position = None
+                price = None
+                elem.clear()
+            elif tag == "position":
+                position = int(elem.text)
+            elif tag == "price.amount":
+                price = float(elem.text)
+            elif tag == "start" and in_period:
+                period_start = datetime.strptime(
+                    elem.text.strip(), "%Y-%m-%dT%H:%MZ"
+                ).replace(tzinfo=pytz.utc)
+            elif tag == "resolution" and in_period:
+                res_min = self._RESOLUTION_MINUTES.get((elem.text or "").strip())
+            elif tag == "Period":
+                in_period = False
+                elem.clear()
+            elif tag == "text":
+                reason_text = elem.text or ""
+            elif tag == "Reason":
+                yield "reason", reason_text
+                reason_text = ""
+                elem.clear()
+            elif tag == "TimeSeries":
+                yield "timeseries", None
+                # Drop every finished sibling hanging off the root as well
+                root.clear()
+
+    def _parse_price_document(
+        self,
+        source: Any,
+        requested_date: Any,
+        utc_start: datetime,
+        utc_end: datetime,
+    ) -> Tuple[Dict[Tuple[int, int], float], set, List[str], bool]:
+        """
+        Map streamed price points to local (hour, quarter) slots of one day.
+
+        Interval positions are converted to minute offsets from the local
+        midnight arithmetically; only on DST transition days, where the wall
+        clock is not a constant shift of UTC, do points go through astimezone.
+
+        Returns (interval_prices, dates_found, error_texts, has_timeseries).
+        """
+        interval_prices: Dict[Tuple[int, int], float] = {}
+        dates_found: set = set()
+        error_texts: List[str] = []
+        has_timeseries = False
+
+        day_minutes = int((utc_end - utc_start).total_seconds() // 60)
+        constant_offset = day_minutes == 24 * 60
+        period_offsets: Dict[datetime, int] = {}
+
+        for kind, payload in self._iter_price_document(source):
+            if kind == "reason":
+                error_texts.append(payload or "Unknown API error")
+                continue
+            if kind == "timeseries":
+                has_timeseries = True
+                continue
+
+            start_time, res_min, pos, price = payload
+            base = period_offsets.get(start_time)
+            if base is None:
+                base = int((start_time - utc_start).total_seconds() // 60)
+                period_offsets[start_time] = base
+            offset = base + (pos - 1) * res_min
+
+            if 0 <= offset < day_minutes:
+                dates_found.add(requested_date)
+                if constant_offset:
+                    hour, minute = divmod(offset, 60)
+                else:
+                    interval_local = (utc_start + timedelta(minutes=offset)).astimezone(
+                        self.timezone
+                    )
+                    hour, minute = interval_local.hour, interval_local.minute
+            else:
+                interval_date = (
+                    (utc_start + timedelta(minutes=offset))
+                    .astimezone(self.timezone)
+                    .date()
+                )
+                dates_found.add(interval_date)
+                # Log only once per mismatched date to avoid spam
+                if interval_date not in self._logged_skip_dates:
+                    self._logged_skip_dates.add(interval_date)
+                    log(
+                        f"Skipping price data for {interval_date} (requested {requested_date})",
+                        level="DEBUG",
+                        context="ELECTRICITY",
+                    )
+                continue
+
+            quarter = (minute // 15) + 1
+            if res_min == 60:
+                # Hourly resolution: the price applies to all quarters of the hour
+                for q in range(1, 5):
+                    interval_prices[(hour, q)] = price
+            else:
+                interval_prices[(hour, quarter)] = price
+
+        return interval_prices, dates_found, error_texts, has_timeseries
+
     def clear_cache(self) -> None:
         """Clear the price cache."""
         self._cache.clear()
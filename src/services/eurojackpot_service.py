@@ -18,9 +18,11 @@ Features:
 
 import json
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import requests
 
 # Note: .env is loaded by config.py before services are initialized
@@ -28,6 +30,255 @@ from config import get_config
 from logger import get_logger
 
 
+class _DrawMatrix:
+    """
+    Columnar, loaded-once view of the draw database used by the analytics.
+
+    Rows are draws sorted newest-first by ``date_iso``; the seven columns are
+    the five main numbers followed by the two euro numbers as int8. Unparseable
+    or out-of-range numbers are stored as 0 so they never hit a real bucket.
+    Prefix sums of per-number hits make any newest-first window an O(50)
+    subtraction, and pair co-occurrences come from one matrix product.
+    """
+
+    MAIN_MAX = 50
+    EURO_MAX = 12
+    BACKTEST_STRATEGIES = ("hot", "cold", "pairs", "random")
+
+    def __init__(self, draws: List[Dict[str, any]], signature=None):
+        self.signature = signature
+        order = sorted(
+            range(len(draws)),
+            key=lambda i: draws[i].get("date_iso", "") or "",
+            reverse=True,
+        )
+        self.dates = [draws[i].get("date_iso") for i in order]
+        self.total_draws = len(order)
+
+        numbers = np.zeros((self.total_draws, 7), dtype=np.int8)
+        complete = np.zeros(self.total_draws, dtype=bool)
+        for row, i in enumerate(order):
+            nums = draws[i].get("numbers", []) or []
+            complete[row] = len(nums) >= 7
+            for col in range(min(7, len(nums))):
+                try:
+                    n = int(nums[col])
+                except (TypeError, ValueError):
+                    continue
+                limit = self.MAIN_MAX if col < 5 else self.EURO_MAX
+                if 1 <= n <= limit:
+                    numbers[row, col] = n
+        self.numbers = numbers
+        self.complete = complete
+
+        rows = np.arange(self.total_draws)[:, None]
+        main_hits = np.zeros((self.total_draws, self.MAIN_MAX + 1), dtype=np.int32)
+        euro_hits = np.zeros((self.total_draws, self.EURO_MAX + 1), dtype=np.int32)
+        np.add.at(main_hits, (rows, numbers[:, :5].astype(np.intp)), 1)
+        np.add.at(euro_hits, (rows, numbers[:, 5:].astype(np.intp)), 1)
+        main_hits[:, 0] = 0
+        euro_hits[:, 0] = 0
+        self.main_hits = main_hits
+        self.euro_hits = euro_hits
+
+        zero_main = np.zeros((1, self.MAIN_MAX + 1), dtype=np.int32)
+        zero_euro = np.zeros((1, self.EURO_MAX + 1), dtype=np.int32)
+        self._main_cum = np.vstack([zero_main, np.cumsum(main_hits, axis=0)])
+        self._euro_cum = np.vstack([zero_euro, np.cumsum(euro_hits, axis=0)])
+
+        # Index of the newest draw containing each number; total_draws if never
+        self.main_last_seen = self._first_hit(main_hits)
+        self.euro_last_seen = self._first_hit(euro_hits)
+
+        self._pair_cache: Dict[int, np.ndarray] = {}
+
+    def _first_hit(self, hits: np.ndarray) -> np.ndarray:
+        seen = hits > 0
+        if not self.total_draws:
+            return np.zeros(hits.shape[1], dtype=np.intp)
+        first = np.argmax(seen, axis=0)
+        first[~seen.any(axis=0)] = self.total_draws
+        return first
+
+    def window_end(self, window: Optional[int]) -> int:
+        if not window:
+            return self.total_draws
+        return min(self.total_draws, max(1, window))
+
+    def main_counts(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """Main number counts (index = number) for newest-first rows [start, end)."""
+        end = self.total_draws if end is None else min(end, self.total_draws)
+        start = min(start, end)
+        return self._main_cum[end] - self._main_cum[start]
+
+    def euro_counts(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """Euro number counts (index = number) for newest-first rows [start, end)."""
+        end = self.total_draws if end is None else min(end, self.total_draws)
+        start = min(start, end)
+        return self._euro_cum[end] - self._euro_cum[start]
+
+    def complete_counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Main and euro counts over draws that have all seven numbers."""
+        return (
+            self.main_hits[self.complete].sum(axis=0),
+            self.euro_hits[self.complete].sum(axis=0),
+        )
+
+    def pair_counts(self, window: Optional[int] = None) -> np.ndarray:
+        """Symmetric 51x51 co-occurrence counts of main numbers (cached)."""
+        end = self.window_end(window)
+        pairs = self._pair_cache.get(end)
+        if pairs is None:
+            present = (self.main_hits[:end] > 0).astype(np.int32)
+            pairs = present.T @ present
+            np.fill_diagonal(pairs, 0)
+            self._pair_cache[end] = pairs
+        return pairs
+
+    def date_range(self) -> Tuple[Optional[str], Optional[str]]:
+        """Return (oldest, newest) ``date_iso`` among draws that have one."""
+        known = [d for d in self.dates if d]
+        if not known:
+            return None, None
+        return known[-1], known[0]
+
+    @staticmethod
+    def top(values: np.ndarray, count: int, descending: bool = True) -> List[int]:
+        """
+        Numbers (indices >= 1) with the ``count`` most extreme values.
+
+        Ties are broken by the lower number, matching a stable sort over 1..N.
+        """
+        keys = -values[1:] if descending else values[1:]
+        return [int(i) + 1 for i in np.argsort(keys, kind="stable")[:count]]
+
+    def _history_bounds(self, window: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rows that have a full ``window`` of complete older draws behind them,
+        and the exclusive end of each row's history window (newest-first).
+        """
+        rows = np.arange(self.total_draws)
+        rows = rows[(rows + window < self.total_draws) & self.complete]
+        return rows, rows + 1 + window
+
+    @staticmethod
+    def _top_rows(scores: np.ndarray, count: int) -> np.ndarray:
+        """Row-wise top ``count`` numbers (columns >= 1), ties to the lower number."""
+        return np.argsort(-scores[:, 1:], axis=1, kind="stable")[:, :count] + 1
+
+    def strategy_tickets(
+        self, strategy: str, window: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Walk-forward tickets for every draw that has ``window`` draws of history.
+
+        Each ticket only uses the ``window`` draws preceding its target draw.
+        Returns (rows, main_tickets (M, 5), euro_tickets (M, 2)); the random
+        strategy is handled by the caller since it is not history based.
+        """
+        rows, ends = self._history_bounds(window)
+        starts = rows + 1
+        if not len(rows):
+            empty = np.zeros((0, 5), dtype=np.int8)
+            return rows, empty, np.zeros((0, 2), dtype=np.int8)
+
+        euro_counts = self._euro_cum[ends] - self._euro_cum[starts]
+        euro = self._top_rows(euro_counts, 2)
+
+        if strategy == "hot":
+            main = self._top_rows(self._main_cum[ends] - self._main_cum[starts], 5)
+        elif strategy == "cold":
+            # Row of the next older draw containing each number; N if none
+            hit_rows = np.where(
+                self.main_hits > 0,
+                np.arange(self.total_draws)[:, None],
+                self.total_draws,
+            )
+            next_hit = np.minimum.accumulate(hit_rows[::-1], axis=0)[::-1]
+            next_hit = np.vstack(
+                [next_hit[1:], np.full((1, next_hit.shape[1]), self.total_draws)]
+            )
+            absence = np.minimum(next_hit[rows] - starts[:, None], window)
+            main = self._top_rows(absence, 5)
+            euro_hit_rows = np.where(
+                self.euro_hits > 0,
+                np.arange(self.total_draws)[:, None],
+                self.total_draws,
+            )
+            euro_next = np.minimum.accumulate(euro_hit_rows[::-1], axis=0)[::-1]
+            euro_next = np.vstack(
+                [euro_next[1:], np.full((1, euro_next.shape[1]), self.total_draws)]
+            )
+            euro = self._top_rows(
+                np.minimum(euro_next[rows] - starts[:, None], window), 2
+            )
+        elif strategy == "pairs":
+            main = self._pair_tickets(rows, window)
+        else:
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+        return rows, main, euro
+
+    def _pair_tickets(self, rows: np.ndarray, window: int) -> np.ndarray:
+        """
+        Pairs-strategy tickets: the most frequent pair in each row's history
+        window, then the three numbers that co-occur most with it.
+
+        Pair counts are kept for one window at a time and slid draw by draw,
+        so memory stays at a single 51x51 table however long the history is.
+        """
+        size = self.MAIN_MAX + 1
+        members = [np.flatnonzero(hits) for hits in self.main_hits]
+        pairs = np.zeros((size, size), dtype=np.int32)
+        upper = np.triu(np.ones((size, size), dtype=bool), k=1)
+        tickets = np.zeros((len(rows), 5), dtype=np.intp)
+        low = high = 0  # pairs counts the draws in rows [low, high)
+        for i, row in enumerate(rows):
+            start, end = row + 1, row + 1 + window
+            if start >= high:
+                pairs[:] = 0
+                low = high = start
+            for older in range(high, end):
+                pairs[np.ix_(members[older], members[older])] += 1
+            for newer in range(low, start):
+                pairs[np.ix_(members[newer], members[newer])] -= 1
+            low, high = start, end
+
+            a, b = divmod(int(np.argmax(np.where(upper, pairs, -1))), size)
+            scores = pairs[a] + pairs[b]
+            scores[a] = scores[b] = -1
+            tickets[i] = [a, b, *self._top_rows(scores[None], 3)[0]]
+        return tickets
+
+    @staticmethod
+    def match_counts(tickets: np.ndarray, drawn: np.ndarray) -> np.ndarray:
+        """
+        Broadcast-compare tickets against drawn numbers.
+
+        ``tickets`` (..., k) and ``drawn`` (..., d) must broadcast on the
+        leading axes; returns the number of ticket numbers found in the draw.
+        """
+        return (tickets[..., :, None] == drawn[..., None, :]).any(axis=-1).sum(axis=-1)
+
+    @staticmethod
+    def cross_match_counts(
+        tickets: np.ndarray, drawn: np.ndarray, highest: int
+    ) -> np.ndarray:
+        """
+        Match counts of every ticket (k, t) against every draw (m, d) -> (k, m).
+
+        Both sides are one-hot encoded over 0..highest (0 = missing, ignored)
+        so the whole cross product is a single matrix multiplication.
+        """
+        ticket_hot = np.zeros((len(tickets), highest + 1), dtype=np.float32)
+        drawn_hot = np.zeros((len(drawn), highest + 1), dtype=np.float32)
+        ticket_hot[np.arange(len(tickets))[:, None], tickets] = 1
+        drawn_hot[np.arange(len(drawn))[:, None], drawn.astype(np.intp)] = 1
+        ticket_hot[:, 0] = 0
+        drawn_hot[:, 0] = 0
+        return (ticket_hot @ drawn_hot.T).astype(np.int64)
+
+
 class EurojackpotService:
     """Service for Eurojackpot lottery information using Magayo API."""
 
@@ -39,6 +290,7 @@ class EurojackpotService:
         self.jackpot_url = "https://www.magayo.com/api/jackpot.php"
         self.results_url = "https://www.magayo.com/api/results.php"
         self.db_file = "data/eurojackpot.json"
+        self._draw_matrix: Optional[_DrawMatrix] = None
 
     def get_week_number(self, date_str: str) -> int:
         """Get ISO week number from date string."""
@@ -96,8 +348,32 @@ class EurojackpotService:
             self.logger.error(f"Error loading database: {e}")
             return {"draws": [], "last_updated": None}
 
+    def _db_signature(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the database file, or None if missing."""
+        try:
+            st = os.stat(self.db_file)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _get_draw_matrix(self) -> "_DrawMatrix":
+        """
+        Return the cached draw matrix, rebuilding it only when the database
+        file changed on disk or was rewritten through _save_database.
+        """
+        signature = self._db_signature()
+        cached = self._draw_matrix
+        if cached is not None and signature is not None:
+            if cached.signature == signature:
+                return cached
+        matrix = _DrawMatrix(self._load_database().get("draws", []), signature)
+        # Nothing on disk means nothing worth caching
+        self._draw_matrix = matrix if signature is not None else None
+        return matrix
+
     def _save_database(self, data: Dict[str, any]) -> None:
         """Save draw data to JSON database file."""
+        self._draw_matrix = None
         try:
             with open(self.db_file, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -107,33 +383,43 @@ class EurojackpotService:
 
     def _save_draw_to_database(self, draw_data: Dict[str, any]) -> None:
         """Save a draw result to the database."""
+        self._save_draws_to_database([draw_data])
+
+    def _save_draws_to_database(self, draws: List[Dict[str, any]]) -> int:
+        """
+        Merge a batch of draw results into the database with a single write.
+
+        Draws replace any stored draw with the same date. Returns the number of
+        draws written (0 on error).
+        """
         try:
-            db = self._load_database()
+            incoming = {d["date_iso"]: d for d in draws if d.get("date_iso")}
+            if not incoming:
+                return 0
 
-            # Check if draw already exists (by date)
-            draw_date_iso = draw_data.get("date_iso")
-            if draw_date_iso:
-                # Remove existing draw with same date
-                db["draws"] = [
-                    d for d in db["draws"] if d.get("date_iso") != draw_date_iso
-                ]
+            db = self._load_database()
 
-                # Add new draw
-                db["draws"].append(draw_data)
+            # Remove existing draws with the same dates, then add the new ones
+            db["draws"] = [d for d in db["draws"] if d.get("date_iso") not in incoming]
+            db["draws"].extend(incoming.values())
 
-                # Sort by date (newest first)
-                db["draws"].sort(key=lambda x: x.get("date_iso", ""), reverse=True)
+            # Sort by date (newest first)
+            db["draws"].sort(key=lambda x: x.get("date_iso", ""), reverse=True)
 
-                # Keep only last 500 draws to allow for historical data while preventing excessive growth
-                db["draws"] = db["draws"][:500]
+            # Keep only last 500 draws to allow for historical data while preventing excessive growth
+            db["draws"] = db["draws"][:500]
 
-                # Update timestamp
-                db["last_updated"] = datetime.now().isoformat()
+            # Update timestamp
+            db["last_updated"] = datetime.now().isoformat()
 
-                self._save_database(db)
-                self.logger.debug(f"Saved draw data for {draw_date_iso} to database")
+            self._save_database(db)
+            self.logger.debug(
+                f"Saved {len(incoming)} draw(s) to database: {', '.join(sorted(incoming))}"
+            )
+            return len(incoming)
         except Exception as e:
             self.logger.error(f"Error saving draw to database: {e}")
+            return 0
 
     def _get_latest_draw_from_database(self) -> Optional[Dict[str, any]]:
         """Get the latest draw from the database."""
@@ -652,51 +938,29 @@ class EurojackpotService:
         Returns structured message with main and euro number lists.
         """
         try:
-            db = self._load_database()
-            draws = db.get("draws", [])
-            if not draws:
+            matrix = self._get_draw_matrix()
+            if not matrix.total_draws:
                 return {
                     "success": False,
                     "message": "📊 Ei dataa analytiikkaan. Käytä !eurojackpot stats tai scrape kerätäksesi dataa.",
                 }
-
-            # Use most recent first (DB is stored newest-first already, but ensure)
-            draws_sorted = sorted(
-                draws, key=lambda d: d.get("date_iso", ""), reverse=True
-            )
-            if window:
-                draws_sorted = draws_sorted[: max(1, window)]
+            end = matrix.window_end(window)
 
             if mode == "hot":
-                main_counts, euro_counts = {}, {}
-                for d in draws_sorted:
-                    nums = d.get("numbers", [])
-                    for i in range(min(5, len(nums))):
-                        try:
-                            n = int(nums[i])
-                            main_counts[n] = main_counts.get(n, 0) + 1
-                        except Exception:
-                            continue
-                    for i in range(5, min(7, len(nums))):
-                        try:
-                            n = int(nums[i])
-                            euro_counts[n] = euro_counts.get(n, 0) + 1
-                        except Exception:
-                            continue
-                top_main = sorted(
-                    main_counts.items(), key=lambda x: x[1], reverse=True
-                )[:top]
-                top_euro = sorted(
-                    euro_counts.items(), key=lambda x: x[1], reverse=True
-                )[:2]
-                primary = [n for n, _ in top_main]
-                secondary = [n for n, _ in top_euro]
+                main_counts = matrix.main_counts(0, end)
+                euro_counts = matrix.euro_counts(0, end)
+                primary = [
+                    n for n in matrix.top(main_counts, top) if main_counts[n] > 0
+                ]
+                secondary = [
+                    n for n in matrix.top(euro_counts, 2) if euro_counts[n] > 0
+                ]
                 msg = (
                     "📊 Hot-numerot: "
                     + " ".join(f"{n:02d}" for n in primary)
                     + " + "
                     + " ".join(f"{n:02d}" for n in secondary)
-                    + (f" ({len(draws_sorted)} arvontaa)" if draws_sorted else "")
+                    + f" ({end} arvontaa)"
                 )
                 return {
                     "success": True,
@@ -706,45 +970,17 @@ class EurojackpotService:
                     "mode": "hot",
                 }
 
-            # mode == "cold": compute longest absence since last seen
-            last_seen_main = {n: None for n in range(1, 51)}
-            last_seen_euro = {n: None for n in range(1, 13)}
-            for idx, d in enumerate(draws_sorted):
-                nums = d.get("numbers", [])
-                for i in range(min(5, len(nums))):
-                    try:
-                        n = int(nums[i])
-                        if last_seen_main[n] is None:
-                            last_seen_main[n] = idx
-                    except Exception:
-                        continue
-                for i in range(5, min(7, len(nums))):
-                    try:
-                        n = int(nums[i])
-                        if last_seen_euro[n] is None:
-                            last_seen_euro[n] = idx
-                    except Exception:
-                        continue
-            # Absence streak = index of last_seen; unseen -> large streak (len)
-            max_idx = len(draws_sorted)
-            streaks_main = [
-                (n, (last_seen_main[n] if last_seen_main[n] is not None else max_idx))
-                for n in last_seen_main
-            ]
-            streaks_euro = [
-                (n, (last_seen_euro[n] if last_seen_euro[n] is not None else max_idx))
-                for n in last_seen_euro
-            ]
-            cold_main = sorted(streaks_main, key=lambda x: x[1], reverse=True)[:top]
-            cold_euro = sorted(streaks_euro, key=lambda x: x[1], reverse=True)[:2]
-            primary = [n for n, _ in cold_main]
-            secondary = [n for n, _ in cold_euro]
+            # mode == "cold": longest absence since last seen; unseen -> window size
+            absence_main = np.minimum(matrix.main_last_seen, end)
+            absence_euro = np.minimum(matrix.euro_last_seen, end)
+            primary = matrix.top(absence_main, top)
+            secondary = matrix.top(absence_euro, 2)
             msg = (
                 "🥶 Cold-numerot (pisin poissaolo): "
                 + " ".join(f"{n:02d}" for n in primary)
                 + " + "
                 + " ".join(f"{n:02d}" for n in secondary)
-                + (f" ({len(draws_sorted)} arvontaa)" if draws_sorted else "")
+                + f" ({end} arvontaa)"
             )
             return {
                 "success": True,
@@ -762,36 +998,25 @@ class EurojackpotService:
     ) -> Dict[str, any]:
         """Compute most common unordered pairs among main numbers."""
         try:
-            from itertools import combinations
-
-            db = self._load_database()
-            draws = db.get("draws", [])
-            if not draws:
+            matrix = self._get_draw_matrix()
+            if not matrix.total_draws:
                 return {
                     "success": False,
                     "message": "📊 Ei dataa parianalyysiin.",
                 }
-            draws_sorted = sorted(
-                draws, key=lambda d: d.get("date_iso", ""), reverse=True
-            )
-            if window:
-                draws_sorted = draws_sorted[: max(1, window)]
-
-            pair_counts = {}
-            for d in draws_sorted:
-                nums = d.get("numbers", [])
-                try:
-                    main = [int(x) for x in nums[:5]]
-                except Exception:
-                    continue
-                for a, b in combinations(sorted(set(main)), 2):
-                    key = (a, b)
-                    pair_counts[key] = pair_counts.get(key, 0) + 1
-            top_pairs = sorted(pair_counts.items(), key=lambda x: x[1], reverse=True)[
-                :top
+            end = matrix.window_end(window)
+
+            pairs = matrix.pair_counts(window)
+            a_idx, b_idx = np.triu_indices(pairs.shape[0], k=1)
+            counts = pairs[a_idx, b_idx]
+            order = np.argsort(-counts, kind="stable")[:top]
+            top_pairs = [
+                ((int(a_idx[i]), int(b_idx[i])), int(counts[i]))
+                for i in order
+                if counts[i] > 0
             ]
             formatted = ", ".join(f"{a:02d}-{b:02d}[{c}]" for (a, b), c in top_pairs)
-            msg = f"🔗 Yleisimmät parit: {formatted} ({len(draws_sorted)} arvontaa)"
+            msg = f"🔗 Yleisimmät parit: {formatted} ({end} arvontaa)"
             return {
                 "success": True,
                 "message": msg,
@@ -807,42 +1032,19 @@ class EurojackpotService:
         Returns top trending up and down.
         """
         try:
-            db = self._load_database()
-            draws = db.get("draws", [])
-            if len(draws) < max(5, window // 2):
+            matrix = self._get_draw_matrix()
+            if matrix.total_draws < max(5, window // 2):
                 return {
                     "success": False,
                     "message": "📊 Liian vähän dataa trendianalyysiin.",
                 }
-            draws_sorted = sorted(
-                draws, key=lambda d: d.get("date_iso", ""), reverse=True
+            deltas = matrix.main_counts(0, window) - matrix.main_counts(
+                window, 2 * window
             )
-            recent = draws_sorted[:window]
-            prior = draws_sorted[window : 2 * window]  # noqa E203 - Black formatting
-
-            def count_main(ds):
-                counts = {}
-                for d in ds:
-                    nums = d.get("numbers", [])
-                    for i in range(min(5, len(nums))):
-                        try:
-                            n = int(nums[i])
-                            counts[n] = counts.get(n, 0) + 1
-                        except Exception:
-                            continue
-                return counts
-
-            cr = count_main(recent)
-            cp = count_main(prior)
-            deltas = []
-            for n in range(1, 51):
-                deltas.append((n, cr.get(n, 0) - cp.get(n, 0)))
-            up = [
-                n
-                for n, d in sorted(deltas, key=lambda x: x[1], reverse=True)[:top]
-                if d > 0
+            up = [n for n in matrix.top(deltas, top) if deltas[n] > 0]
+            down = [
+                n for n in matrix.top(deltas, top, descending=False) if deltas[n] < 0
             ]
-            down = [n for n, d in sorted(deltas, key=lambda x: x[1])[:top] if d < 0]
             msg = (
                 "📈 Trendit: ylös "
                 + " ".join(f"{n:02d}" for n in up)
@@ -858,71 +1060,121 @@ class EurojackpotService:
     def get_streaks(self, top: int = 5) -> Dict[str, any]:
         """Compute current absence streaks for main and euro numbers."""
         try:
-            db = self._load_database()
-            draws = db.get("draws", [])
-            if not draws:
+            matrix = self._get_draw_matrix()
+            if not matrix.total_draws:
                 return {"success": False, "message": "📊 Ei dataa putkitilastoihin."}
-            draws_sorted = sorted(
-                draws, key=lambda d: d.get("date_iso", ""), reverse=True
-            )
 
-            last_seen_main = {n: None for n in range(1, 51)}
-            last_seen_euro = {n: None for n in range(1, 13)}
-            for idx, d in enumerate(draws_sorted):
-                nums = d.get("numbers", [])
-                for i in range(min(5, len(nums))):
-                    try:
-                        n = int(nums[i])
-                        if last_seen_main[n] is None:
-                            last_seen_main[n] = idx
-                    except Exception:
-                        continue
-                for i in range(5, min(7, len(nums))):
-                    try:
-                        n = int(nums[i])
-                        if last_seen_euro[n] is None:
-                            last_seen_euro[n] = idx
-                    except Exception:
-                        continue
-            max_idx = len(draws_sorted)
-            streaks_main = sorted(
-                [
-                    (n, last_seen_main[n] if last_seen_main[n] is not None else max_idx)
-                    for n in last_seen_main
-                ],
-                key=lambda x: x[1],
-                reverse=True,
-            )[:top]
-            streaks_euro = sorted(
-                [
-                    (n, last_seen_euro[n] if last_seen_euro[n] is not None else max_idx)
-                    for n in last_seen_euro
-                ],
-                key=lambda x: x[1],
-                reverse=True,
-            )[:2]
-
-            primary = [n for n, _ in streaks_main]
-            secondary = [n for n, _ in streaks_euro]
+            main_streaks = matrix.main_last_seen
+            euro_streaks = matrix.euro_last_seen
+            primary = matrix.top(main_streaks, top)
+            secondary = matrix.top(euro_streaks, 2)
             msg = (
                 "📉 Poissaoloputket: "
                 + " ".join(f"{n:02d}" for n in primary)
                 + " + "
                 + " ".join(f"{n:02d}" for n in secondary)
-                + f" ({max_idx} viimeistä arvontaa)"
+                + f" ({matrix.total_draws} viimeistä arvontaa)"
             )
             return {
                 "success": True,
                 "message": msg,
                 "primary_numbers": primary,
                 "secondary_numbers": secondary,
-                "primary_streaks": dict(streaks_main),
-                "secondary_streaks": dict(streaks_euro),
+                "primary_streaks": {n: int(main_streaks[n]) for n in primary},
+                "secondary_streaks": {n: int(euro_streaks[n]) for n in secondary},
             }
         except Exception as e:
             self.logger.error(f"Error streaks: {e}")
             return {"success": False, "message": "📊 Virhe putkitilastoissa"}
 
+    def backtest_strategy(
+        self,
+        strategy: str = "hot",
+        window: int = 50,
+        tickets: int = 1000,
+        seed: Optional[int] = None,
+    ) -> Dict[str, any]:
+        """
+        Backtest a number picking strategy against the stored draw history.
+
+        Every draw with ``window`` older draws behind it is played with a
+        ticket chosen only from that history (hot, cold or pairs); the random
+        strategy plays ``tickets`` random tickets against each of those draws.
+        Matches are counted with NumPy broadcasts (a one-hot matrix product
+        for the random tickets) over the whole draw matrix at once.
+
+        Returns:
+            Dict with match-count distributions for main and euro numbers
+        """
+        try:
+            strategy = strategy.lower()
+            if strategy in ("frequent-pairs", "parit"):
+                strategy = "pairs"
+            if strategy not in _DrawMatrix.BACKTEST_STRATEGIES:
+                return {
+                    "success": False,
+                    "message": f"🎯 Tuntematon strategia '{strategy}'. Vaihtoehdot: {', '.join(_DrawMatrix.BACKTEST_STRATEGIES)}",
+                }
+            window = max(1, int(window))
+
+            matrix = self._get_draw_matrix()
+            rows, main, euro = matrix.strategy_tickets(
+                "hot" if strategy == "random" else strategy, window
+            )
+            if not len(rows):
+                return {
+                    "success": False,
+                    "message": f"🎯 Liian vähän dataa backtestiin (tarvitaan yli {window} arvontaa).",
+                }
+
+            drawn_main = matrix.numbers[rows, :5]
+            drawn_euro = matrix.numbers[rows, 5:]
+            if strategy == "random":
+                rng = np.random.default_rng(seed)
+                count = max(1, int(tickets))
+                main = np.argpartition(rng.random((count, 50)), 5, axis=1)[:, :5] + 1
+                euro = np.argpartition(rng.random((count, 12)), 2, axis=1)[:, :2] + 1
+                main_matches = matrix.cross_match_counts(
+                    main, drawn_main, matrix.MAIN_MAX
+                )
+                euro_matches = matrix.cross_match_counts(
+                    euro, drawn_euro, matrix.EURO_MAX
+                )
+            else:
+                count = 1
+                main_matches = matrix.match_counts(main, drawn_main)
+                euro_matches = matrix.match_counts(euro, drawn_euro)
+
+            main_dist = np.bincount(main_matches.ravel(), minlength=6)
+            euro_dist = np.bincount(euro_matches.ravel(), minlength=3)
+            mean_main = float(main_matches.mean())
+            mean_euro = float(euro_matches.mean())
+
+            msg = (
+                f"🎯 Backtest {strategy} (ikkuna {window}, {len(rows)} arvontaa"
+                + (f", {count} riviä/arvonta" if strategy == "random" else "")
+                + "): osumat "
+                + " ".join(f"{i}:{int(c)}" for i, c in enumerate(main_dist))
+                + " | euro "
+                + " ".join(f"{i}:{int(c)}" for i, c in enumerate(euro_dist))
+                + f" | ka. {mean_main:.2f}+{mean_euro:.2f} (odotus 0.50+0.33)"
+            )
+            return {
+                "success": True,
+                "message": msg,
+                "strategy": strategy,
+                "window": window,
+                "draws_evaluated": int(len(rows)),
+                "tickets_per_draw": count,
+                "main_distribution": [int(c) for c in main_dist],
+                "euro_distribution": [int(c) for c in euro_dist],
+                "mean_main_matches": mean_main,
+                "mean_euro_matches": mean_euro,
+            }
+        except Exception as e:
+            self.logger.error(f"Error backtesting strategy: {e}")
+            return {"success": False, "message": "🎯 Virhe backtestissä"}
+
     def _calculate_frequency_from_database(
         self, extended: bool = False, limit: int = 10
     ) -> Dict[str, any]:
@@ -936,58 +1188,32 @@ class EurojackpotService:
             Dict with frequency analysis results
         """
         try:
-            db = self._load_database()
-            draws = db.get("draws", [])
+            matrix = self._get_draw_matrix()
+            total_draws = matrix.total_draws
 
-            if len(draws) < 5:  # Need at least 5 draws for meaningful statistics
+            if total_draws < 5:  # Need at least 5 draws for meaningful statistics
                 return {
                     "success": False,
-                    "message": f"📊 Liian vähän dataa tilastoihin ({len(draws)} arvontaa). Tarvitaan vähintään 5.",
+                    "message": f"📊 Liian vähän dataa tilastoihin ({total_draws} arvontaa). Tarvitaan vähintään 5.",
                 }
 
-            # Count frequency of each number
-            main_number_counts = {}  # 1-50
-            euro_number_counts = {}  # 1-12
-
-            date_range = {"oldest": None, "newest": None}
-
-            for draw in draws:
-                numbers = draw.get("numbers", [])
-                if len(numbers) >= 7:  # Must have 5 main + 2 euro numbers
-                    # Main numbers (first 5)
-                    for i in range(5):
-                        try:
-                            num = int(numbers[i])
-                            main_number_counts[num] = main_number_counts.get(num, 0) + 1
-                        except (ValueError, IndexError):
-                            continue
-
-                    # Euro numbers (last 2)
-                    for i in range(5, 7):
-                        try:
-                            num = int(numbers[i])
-                            euro_number_counts[num] = euro_number_counts.get(num, 0) + 1
-                        except (ValueError, IndexError):
-                            continue
-
-                # Track date range
-                draw_date = draw.get("date_iso")
-                if draw_date:
-                    if date_range["oldest"] is None or draw_date < date_range["oldest"]:
-                        date_range["oldest"] = draw_date
-                    if date_range["newest"] is None or draw_date > date_range["newest"]:
-                        date_range["newest"] = draw_date
+            # Only draws with 5 main + 2 euro numbers count towards frequencies
+            main_number_counts, euro_number_counts = matrix.complete_counts()
 
             # Get top N main numbers and top M euro numbers
             # Keep traditional 5+2 defaults, but trim using limit where sensible
             main_limit = 5 if limit is None else max(1, min(5, limit))
             euro_limit = 2 if limit is None else max(1, min(2, max(1, limit // 5)))
-            top_main = sorted(
-                main_number_counts.items(), key=lambda x: x[1], reverse=True
-            )[:main_limit]
-            top_euro = sorted(
-                euro_number_counts.items(), key=lambda x: x[1], reverse=True
-            )[:euro_limit]
+            top_main = [
+                (n, int(main_number_counts[n]))
+                for n in matrix.top(main_number_counts, main_limit)
+                if main_number_counts[n] > 0
+            ]
+            top_euro = [
+                (n, int(euro_number_counts[n]))
+                for n in matrix.top(euro_number_counts, euro_limit)
+                if euro_number_counts[n] > 0
+            ]
 
             if not top_main or not top_euro:
                 return {
@@ -1010,9 +1236,10 @@ class EurojackpotService:
                 secondary_str = " ".join(f"{num:02d}" for num in frequent_secondary)
 
             # Format date range with day.month.year format
-            if date_range["oldest"] and date_range["newest"]:
-                oldest_date = datetime.strptime(date_range["oldest"], "%Y-%m-%d")
-                newest_date = datetime.strptime(date_range["newest"], "%Y-%m-%d")
+            oldest_iso, newest_iso = matrix.date_range()
+            if oldest_iso and newest_iso:
+                oldest_date = datetime.strptime(oldest_iso, "%Y-%m-%d")
+                newest_date = datetime.strptime(newest_iso, "%Y-%m-%d")
 
                 # Format as DD.M.YY - DD.M.YY
                 oldest_str = (
@@ -1029,7 +1256,7 @@ class EurojackpotService:
             else:
                 date_range_str = "tuntematon ajanjakso"
 
-            message = f"📊 Yleisimmät numerot ({date_range_str}): {primary_str} + {secondary_str} ({len(draws)} arvontaa)"
+            message = f"📊 Yleisimmät numerot ({date_range_str}): {primary_str} + {secondary_str} ({total_draws} arvontaa)"
 
             return {
                 "success": True,
@@ -1038,7 +1265,7 @@ class EurojackpotService:
                 "secondary_numbers": frequent_secondary,
                 "primary_counts": dict(top_main),
                 "secondary_counts": dict(top_euro),
-                "total_draws": len(draws),
+                "total_draws": total_draws,
                 "date_range": date_range_str,
                 "source": "database",
             }
@@ -1050,18 +1277,112 @@ class EurojackpotService:
                 "message": f"📊 Virhe laskettaessa tilastoja: {str(e)}",
             }
 
+    def _scrape_checkpoint_path(self) -> str:
+        """Sidecar file next to the database that records scrape progress."""
+        return os.path.splitext(self.db_file)[0] + "_scrape_checkpoint.json"
+
+    def _load_scrape_checkpoint(self) -> Dict[str, any]:
+        """Load scrape progress (dates already checked that had no draw)."""
+        try:
+            path = self._scrape_checkpoint_path()
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                data.setdefault("empty_dates", [])
+                return data
+        except Exception as e:
+            self.logger.error(f"Error loading scrape checkpoint: {e}")
+        return {"empty_dates": [], "updated": None}
+
+    def _save_scrape_checkpoint(self, checkpoint: Dict[str, any]) -> None:
+        """Persist scrape progress so an interrupted scrape can resume."""
+        try:
+            checkpoint["empty_dates"] = sorted(set(checkpoint["empty_dates"]))
+            checkpoint["updated"] = datetime.now().isoformat()
+            with open(self._scrape_checkpoint_path(), "w", encoding="utf-8") as f:
+                json.dump(checkpoint, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            self.logger.error(f"Error saving scrape checkpoint: {e}")
+
+    def _fetch_scrape_draw(self, date_iso: str) -> Tuple[str, any]:
+        """
+        Fetch and parse one historical draw for the scraper.
+
+        Returns a (status, payload) tuple where status is one of "ok" (payload
+        is the database entry), "empty" (no draw that day), "skip" (nothing
+        usable), "limit" (API quota hit) or "failed".
+        """
+        params = {
+            "api_key": self.api_key,
+            "game": "eurojackpot",
+            "draw": date_iso,
+            "format": "json",
+        }
+        data = self._make_request(self.results_url, params)
+
+        if not data:
+            self.logger.warning(f"No response for {date_iso}")
+            return "failed", None
+
+        if data.get("error") == 303:
+            return "limit", None
+
+        if data.get("error") != 0:
+            self.logger.warning(f"API error {data.get('error')} for {date_iso}")
+            return "failed", None
+
+        draw_date_iso = data.get("draw")
+        if not draw_date_iso or draw_date_iso == "-":
+            self.logger.info(
+                f"No draw found for {date_iso} (probably no draw that day)"
+            )
+            return "empty", None
+
+        results = data.get("results", "")
+        if not results or results == "-":
+            self.logger.info(f"No results found for {date_iso}")
+            return "skip", None
+
+        draw_date = datetime.strptime(draw_date_iso, "%Y-%m-%d").strftime("%d.%m.%Y")
+        numbers = results.split(",")
+        if len(numbers) < 7:  # Need at least 5 main + 2 euro numbers
+            self.logger.warning(f"Invalid number format for {date_iso}: {results}")
+            return "skip", None
+
+        return "ok", {
+            "date_iso": draw_date_iso,
+            "date": draw_date,
+            "week_number": self.get_week_number(draw_date_iso),
+            "numbers": numbers,
+            "main_numbers": " ".join(numbers[:5]),
+            "euro_numbers": " ".join(numbers[5:]),
+            "jackpot": data.get("jackpot", "Tuntematon"),
+            "currency": data.get("currency", "EUR"),
+            "type": "scraped",
+            "saved_at": datetime.now().isoformat(),
+        }
+
     def scrape_all_draws(
-        self, start_year: int = 2012, max_api_calls: int = 10
+        self,
+        start_year: int = 2012,
+        max_api_calls: int = 10,
+        max_workers: int = 4,
+        batch_size: int = 25,
     ) -> Dict[str, any]:
         """
         Scrape historical Eurojackpot draws from the API and save to database.
 
         This function respects API limits (10 calls per month) and only fetches
-        draws that we don't already have in the database.
+        draws that we don't already have in the database. Up to ``max_workers``
+        requests run concurrently; results are written to the database in
+        batches of ``batch_size`` and dates that turned out to have no draw are
+        checkpointed, so an interrupted scrape resumes where it left off.
 
         Args:
             start_year: Year to start scraping from (Eurojackpot started in 2012)
             max_api_calls: Maximum API calls to make (default 10 = monthly limit)
+            max_workers: Maximum number of concurrent API requests
+            batch_size: Number of fetched draws to buffer per database write
 
         Returns:
             Dict with scraping results and statistics
@@ -1083,6 +1404,8 @@ class EurojackpotService:
             existing_dates = {
                 draw.get("date_iso") for draw in db["draws"] if draw.get("date_iso")
             }
+            checkpoint = self._load_scrape_checkpoint()
+            known_empty = set(checkpoint["empty_dates"])
 
             self.logger.info(
                 f"Database has {initial_count} existing draws, skipping those to save API calls"
@@ -1105,6 +1428,7 @@ class EurojackpotService:
                     date_iso = current_date.strftime("%Y-%m-%d")
                     if (
                         date_iso not in existing_dates
+                        and date_iso not in known_empty
                         and current_date.year >= start_year
                     ):
                         missing_dates.append(date_iso)
@@ -1128,101 +1452,91 @@ class EurojackpotService:
 
             # Limit the dates to scrape based on max_api_calls
             dates_to_scrape = missing_dates[:max_api_calls]
+            today_iso = today.strftime("%Y-%m-%d")
 
             new_draws = 0
             api_calls_used = 0
             failed_calls = 0
-
-            for i, date_iso in enumerate(dates_to_scrape, 1):
-                try:
+            pending: List[Dict[str, any]] = []
+            checkpoint_dirty = False
+
+            def flush() -> None:
+                nonlocal new_draws, failed_calls, checkpoint_dirty
+                if pending:
+                    saved = self._save_draws_to_database(pending)
+                    if saved:
+                        new_draws += saved
+                    else:
+                        failed_calls += len(pending)
+                    pending.clear()
+                if checkpoint_dirty:
+                    self._save_scrape_checkpoint(checkpoint)
+                    checkpoint_dirty = False
+
+            remaining = iter(enumerate(dates_to_scrape, 1))
+            limit_reached = False
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                in_flight = {}
+
+                def submit_next() -> bool:
+                    nonlocal api_calls_used
+                    if limit_reached:
+                        return False
+                    item = next(remaining, None)
+                    if item is None:
+                        return False
+                    i, date_iso = item
                     self.logger.info(
                         f"Scraping draw {i}/{len(dates_to_scrape)}: {date_iso}"
                     )
-
-                    # Make API call for specific date
-                    params = {
-                        "api_key": self.api_key,
-                        "game": "eurojackpot",
-                        "draw": date_iso,
-                        "format": "json",
-                    }
-
-                    data = self._make_request(self.results_url, params)
                     api_calls_used += 1
+                    future = executor.submit(self._fetch_scrape_draw, date_iso)
+                    in_flight[future] = date_iso
+                    return True
 
-                    if not data:
-                        self.logger.warning(f"No response for {date_iso}")
-                        failed_calls += 1
-                        continue
-
-                    if data.get("error") == 303:
-                        self.logger.warning(
-                            f"API limit reached (303) after {api_calls_used} calls"
-                        )
-                        break  # Stop scraping if we hit the limit
-
-                    if data.get("error") != 0:
-                        self.logger.warning(
-                            f"API error {data.get('error')} for {date_iso}"
-                        )
-                        failed_calls += 1
-                        continue
-
-                    # Process the draw data
-                    draw_date_iso = data.get("draw")
-                    if not draw_date_iso or draw_date_iso == "-":
-                        self.logger.info(
-                            f"No draw found for {date_iso} (probably no draw that day)"
-                        )
-                        continue
-
-                    results = data.get("results", "")
-                    if not results or results == "-":
-                        self.logger.info(f"No results found for {date_iso}")
-                        continue
-
-                    # Parse the draw data
-                    draw_date = datetime.strptime(draw_date_iso, "%Y-%m-%d").strftime(
-                        "%d.%m.%Y"
-                    )
-                    week_number = self.get_week_number(draw_date_iso)
-
-                    numbers = results.split(",")
-                    if len(numbers) < 7:  # Need at least 5 main + 2 euro numbers
-                        self.logger.warning(
-                            f"Invalid number format for {date_iso}: {results}"
-                        )
-                        continue
-
-                    main = " ".join(numbers[:5])
-                    euro = " ".join(numbers[5:])
-                    jackpot = data.get("jackpot", "Tuntematon")
-                    currency = data.get("currency", "EUR")
-
-                    # Create database entry
-                    draw_db_data = {
-                        "date_iso": draw_date_iso,
-                        "date": draw_date,
-                        "week_number": week_number,
-                        "numbers": numbers,
-                        "main_numbers": main,
-                        "euro_numbers": euro,
-                        "jackpot": jackpot,
-                        "currency": currency,
-                        "type": "scraped",
-                        "saved_at": datetime.now().isoformat(),
-                    }
-
-                    # Save the draw
-                    self._save_draw_to_database(draw_db_data)
-                    new_draws += 1
-
-                    self.logger.info(f"✓ Saved draw {draw_date}: {main} + {euro}")
-
-                except Exception as e:
-                    self.logger.error(f"Error processing draw for {date_iso}: {e}")
-                    failed_calls += 1
-                    continue
+                try:
+                    for _ in range(max(1, max_workers)):
+                        if not submit_next():
+                            break
+
+                    while in_flight:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            date_iso = in_flight.pop(future)
+                            try:
+                                status, draw = future.result()
+                            except Exception as e:
+                                self.logger.error(
+                                    f"Error processing draw for {date_iso}: {e}"
+                                )
+                                status, draw = "failed", None
+
+                            if status == "ok":
+                                pending.append(draw)
+                                self.logger.info(
+                                    f"✓ Fetched draw {draw['date']}: {draw['main_numbers']} + {draw['euro_numbers']}"
+                                )
+                                if len(pending) >= batch_size:
+                                    flush()
+                            elif status == "limit":
+                                self.logger.warning(
+                                    f"API limit reached (303) after {api_calls_used} calls"
+                                )
+                                limit_reached = (
+                                    True  # Stop scraping if we hit the limit
+                                )
+                            elif status == "empty":
+                                # Today's draw may simply not be published yet
+                                if date_iso < today_iso:
+                                    checkpoint["empty_dates"].append(date_iso)
+                                    checkpoint_dirty = True
+                            elif status == "failed":
+                                failed_calls += 1
+
+                            submit_next()
+                finally:
+                    # Persist whatever was fetched, even if the scrape is interrupted
+                    flush()
 
             # Get final database stats
             final_db = self._load_database()
@@ -11,7 +11,7 @@ import os
 import re
 import threading
 import time
-from typing import Callable, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional
 
 import feedparser
 
@@ -25,6 +25,11 @@ class FMIWarningService:
 
     FEED_URL = "https://alerts.fmi.fi/cap/feed/rss_fi-FI.rss"
     DEFAULT_CHECK_INTERVAL = 300  # 5 minutes
+    JOB_NAME = "fmi_warning"
+    POLL_JITTER = 15.0  # seconds of random delay added to each scheduled poll
+    POLL_TIMEOUT = 120.0
+    SEEN_HASH_LIMIT = 50  # most recent warning hashes remembered
+    SEEN_DATA_LIMIT = 10  # most recent warnings used for duplicate titles
     WEEKDAY_TIME_RANGE_RE = re.compile(
         r"\b(?:ma|ti|ke|to|pe|la|su)\s+\d{1,2}\.\d{2}\s*[–-]\s*"
         r"((?:(ma|ti|ke|to|pe|la|su)\s+)?\d{1,2}\.\d{2})"
@@ -79,6 +84,14 @@ class FMIWarningService:
         self.running = False
         self.thread: Optional[threading.Thread] = None
 
+        # Validators from the last feed response for conditional requests
+        self._etag: Optional[str] = None
+        self._modified: Optional[str] = None
+        # Seen warnings, loaded from the state file on the first check and
+        # kept in insertion order so trimming drops the oldest ones.
+        self._seen_hashes: Optional[Dict[str, None]] = None
+        self._seen_data: Optional[List[dict]] = None
+
     def start(self) -> None:
         """Start monitoring FMI warnings in background thread."""
         if self.thread and self.thread.is_alive():
@@ -113,17 +126,35 @@ class FMIWarningService:
             fallback_text="FMI warning service stopped.",
         )
 
+    def schedule(self, scheduler) -> None:
+        """Poll from a shared Scheduler instead of a dedicated thread."""
+        self.running = True
+        scheduler.add_job(
+            self.JOB_NAME,
+            self.poll,
+            interval=self.check_interval,
+            jitter=self.POLL_JITTER,
+            timeout=self.POLL_TIMEOUT,
+        )
+
+    def unschedule(self, scheduler) -> None:
+        """Remove the polling job added by schedule()."""
+        self.running = False
+        scheduler.remove_job(self.JOB_NAME)
+
+    def poll(self) -> None:
+        """Check once and pass any new warnings to the callback."""
+        try:
+            new_warnings = self.check_new_warnings()
+            if new_warnings:
+                self.callback(new_warnings)
+        except Exception as e:
+            log(f"Error checking FMI warnings: {e}", level="ERROR", context="FMI_WS")
+
     def _monitor_loop(self) -> None:
         """Main monitoring loop running in background thread."""
         while self.running:
-            try:
-                new_warnings = self.check_new_warnings()
-                if new_warnings:
-                    self.callback(new_warnings)
-            except Exception as e:
-                log(
-                    f"Error checking FMI warnings: {e}", level="ERROR", context="FMI_WS"
-                )
+            self.poll()
 
             # Sleep in smaller chunks to respond faster to shutdown requests
             remaining_sleep = self.check_interval
@@ -140,50 +171,71 @@ class FMIWarningService:
             List of formatted warning messages
         """
         try:
-            feed = feedparser.parse(self.FEED_URL)
-            seen_hashes = self._load_seen_hashes()
-            seen_data = self._load_seen_data()
-
-            new_entries = []
-            for entry in feed.entries:
-                entry_hash = self._get_entry_hash(entry)
-                if entry_hash not in seen_hashes:
-                    new_entries.append((entry_hash, entry))
-
-            if not new_entries:
+            feed = feedparser.parse(
+                self.FEED_URL, etag=self._etag, modified=self._modified
+            )
+            if getattr(feed, "status", None) == 304:
                 return []
+            messages = self._collect_new_messages(feed.entries)
+        except Exception as e:
+            # Forget the validators and any unsaved seen state, so the next
+            # poll fetches the whole feed and handles these entries again
+            self._etag = self._modified = None
+            self._seen_hashes = self._seen_data = None
+            log(f"Error fetching FMI warnings: {e}", level="ERROR", context="FMI_WS")
+            return []
 
-            messages = []
-            for entry_hash, entry in reversed(new_entries):
-                message = self._format_warning_message(entry)
-                if message:  # Only add if not filtered out
-                    # Check for duplicate titles in the last 5 warnings
-                    title = entry.get("title", "")
-                    if not self._is_duplicate_title(title, seen_data):
-                        messages.append(message)
-                        seen_hashes.add(entry_hash)
-                        # Add to seen data for duplicate checking
-                        seen_data.append(
-                            {
-                                "title": self._normalize_title(title),
-                                "timestamp": entry.get("published", ""),
-                                "hash": entry_hash,
-                            }
-                        )
-
-            # Keep only the 50 most recent hashes to prevent unlimited growth
-            seen_hashes = set(list(seen_hashes)[-50:])
-            self._save_seen_hashes(seen_hashes)
+        # Only a fully handled feed may be skipped next time with a 304
+        etag = getattr(feed, "etag", None)
+        modified = getattr(feed, "modified", None)
+        self._etag = etag if isinstance(etag, str) else None
+        self._modified = modified if isinstance(modified, str) else None
+        return messages
+
+    def _collect_new_messages(self, entries) -> List[str]:
+        """Format the unseen feed entries and record them as seen."""
+        if self._seen_hashes is None:
+            self._seen_hashes = dict.fromkeys(self._load_seen_hashes())
+            self._seen_data = list(self._load_seen_data())
+        seen_hashes = self._seen_hashes
+        seen_data = self._seen_data
+
+        new_entries = []
+        for entry in entries:
+            entry_hash = self._get_entry_hash(entry)
+            if entry_hash not in seen_hashes:
+                new_entries.append((entry_hash, entry))
+
+        if not new_entries:
+            return []
 
-            # Keep only the last 10 warnings for duplicate checking
-            seen_data = seen_data[-10:]
+        messages = []
+        for entry_hash, entry in reversed(new_entries):
+            message = self._format_warning_message(entry)
+            if message:  # Only add if not filtered out
+                # Check for duplicate titles in the last warnings
+                title = entry.get("title", "")
+                if not self._is_duplicate_title(title, seen_data):
+                    messages.append(message)
+                    seen_hashes[entry_hash] = None
+                    # Add to seen data for duplicate checking
+                    seen_data.append(
+                        {
+                            "title": self._normalize_title(title),
+                            "timestamp": entry.get("published", ""),
+                            "hash": entry_hash,
+                        }
+                    )
+
+        if messages:
+            # Drop the oldest entries to prevent unlimited growth
+            for entry_hash in list(seen_hashes)[: -self.SEEN_HASH_LIMIT]:
+                del seen_hashes[entry_hash]
+            del seen_data[: -self.SEEN_DATA_LIMIT]
+            self._save_seen_hashes(seen_hashes)
             self._save_seen_data(seen_data)
 
-            return messages
-
-        except Exception as e:
-            log(f"Error fetching FMI warnings: {e}", level="ERROR", context="FMI_WS")
-            return []
+        return messages
 
     def _get_entry_hash(self, entry: dict) -> str:
         """Generate hash for warning entry to detect duplicates."""
@@ -194,21 +246,24 @@ class FMIWarningService:
         cleaned = " ".join(normalized.split())
         return hashlib.sha256(cleaned.encode("utf-8")).hexdigest()
 
-    def _load_seen_hashes(self) -> Set[str]:
-        """Load previously seen warning hashes from state file."""
+    def _load_seen_hashes(self) -> List[str]:
+        """Load previously seen warning hashes from state file, oldest first."""
         data = self._load_state_data("seen hashes")
         if not isinstance(data, dict):
-            return set()
+            return []
         if "fmi_warnings" in data:
-            return set(data["fmi_warnings"].get("seen_hashes", []))
-        return set(data.get("seen_hashes", []))
+            hashes = data["fmi_warnings"].get("seen_hashes", [])
+        else:
+            hashes = data.get("seen_hashes", [])
+        return list(dict.fromkeys(hashes))
 
-    def _save_seen_hashes(self, hashes: Set[str]) -> None:
+    def _save_seen_hashes(self, hashes: Iterable[str]) -> None:
         """Save seen warning hashes to state file."""
+        hashes = list(hashes)
         try:
             update_json_file(
                 self.state_file,
-                lambda data: self._with_fmi_value(data, "seen_hashes", list(hashes)),
+                lambda data: self._with_fmi_value(data, "seen_hashes", hashes),
                 default=dict,
                 strict=True,
             )
@@ -1,8 +1,11 @@
 import asyncio
 import json
 import os
+import re
 import threading
-from typing import Callable, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
@@ -39,6 +42,11 @@ DEFAULT_START_ID = 2830  # fallback
 CHECK_INTERVAL = 15 * 60  # 15 min
 DEFAULT_NOT_FOUND_ATTEMPTS = 2
 
+PROBE_CONCURRENCY = 4  # parallel release page requests
+PROBE_INTERVAL = 0.1  # minimum seconds between request starts
+GAP_RECHECK_SPAN = 20  # missing ids this close below the newest are retried
+GAP_RECHECK_POLLS = 3  # polls before a missing id is given up on
+
 
 # ----------------------------------------------------
 # Helpers
@@ -59,6 +67,229 @@ def load_existing_ids(json_file: Optional[str] = None):
     return id_map, set(id_map.keys())
 
 
+def _id_ranges(ids) -> list:
+    """Compress ids into [[first, last], ...] runs of consecutive values."""
+    ranges = []
+    for id_val in sorted(ids):
+        if ranges and id_val == ranges[-1][1] + 1:
+            ranges[-1][1] = id_val
+        else:
+            ranges.append([id_val, id_val])
+    return ranges
+
+
+class _ReleaseStore:
+    """
+    Append-only release log with a sidecar index.
+
+    Releases are stored one JSON object per line in ``<json_file>l``
+    (``otiedote.jsonl``). The sidecar ``.idx`` file records the known ids as
+    ranges, the highest id and how many bytes of the log it covers. Opening
+    the store reads the index and only scans log bytes written after it, so
+    appends and id lookups never parse the whole history.
+
+    A legacy JSON array at ``json_file`` is imported on first use, and again
+    whenever that file changes (external scrapers still write it).
+    """
+
+    def __init__(self, json_file: str):
+        self.legacy_file = json_file
+        self.log_file = json_file + "l"
+        self.index_file = self.log_file + ".idx"
+        self.ids: set = set()
+        self.min_id: Optional[int] = None
+        self.max_id: Optional[int] = None
+        self._size = 0
+        self._legacy_signature = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, id_val: int) -> bool:
+        return id_val in self.ids
+
+    # ---------------- Loading ----------------
+    def _load(self) -> None:
+        index = load_json_file(self.index_file, default=dict)
+        log_size = (
+            os.path.getsize(self.log_file) if os.path.exists(self.log_file) else 0
+        )
+        if isinstance(index, dict) and 0 <= index.get("size", -1) <= log_size:
+            for first, last in index.get("ids", []):
+                self.ids.update(range(first, last + 1))
+            self.min_id = min(self.ids, default=None)
+            self.max_id = index.get("max_id")
+            self._size = index["size"]
+            self._legacy_signature = index.get("legacy")
+
+        scanned = self._size < log_size
+        if scanned:
+            self._scan_tail()
+        imported = self.refresh()
+        if scanned and not imported:
+            self._save_index()
+
+    def _scan_tail(self) -> None:
+        """Index log lines past the indexed size; drop a torn final line."""
+        good = self._size
+        with open(self.log_file, "rb") as f:
+            f.seek(self._size)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    id_val = json.loads(line)["id"]
+                except (ValueError, KeyError, TypeError):
+                    break
+                self._remember(id_val)
+                good += len(line)
+        if good < os.path.getsize(self.log_file):
+            logger.warning(f"Truncating damaged tail of {self.log_file}")
+            with open(self.log_file, "r+b") as f:
+                f.truncate(good)
+        self._size = good
+
+    def _legacy_signature_now(self):
+        try:
+            stat = os.stat(self.legacy_file)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def refresh(self) -> bool:
+        """
+        Import releases from the legacy JSON array if it changed since the
+        last import. Costs a single stat when it has not.
+
+        Returns:
+            True if the legacy file was read
+        """
+        signature = self._legacy_signature_now()
+        if signature is None or signature == self._legacy_signature:
+            return False
+        id_map, _ = load_existing_ids(self.legacy_file)
+        missing = [
+            release for id_val, release in sorted(id_map.items()) if id_val not in self
+        ]
+        self._legacy_signature = signature
+        if missing:
+            logger.info(f"Importing {len(missing)} releases from {self.legacy_file}")
+        self.append(missing, force_index=True)
+        return True
+
+    def _remember(self, id_val: int) -> None:
+        self.ids.add(id_val)
+        if self.min_id is None or id_val < self.min_id:
+            self.min_id = id_val
+        if self.max_id is None or id_val > self.max_id:
+            self.max_id = id_val
+
+    # ---------------- Writing ----------------
+    def append(self, releases: list, force_index: bool = False) -> list:
+        """
+        Append releases whose ids are not stored yet.
+
+        Returns:
+            The releases that were written
+        """
+        with self._lock:
+            added = []
+            lines = []
+            for release in releases:
+                if release["id"] in self.ids:
+                    continue
+                self._remember(release["id"])
+                added.append(release)
+                lines.append(json.dumps(release, ensure_ascii=False) + "\n")
+            if lines:
+                os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+                data = "".join(lines).encode("utf-8")
+                with open(self.log_file, "ab") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._size += len(data)
+            if lines or force_index:
+                self._save_index()
+            return added
+
+    def _save_index(self) -> None:
+        save_json_atomic(
+            self.index_file,
+            {
+                "size": self._size,
+                "max_id": self.max_id,
+                "ids": _id_ranges(self.ids),
+                "legacy": self._legacy_signature,
+            },
+            update_timestamp=False,
+            indent=None,
+        )
+
+    # ---------------- Reading ----------------
+    def releases(self) -> list:
+        """All stored releases sorted by id (reads the whole log)."""
+        if not os.path.exists(self.log_file):
+            return []
+        releases = []
+        with open(self.log_file, "rb") as f:
+            for line in f:
+                if line.endswith(b"\n"):
+                    try:
+                        releases.append(json.loads(line))
+                    except ValueError:
+                        continue
+        releases.sort(key=lambda x: x["id"])
+        return releases
+
+
+class _ReleaseProber:
+    """
+    Fetches batches of release ids on a thread pool.
+
+    At most ``concurrency`` requests run at once and request starts are spaced
+    at least ``interval`` seconds apart, so a backfill stays polite to the
+    site while no longer waiting on each page in turn. Use as a context manager.
+    """
+
+    def __init__(self, concurrency: int, interval: float, stop_event: threading.Event):
+        self.concurrency = max(1, concurrency)
+        self.interval = interval
+        self._stop_event = stop_event
+        self._slot_lock = threading.Lock()
+        self._next_start = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="otiedote-probe"
+        )
+        return self
+
+    def __exit__(self, *exc_info):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+    def _fetch(self, id_val: int) -> Optional[dict]:
+        with self._slot_lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if self._stop_event.wait(start - now):
+            return None
+        try:
+            return fetch_release(id_val)
+        except Exception as e:
+            logger.warning(f"Error fetching release #{id_val}: {e}")
+            return None
+
+    def fetch(self, ids: List[int]) -> List[Tuple[int, Optional[dict]]]:
+        """(id, release or None) for each id, in the order given."""
+        return list(zip(ids, self._executor.map(self._fetch, ids)))
+
+
 def fetch_release(id: int) -> Optional[dict]:
     """Fetch a release page and parse it into a dict."""
     url = RELEASE_URL_TEMPLATE.format(id)
@@ -182,35 +413,124 @@ def get_otiedote_target_filters(filters: dict, target: str) -> list:
     return []
 
 
-def otiedote_release_matches_filters(release: dict, target_filters: list) -> bool:
-    """Return True when a release should be sent for the target filters."""
-    if not target_filters:
-        return True
+class OtiedoteReleaseFields:
+    """Lower-cased text of a release's fields, built once per field on demand.
 
-    for filter_entry in target_filters:
-        if ":" in filter_entry:
-            needle, field = filter_entry.split(":", 1)
-        else:
-            needle = filter_entry
-            field = "organization"
+    Create one per release and pass it to every target's filter, so a release
+    fanned out to many channels is normalized (and for ``*`` serialized) once.
+    """
 
-        needle = needle.strip().lower()
-        field = field.strip() or "organization"
-        if not needle:
-            continue
+    def __init__(self, release: dict):
+        self.release = release
+        self._text: Dict[str, str] = {}
 
-        if field == "*":
-            haystack = json.dumps(release, ensure_ascii=False).lower()
-        else:
-            field_value = release.get(field, "")
-            if isinstance(field_value, list):
-                field_value = " ".join(str(item) for item in field_value)
-            haystack = str(field_value).lower()
+    def text(self, field: str) -> str:
+        text = self._text.get(field)
+        if text is None:
+            if field == "*":
+                text = json.dumps(self.release, ensure_ascii=False).lower()
+            else:
+                field_value = self.release.get(field, "")
+                if isinstance(field_value, list):
+                    field_value = " ".join(str(item) for item in field_value)
+                text = str(field_value).lower()
+            self._text[field] = text
+        return text
+
+
+class OtiedoteTargetFilter:
+    """One target's filter entries compiled into a regex per field.
+
+    Entries have the form ``needle[:field]``; the field defaults to
+    ``organization`` and ``*`` searches the whole release. A release matches
+    when any needle occurs in its field. An empty entry list matches all.
+    """
+
+    def __init__(self, entries: list):
+        self.match_all = not entries
+        needles: Dict[str, set] = {}
+        for filter_entry in entries:
+            if not isinstance(filter_entry, str):
+                continue
+            if ":" in filter_entry:
+                needle, field = filter_entry.split(":", 1)
+            else:
+                needle = filter_entry
+                field = "organization"
+
+            needle = needle.strip().lower()
+            field = field.strip() or "organization"
+            if needle:
+                needles.setdefault(field, set()).add(needle)
 
-        if needle in haystack:
+        self.patterns = [
+            (field, re.compile("|".join(map(re.escape, sorted(group)))))
+            for field, group in needles.items()
+        ]
+
+    def matches(self, fields: OtiedoteReleaseFields) -> bool:
+        if self.match_all:
             return True
+        return any(
+            pattern.search(fields.text(field)) for field, pattern in self.patterns
+        )
 
-    return False
+
+class OtiedoteFilters:
+    """Compiled filters for every configured target."""
+
+    def __init__(self, filters: dict):
+        self._targets: Dict[str, OtiedoteTargetFilter] = {}
+        self._targets_lower: Dict[str, OtiedoteTargetFilter] = {}
+        for target in filters:
+            if not isinstance(target, str):
+                continue
+            compiled = OtiedoteTargetFilter(
+                get_otiedote_target_filters(filters, target)
+            )
+            self._targets[target] = compiled
+            self._targets_lower.setdefault(target.lower(), compiled)
+        self._match_all = OtiedoteTargetFilter([])
+
+    def for_target(self, target: str) -> OtiedoteTargetFilter:
+        """Filter for an IRC target, tolerating channel case differences."""
+        compiled = self._targets.get(target)
+        if compiled is None:
+            compiled = self._targets_lower.get(target.lower(), self._match_all)
+        return compiled
+
+
+_compiled_filters: Dict[str, Tuple[Tuple[int, int], OtiedoteFilters]] = {}
+_compiled_filters_lock = threading.Lock()
+
+
+def load_otiedote_filters(state_file: Optional[str] = None) -> OtiedoteFilters:
+    """
+    Compiled otiedote filters, recompiled only when the state file changes.
+    """
+    state_file = state_file or CONFIG_STATE_FILE
+    try:
+        stat = os.stat(state_file)
+        signature = (stat.st_mtime_ns, stat.st_size)
+    except (OSError, TypeError, ValueError):
+        signature = None
+
+    with _compiled_filters_lock:
+        cached = _compiled_filters.get(state_file)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+
+    compiled = OtiedoteFilters(get_otiedote_filters(state_file))
+    if signature is not None:
+        with _compiled_filters_lock:
+            _compiled_filters[state_file] = (signature, compiled)
+    return compiled
+
+
+def otiedote_release_matches_filters(release: dict, target_filters: list) -> bool:
+    """Return True when a release should be sent for the target filters."""
+    fields = OtiedoteReleaseFields(release)
+    return OtiedoteTargetFilter(target_filters).matches(fields)
 
 
 # ----------------------------------------------------
@@ -220,6 +540,9 @@ class OtiedoteService:
     """Async monitoring service for otiedote.fi releases."""
 
     DEFAULT_CHECK_INTERVAL = 5 * 60
+    JOB_NAME = "otiedote"
+    POLL_JITTER = 15.0  # seconds of random delay added to each scheduled poll
+    POLL_TIMEOUT = 10 * 60.0
 
     def __init__(
         self,
@@ -227,11 +550,17 @@ class OtiedoteService:
         check_interval: int = DEFAULT_CHECK_INTERVAL,
         state_file: str = CONFIG_STATE_FILE,
         json_file: str = JSON_FILE,
+        probe_concurrency: int = PROBE_CONCURRENCY,
+        probe_interval: float = PROBE_INTERVAL,
     ):
         self.callback = callback
         self.check_interval = check_interval
         self.state_file = state_file
         self.json_file = json_file
+        self.probe_concurrency = probe_concurrency
+        self.probe_interval = probe_interval
+        self._store: Optional[_ReleaseStore] = None
+        self._gap_attempts: Dict[int, int] = {}
 
         self.running = False
         self._stop_event = threading.Event()
@@ -454,24 +783,49 @@ class OtiedoteService:
 
         logger.info("🔴 Otiedote monitor stopped")
 
+    def schedule(self, scheduler) -> None:
+        """Poll from a shared Scheduler instead of a dedicated thread."""
+        self._stop_event.clear()
+        self.running = True
+        scheduler.add_job(
+            self.JOB_NAME,
+            self.poll,
+            interval=self.check_interval,
+            jitter=self.POLL_JITTER,
+            timeout=self.POLL_TIMEOUT,
+        )
+        logger.info("🟢 Otiedote monitor scheduled")
+
+    def unschedule(self, scheduler) -> None:
+        """Remove the polling job and interrupt a poll in progress."""
+        self.running = False
+        self._stop_event.set()
+        scheduler.remove_job(self.JOB_NAME)
+
     # ---------------- Main loop ----------------
+    def poll(self) -> None:
+        """Check once and pass each new release to the callback."""
+        try:
+            new_releases = self.check_new_releases()
+            for release in new_releases:
+                if self._stop_event.is_set():
+                    return
+                logger.info(f"New Otiedote #{release['id']}: {release['title']}")
+                try:
+                    self.callback(release)
+                except Exception as e:
+                    logger.error(
+                        f"Error in Otiedote callback for #{release['id']}: {e}"
+                    )
+
+        except Exception as e:
+            logger.error(f"Error in Otiedote loop: {e}")
+
     async def _monitor_loop(self):
         while self.running:
-            try:
-                new_releases = self.check_new_releases()
-                for release in new_releases:
-                    if self._stop_event.is_set():
-                        return
-                    logger.info(f"New Otiedote #{release['id']}: {release['title']}")
-                    try:
-                        self.callback(release)
-                    except Exception as e:
-                        logger.error(
-                            f"Error in Otiedote callback for #{release['id']}: {e}"
-                        )
-
-            except Exception as e:
-                logger.error(f"Error in Otiedote loop: {e}")
+            self.poll()
+            if self._stop_event.is_set():
+                return
 
             # Sleep in chunks so stop() is responsive
             sleep_chunk = min(1.0, self.check_interval / 10)
@@ -499,12 +853,60 @@ class OtiedoteService:
         Returns:
             List of otiedote entries, or empty list if no data available.
         """
-        id_map, _ = load_existing_ids(self.json_file)
-        return list(id_map.values())
+        return self._release_store().releases()
 
-    def _save_releases(self, releases: list) -> None:
-        releases.sort(key=lambda x: x["id"])
-        save_json_atomic(self.json_file, releases, update_timestamp=False)
+    def _release_store(self) -> _ReleaseStore:
+        """The release store, opened on first use and kept for later polls."""
+        if self._store is None:
+            self._store = _ReleaseStore(self.json_file)
+        else:
+            self._store.refresh()
+        return self._store
+
+    def _save_releases(self, releases: list) -> list:
+        """Append releases to the store, skipping ids it already has."""
+        return self._release_store().append(releases)
+
+    def _prober(self, stop_event: Optional[threading.Event] = None) -> _ReleaseProber:
+        """A prober for the monitor, or one with its own ``stop_event``."""
+        return _ReleaseProber(
+            self.probe_concurrency,
+            self.probe_interval,
+            self._stop_event if stop_event is None else stop_event,
+        )
+
+    def _recover_gaps(self, prober: _ReleaseProber, store: _ReleaseStore) -> list:
+        """
+        Retry ids missing just below the newest stored release.
+
+        Ids are sometimes published out of order, so a miss that was skipped
+        over can appear later. Each missing id is retried on a few polls only.
+        """
+        if store.max_id is None:
+            return []
+        low = max(store.max_id - GAP_RECHECK_SPAN, store.min_id)
+        for id_val in [i for i in self._gap_attempts if i < low]:
+            del self._gap_attempts[id_val]
+        gaps = [
+            id_val
+            for id_val in range(low, store.max_id)
+            if id_val not in store
+            and self._gap_attempts.get(id_val, 0) < GAP_RECHECK_POLLS
+        ]
+        if not gaps:
+            return []
+
+        recovered = []
+        for id_val, release in prober.fetch(gaps):
+            if release and release["id"] not in store:
+                logger.info(
+                    f"✅ Otiedote release #{id_val} found in gap: {release['title']}"
+                )
+                recovered.append(release)
+                self._gap_attempts.pop(id_val, None)
+            else:
+                self._gap_attempts[id_val] = self._gap_attempts.get(id_val, 0) + 1
+        return recovered
 
     def check_new_releases(
         self, max_attempts: Optional[int] = None, max_releases: int = 500
@@ -515,46 +917,49 @@ class OtiedoteService:
 
         self.latest_release = self._load_latest_release()
         starting_latest = self.latest_release
-        id_map, existing_ids = load_existing_ids(self.json_file)
-        releases = list(id_map.values())
-        new_releases = []
-
-        highest_known_id = max(existing_ids, default=self.latest_release)
-        self.latest_release = max(self.latest_release, highest_known_id)
+        store = self._release_store()
+        self.latest_release = max(self.latest_release, store.max_id or 0)
         next_id = self.latest_release + 1
         misses = 0
+        # Probe as many ids at once as misses are still allowed; while whole
+        # batches keep hitting (catching up after downtime) widen the batch.
+        window = 1
 
-        while misses < max_attempts and len(new_releases) < max_releases:
-            if self._stop_event.is_set():
-                break
-
-            if next_id in existing_ids:
-                next_id += 1
-                continue
-
-            release = fetch_release(next_id)
-
-            if release:
-                logger.info(f"✅ Otiedote release #{next_id} found: {release['title']}")
-                if release["id"] not in existing_ids:
-                    releases.append(release)
-                    existing_ids.add(release["id"])
-                    new_releases.append(release)
-
-                self.latest_release = max(self.latest_release, release["id"])
-                misses = 0
-            else:
-                logger.info(f"❌ Otiedote release #{next_id} not found")
-                misses += 1
+        with self._prober() as prober:
+            new_releases = self._recover_gaps(prober, store)
 
-            next_id += 1
-
-            if next_id <= highest_known_id:
-                misses = 0
+            while misses < max_attempts and len(new_releases) < max_releases:
+                size = min(
+                    max(window, max_attempts - misses),
+                    max_releases - len(new_releases),
+                )
+                batch = prober.fetch(list(range(next_id, next_id + size)))
+                next_id += size
+                hits = 0
+                for id_val, release in batch:
+                    if self._stop_event.is_set() or misses >= max_attempts:
+                        break
+                    if len(new_releases) >= max_releases:
+                        break
+                    if release:
+                        logger.info(
+                            f"✅ Otiedote release #{id_val} found: {release['title']}"
+                        )
+                        if release["id"] not in store:
+                            new_releases.append(release)
+                        self.latest_release = max(self.latest_release, release["id"])
+                        misses = 0
+                        hits += 1
+                    else:
+                        logger.info(f"❌ Otiedote release #{id_val} not found")
+                        misses += 1
+                if self._stop_event.is_set():
+                    break
+                window = min(size * 2, prober.concurrency) if hits == size else 1
 
         if new_releases:
             try:
-                self._save_releases(releases)
+                self._save_releases(new_releases)
             except Exception as e:
                 logger.warning(f"Failed to save releases JSON: {e}")
 
@@ -584,14 +989,9 @@ class OtiedoteService:
                 self.latest_release = release["id"]
                 self._save_latest_release(self.latest_release)
 
-                # Add to JSON file
-                id_map, existing_ids = load_existing_ids(self.json_file)
-                releases = list(id_map.values())
-                if release["id"] not in existing_ids:
-                    releases.append(release)
-
+                # Add to the release store
                 try:
-                    self._save_releases(releases)
+                    self._save_releases([release])
                 except Exception as e:
                     logger.warning(f"Failed to save releases JSON: {e}")
 
@@ -617,10 +1017,9 @@ class OtiedoteService:
         Returns:
             Dict with 'success', 'count', 'latest_id', and optional 'error' keys.
         """
-        import time
-
-        id_map, existing_ids = load_existing_ids(self.json_file)
-        releases = list(id_map.values())
+        store = self._release_store()
+        new_releases = []
+        pending = set()
         next_id = start_id
         fetched_count = 0
         consecutive_failures = 0
@@ -628,46 +1027,55 @@ class OtiedoteService:
 
         logger.info(f"Starting to fetch otiedote releases from #{start_id}...")
 
-        while (
-            fetched_count < max_releases
-            and consecutive_failures < max_consecutive_failures
-        ):
-            try:
-                release = fetch_release(next_id)
-
-                if release:
-                    if release["id"] not in existing_ids:
-                        releases.append(release)
-                        existing_ids.add(release["id"])
-                        fetched_count += 1
-                    consecutive_failures = 0
-
-                    if fetched_count % 50 == 0:
-                        logger.info(
-                            f"Fetched {fetched_count} releases so far (current: #{next_id})"
-                        )
-                else:
-                    consecutive_failures += 1
-
-                next_id += 1
-
-                # Small delay to be nice to the server
-                time.sleep(0.2)
-
-            except Exception as e:
-                logger.warning(f"Error fetching release #{next_id}: {e}")
-                consecutive_failures += 1
-                next_id += 1
+        # A manual backfill does not depend on the monitor running, so it
+        # does not stop with it either
+        with self._prober(threading.Event()) as prober:
+            while (
+                fetched_count < max_releases
+                and consecutive_failures < max_consecutive_failures
+            ):
+                # Ids already stored count as hits and are not requested again,
+                # so a rerun only fills the gaps of an earlier backfill.
+                window_start = next_id
+                batch = []
+                while len(batch) < prober.concurrency * 2:
+                    if next_id not in store:
+                        batch.append(next_id)
+                    next_id += 1
+                results = dict(prober.fetch(batch))
+
+                for id_val in range(window_start, next_id):
+                    if id_val in store:
+                        consecutive_failures = 0
+                        continue
+                    release = results[id_val]
+                    if release:
+                        if release["id"] not in store and release["id"] not in pending:
+                            new_releases.append(release)
+                            pending.add(release["id"])
+                            fetched_count += 1
+                            if fetched_count % 50 == 0:
+                                logger.info(
+                                    f"Fetched {fetched_count} releases so far "
+                                    f"(current: #{id_val})"
+                                )
+                        consecutive_failures = 0
+                    else:
+                        consecutive_failures += 1
+                    if (
+                        fetched_count >= max_releases
+                        or consecutive_failures >= max_consecutive_failures
+                    ):
+                        break
 
         if fetched_count:
-            # Sort by ID
-            releases.sort(key=lambda x: x["id"])
-
-            # Save to JSON file
+            # Append to the release store
             try:
-                self._save_releases(releases)
+                self._save_releases(new_releases)
 
-                logger.info(f"Saved {len(releases)} releases to {self.json_file}")
+                logger.info(
+                    f"Saved {len(new_releases)} new releases to {store.log_file}"
+                )
             except Exception as e:
                 return {
                     "success": False,
@@ -676,12 +1084,12 @@ class OtiedoteService:
                 }
 
             # Update state
-            latest_id = max(r["id"] for r in releases)
+            latest_id = store.max_id
             self.latest_release = latest_id
             self._save_latest_release(latest_id)
 
             logger.info(
-                f"Completed! Fetched {len(releases)} releases, latest ID: #{latest_id}"
+                f"Completed! Fetched {fetched_count} releases, latest ID: #{latest_id}"
             )
 
             return {
@@ -689,17 +1097,16 @@ class OtiedoteService:
                 "count": fetched_count,
                 "latest_id": latest_id,
                 "start_id": start_id,
-                "total_count": len(releases),
+                "total_count": len(store),
             }
 
-        if releases:
-            latest_id = max(r["id"] for r in releases)
+        if len(store):
             return {
                 "success": True,
                 "count": 0,
-                "latest_id": latest_id,
+                "latest_id": store.max_id,
                 "start_id": start_id,
-                "total_count": len(releases),
+                "total_count": len(store),
             }
 
         return {
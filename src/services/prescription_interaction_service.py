@@ -2,9 +2,10 @@
 
 import json
 import re
-from itertools import combinations
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from logger import get_logger
 
@@ -12,6 +13,13 @@ logger = get_logger("PrescriptionInteractionService")
 
 DISCLAIMER = "Educational CYP reference only; confirm with a clinician or pharmacist."
 
+# Modifier strength -> severity rank used to order findings (higher first)
+SEVERITY = {"strong": 3, "moderate": 2, "weak": 1}
+MODIFIER_EFFECTS = {
+    "inhibitor": "may increase exposure to",
+    "inducer": "may reduce exposure to",
+}
+
 
 def normalize_drug_name(name: str) -> str:
     """Normalize a displayed drug name for exact, case-insensitive lookup."""
@@ -25,6 +33,8 @@ class PrescriptionInteractionService:
         self.data_file = Path(data_dir) / "prescription_interactions.json"
         self.metadata: Dict = {}
         self.drugs: Dict[str, Dict] = {}
+        self._drug_ids: Dict[str, int] = {}
+        self._drug_names: List[str] = []
         self._load_data()
 
     def _load_data(self) -> None:
@@ -45,6 +55,54 @@ class PrescriptionInteractionService:
             logger.warning(f"Prescription interaction data unavailable: {error}")
             self.metadata = {}
             self.drugs = {}
+        self._build_pair_index()
+
+    def _build_pair_index(self) -> None:
+        """
+        Precompute every substrate/modifier finding, keyed by drug id pair.
+
+        Modifier relationships are deduplicated to (drug, role, enzyme) with
+        their strongest rank, then joined with the substrates of the same
+        enzyme, so only pairs that share an enzyme are touched. Findings are
+        stored CSR-style: a sorted array of symmetric pair keys with offsets
+        into compact finding columns.
+        """
+        self._drug_ids = {key: i for i, key in enumerate(self.drugs)}
+        self._drug_names = [drug.get("name", key) for key, drug in self.drugs.items()]
+
+        substrates: Dict[str, List[int]] = {}
+        rels: Dict[Tuple[int, str, str], int] = {}
+        for drug_id, drug in enumerate(self.drugs.values()):
+            for rel in drug.get("relationships", []):
+                role, enzyme = rel.get("role"), rel.get("enzyme")
+                if role == "substrate":
+                    ids = substrates.setdefault(enzyme, [])
+                    if not ids or ids[-1] != drug_id:
+                        ids.append(drug_id)
+                elif role in MODIFIER_EFFECTS:
+                    key = (drug_id, role, enzyme)
+                    rels[key] = max(
+                        rels.get(key, 0), SEVERITY.get(rel.get("strength"), 0)
+                    )
+
+        self._rels = list(rels)
+        self._rel_severity = np.fromiter(rels.values(), dtype=np.int8, count=len(rels))
+        n = max(len(self.drugs), 1)
+        pair_keys, finding_rels, finding_substrates = [], [], []
+        for rel_id, (modifier_id, _, enzyme) in enumerate(self._rels):
+            for substrate_id in substrates.get(enzyme, ()):
+                if substrate_id != modifier_id:
+                    low, high = sorted((modifier_id, substrate_id))
+                    pair_keys.append(low * n + high)
+                    finding_rels.append(rel_id)
+                    finding_substrates.append(substrate_id)
+
+        keys = np.array(pair_keys, dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+        self._finding_rels = np.array(finding_rels, dtype=np.int32)[order]
+        self._finding_substrates = np.array(finding_substrates, dtype=np.int32)[order]
+        self._pair_keys, starts = np.unique(keys[order], return_index=True)
+        self._pair_starts = np.append(starts, len(keys)).astype(np.int64)
 
     def get_drug(self, name: str) -> Optional[Dict]:
         return self.drugs.get(normalize_drug_name(name))
@@ -68,18 +126,74 @@ class PrescriptionInteractionService:
         details = " | ".join(parts) if parts else "No CYP relationships listed"
         return f"Rx: {drug.get('name', name)} | {details} | {DISCLAIMER}"
 
-    def check_interactions(self, names: List[str]) -> str:
+    def find_interactions(self, names: List[str]) -> Dict[str, List]:
+        """
+        Check a whole medication list against the precomputed pair index.
+
+        Args:
+            names: Drug names as typed; duplicates are ignored
+
+        Returns:
+            {"unknown": [normalized names not in the table],
+             "interactions": [finding dicts, most severe first]}
+            where each finding has modifier, role, enzyme, substrate,
+            strength rank ("severity") and a formatted "message".
+        """
         unique_names = list(dict.fromkeys(normalize_drug_name(name) for name in names))
-        found = [(key, self.drugs.get(key)) for key in unique_names]
-        unknown = [key for key, drug in found if not drug]
-        messages = []
-        if unknown:
-            messages.append(f"Rx: Unknown prescription drugs: {', '.join(unknown)}")
+        unknown = [key for key in unique_names if key not in self._drug_ids]
+        ids = [self._drug_ids[key] for key in unique_names if key in self._drug_ids]
+
+        # All symmetric pair keys of the list, looked up in one searchsorted
+        n = max(len(self.drugs), 1)
+        pairs = [
+            min(a, b) * n + max(a, b) for i, a in enumerate(ids) for b in ids[i + 1 :]
+        ]
+        query = np.array(pairs, dtype=np.int64)
+        slots = np.searchsorted(self._pair_keys, query)
+        found = slots < len(self._pair_keys)
+        found[found] = self._pair_keys[slots[found]] == query[found]
+        rows = np.array(
+            [
+                row
+                for slot in slots[found].tolist()
+                for row in range(self._pair_starts[slot], self._pair_starts[slot + 1])
+            ],
+            dtype=np.int64,
+        )
+        rel_ids = self._finding_rels[rows]
+        # Stable sort keeps index order among equally severe findings
+        rows = rows[np.argsort(-self._rel_severity[rel_ids], kind="stable")]
+
+        interactions = []
+        for row in rows.tolist():
+            modifier_id, role, enzyme = self._rels[self._finding_rels[row]]
+            modifier = self._drug_names[modifier_id]
+            substrate = self._drug_names[self._finding_substrates[row]]
+            interactions.append(
+                {
+                    "modifier": modifier,
+                    "role": role,
+                    "enzyme": enzyme,
+                    "substrate": substrate,
+                    "severity": int(self._rel_severity[self._finding_rels[row]]),
+                    "message": (
+                        f"Rx: {modifier} {role} of {enzyme} "
+                        f"{MODIFIER_EFFECTS[role]} {substrate}"
+                    ),
+                }
+            )
+        return {"unknown": unknown, "interactions": interactions}
 
-        for (_, left), (_, right) in combinations(
-            [(key, drug) for key, drug in found if drug], 2
-        ):
-            messages.extend(self._compare_pair(left, right))
+    def check_interactions(self, names: List[str]) -> str:
+        result = self.find_interactions(names)
+        messages = []
+        if result["unknown"]:
+            messages.append(
+                f"Rx: Unknown prescription drugs: {', '.join(result['unknown'])}"
+            )
+        messages.extend(
+            dict.fromkeys(finding["message"] for finding in result["interactions"])
+        )
 
         if not messages:
             messages.append(
@@ -88,32 +202,6 @@ class PrescriptionInteractionService:
         messages.append(DISCLAIMER)
         return " | ".join(messages)
 
-    def _compare_pair(self, left: Dict, right: Dict) -> List[str]:
-        messages = []
-        for substrate, modifier in ((left, right), (right, left)):
-            substrate_enzymes = {
-                rel.get("enzyme")
-                for rel in substrate.get("relationships", [])
-                if rel.get("role") == "substrate"
-            }
-            for relationship in modifier.get("relationships", []):
-                role = relationship.get("role")
-                enzyme = relationship.get("enzyme")
-                if enzyme not in substrate_enzymes or role not in {
-                    "inhibitor",
-                    "inducer",
-                }:
-                    continue
-                effect = (
-                    "may increase exposure to"
-                    if role == "inhibitor"
-                    else "may reduce exposure to"
-                )
-                messages.append(
-                    f"Rx: {modifier['name']} {role} of {enzyme} {effect} {substrate['name']}"
-                )
-        return list(dict.fromkeys(messages))
-
 
 def create_prescription_interaction_service() -> PrescriptionInteractionService:
     return PrescriptionInteractionService()
@@ -0,0 +1,285 @@
+"""
+Structured JSON-lines log with a sparse time index.
+
+Every log record becomes one line in ``data/leet.jsonl``::
+
+    {"ts": 1760783820123456789, "server": "libera", "channel": "#kanava",
+     "context": "libera", "level": "SERVER", "event": "PRIVMSG",
+     "message": "..."}
+
+``context`` is the logger's context (a server name for IRC traffic, otherwise
+a component such as "Scheduler"); ``server`` is set only for IRC records.
+
+Next to each log file a ``.idx`` file holds "<ts> <byte offset>" lines, one
+for the first record of the file and then at most one per ``index_interval``
+seconds. A time-range search bisects the index and seeks straight to the
+first interesting line instead of reading the file from the start. Files are
+rotated by size as ``leet.jsonl.1`` (newest) ... ``leet.jsonl.N`` (oldest),
+each keeping its own index.
+"""
+
+import bisect
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Timestamps come from several threads, so records may be slightly out of
+# order on disk; searches start and stop this far outside the range.
+ORDER_SLACK_NS = 1_000_000_000
+
+_IRC_TARGET_PREFIXES = ("#", "&")
+_RESPONSE_PREFIX = re.compile(r"^\[([^\]:]+):([#&][^\]]*)\]")
+
+
+def index_path(log_path: str) -> str:
+    """Location of the sparse index of a log file."""
+    return f"{log_path}.idx"
+
+
+def describe_record(
+    level: str, context: str, message: str
+) -> Tuple[str, Optional[str], str]:
+    """
+    Derive (server, channel, event) for a log record.
+
+    Raw IRC lines (``:nick!u@h PRIVMSG #chan :hi``) give the IRC command as
+    the event and their channel parameter; bot responses logged as
+    ``[server:#chan] text`` give their server and channel. Anything else is
+    an "IRC", "AI" or "SYSTEM" event, as the TUI classifies it.
+
+    Only SERVER records (logged with the server name as their context) and
+    responses have a server; for other records the context is a component
+    name, so the server is left empty.
+    """
+    server = (context or "") if level == "SERVER" else ""
+    channel = None
+    event = None
+    if message.startswith(":"):
+        parts = message.split(" ", 3)
+        if len(parts) > 1 and parts[1].isalnum():
+            event = parts[1].upper()
+            if len(parts) > 2:
+                target = parts[2].lstrip(":")
+                if target.startswith(_IRC_TARGET_PREFIXES):
+                    channel = target
+    else:
+        match = _RESPONSE_PREFIX.match(message)
+        if match:
+            server, channel = match.group(1), match.group(2)
+
+    if event is None:
+        lowered = (context or "").lower()
+        if "irc" in lowered or "server" in lowered or level == "MSG":
+            event = "IRC"
+        elif "gpt" in lowered:
+            event = "AI"
+        else:
+            event = "SYSTEM"
+    return server, channel, event
+
+
+def rotated_paths(log_path: str, max_count: int) -> List[str]:
+    """Existing log files, oldest first, ending with the current one."""
+    paths = [f"{log_path}.{i}" for i in range(max_count, 0, -1)] + [log_path]
+    return [path for path in paths if os.path.exists(path)]
+
+
+def read_index(
+    log_path: str, interval_ns: int = 60_000_000_000
+) -> List[Tuple[int, int]]:
+    """
+    The (timestamp, offset) entries for a log file. A missing index is
+    rebuilt by scanning the log once, with entries ``interval_ns`` apart.
+    """
+    entries: List[Tuple[int, int]] = []
+    try:
+        with open(index_path(log_path), "r", encoding="ascii") as f:
+            for line in f:
+                try:
+                    ts, offset = line.split()
+                    entries.append((int(ts), int(offset)))
+                except ValueError:
+                    continue  # torn last line
+        return entries
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return entries
+
+    if not os.path.exists(log_path):
+        return entries
+    offset = 0
+    with open(log_path, "rb") as f:
+        for line in f:
+            ts = _line_timestamp(line)
+            if ts is None:
+                pass
+            elif not entries or ts - entries[-1][0] >= interval_ns:
+                entries.append((ts, offset))
+            offset += len(line)
+    return entries
+
+
+def _line_timestamp(line: bytes) -> Optional[int]:
+    try:
+        return int(json.loads(line)["ts"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class StructuredLogSink:
+    """
+    Writes (time_ns, level, context, message) log records as JSON lines.
+
+    Meant to be driven by a logger.QueuedLogWriter: ``write_batch`` and
+    ``flush`` run on its writer thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        index_interval: float = 60.0,
+        max_size: int = 10485760,
+        max_count: int = 5,
+    ):
+        self.path = path
+        self.index_interval_ns = int(index_interval * 1_000_000_000)
+        self.max_size = max_size
+        self.max_count = max_count
+        self._log = None
+        self._index = None
+        self._size = 0
+        self._last_indexed: Optional[int] = None
+
+    def _open(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._log = open(self.path, "ab")
+        self._size = self._log.tell()
+        if self._size:
+            with open(self.path, "rb") as f:
+                f.seek(self._size - 1)
+                if f.read(1) != b"\n":
+                    # Finish a line torn by a crash so the next one parses
+                    self._log.write(b"\n")
+                    self._size += 1
+            entries = read_index(self.path, self.index_interval_ns)
+            if not os.path.exists(index_path(self.path)):
+                with open(index_path(self.path), "w", encoding="ascii") as f:
+                    f.writelines(f"{ts} {offset}\n" for ts, offset in entries)
+            self._last_indexed = entries[-1][0] if entries else None
+        else:
+            self._last_indexed = None
+        self._index = open(index_path(self.path), "a", encoding="ascii")
+
+    def write_batch(self, records) -> None:
+        if self._log is None:
+            self._open()
+        for timestamp_ns, level, context, message in records:
+            server, channel, event = describe_record(level, context, message)
+            line = json.dumps(
+                {
+                    "ts": timestamp_ns,
+                    "server": server,
+                    "channel": channel,
+                    "context": context,
+                    "level": level,
+                    "event": event,
+                    "message": message,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            if (
+                self._last_indexed is None
+                or timestamp_ns - self._last_indexed >= self.index_interval_ns
+            ):
+                self._index.write(f"{timestamp_ns} {self._size}\n")
+                self._last_indexed = timestamp_ns
+            self._log.write(line + b"\n")
+            self._size += len(line) + 1
+            if self.max_size and self._size >= self.max_size:
+                self._rotate()
+
+    def flush(self) -> None:
+        if self._log is not None:
+            self._log.flush()
+            self._index.flush()
+
+    def close(self) -> None:
+        if self._log is not None:
+            self.flush()
+            self._log.close()
+            self._index.close()
+            self._log = self._index = None
+
+    def _rotate(self) -> None:
+        self.close()
+        for i in range(self.max_count - 1, 0, -1):
+            for suffix in ("", ".idx"):
+                source = f"{self.path}.{i}{suffix}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{i + 1}{suffix}")
+        if self.max_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+            os.replace(index_path(self.path), index_path(f"{self.path}.1"))
+        else:
+            os.remove(self.path)
+            os.remove(index_path(self.path))
+        self._open()
+
+
+def search(
+    log_path: str,
+    start_ns: int,
+    end_ns: int,
+    pattern: Optional[str] = None,
+    limit: int = 100,
+    max_count: int = 5,
+) -> Tuple[List[Dict], int]:
+    """
+    Records with start_ns <= ts <= end_ns whose message matches ``pattern``
+    (a case-insensitive regex, or plain text if it does not compile).
+
+    Returns:
+        (first ``limit`` matching records in time order, total match count)
+    """
+    matcher = None
+    if pattern:
+        try:
+            matcher = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            matcher = re.compile(re.escape(pattern), re.IGNORECASE)
+
+    results: List[Dict] = []
+    total = 0
+    for path in rotated_paths(log_path, max_count):
+        entries = read_index(path)
+        if not entries:
+            continue
+        if entries[0][0] > end_ns + ORDER_SLACK_NS:
+            break  # this and every newer file start after the range
+        seek_to = (start_ns - ORDER_SLACK_NS, float("inf"))
+        position = bisect.bisect_right(entries, seek_to) - 1
+        offset = entries[position][1] if position >= 0 else 0
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    ts = int(record["ts"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if ts > end_ns + ORDER_SLACK_NS:
+                    break
+                if ts < start_ns or ts > end_ns:
+                    continue
+                if matcher and not matcher.search(str(record.get("message", ""))):
+                    continue
+                total += 1
+                if len(results) < limit:
+                    results.append(record)
+    results.sort(key=lambda record: record["ts"])
+    return results, total
@@ -1,8 +1,10 @@
+import copy
 import json
 import os
 import shutil
+import threading
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import logger
 from config import get_config
@@ -113,7 +115,7 @@ def load_subscriptions() -> Dict[str, Dict[str, List[str]]]:
         cleaned_data = validate_and_clean_data(subscriptions_data)
 
         # If data was corrupted and cleaned, save the cleaned version
-        if cleaned_data != data:
+        if cleaned_data != subscriptions_data:
             save_subscriptions(cleaned_data)
 
         return cleaned_data
@@ -158,39 +160,103 @@ def save_subscriptions(data: Dict[str, Dict[str, List[str]]]) -> bool:
         return False
 
 
+class _SubscriptionRegistry:
+    """
+    Loaded subscriptions with a topic -> server -> targets index.
+
+    ``data`` keeps the stored server -> target -> topics layout, which also
+    serves as the (server, target) -> topics index. Targets in ``by_topic``
+    are dict keys so they stay in insertion order.
+    """
+
+    def __init__(self, path: str, data: Dict[str, Dict[str, List[str]]]):
+        self.path = path
+        self.data = data
+        self.by_topic: Dict[str, Dict[str, Dict[str, None]]] = {}
+        for server_name, server_data in data.items():
+            for nick, topics in server_data.items():
+                for topic in topics:
+                    self._index(topic, server_name, nick)
+
+    def _index(self, topic: str, server: str, nick: str) -> None:
+        self.by_topic.setdefault(topic, {}).setdefault(server, {})[nick] = None
+
+    def _unindex(self, topic: str, server: str, nick: str) -> None:
+        servers = self.by_topic.get(topic, {})
+        targets = servers.get(server, {})
+        targets.pop(nick, None)
+        if not targets:
+            servers.pop(server, None)
+        if not servers:
+            self.by_topic.pop(topic, None)
+
+    def toggle(self, nick: str, server: str, topic: str) -> bool:
+        """Flip one subscription; return True if it was added."""
+        topics = self.data.setdefault(server, {}).setdefault(nick, [])
+        if topic in topics:
+            topics.remove(topic)
+            self._unindex(topic, server, nick)
+            added = False
+        else:
+            topics.append(topic)
+            self._index(topic, server, nick)
+            added = True
+
+        # Clean up empty entries
+        if not topics:
+            del self.data[server][nick]
+        if not self.data[server]:
+            del self.data[server]
+        return added
+
+
+_registry: Optional[_SubscriptionRegistry] = None
+_registry_lock = threading.RLock()
+
+
+def _get_registry() -> _SubscriptionRegistry:
+    """
+    The loaded subscriptions. Once loaded the registry is authoritative:
+    toggle_subscription keeps it and the file in step, and hand edits to the
+    file are picked up only through reload_subscriptions. The monitors that
+    rewrite their own sections of state.json on every poll therefore do not
+    make a broadcast parse the file again.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None or _registry.path != SUBSCRIBERS_FILE:
+            _registry = _SubscriptionRegistry(SUBSCRIBERS_FILE, load_subscriptions())
+        return _registry
+
+
+def reload_subscriptions() -> None:
+    """Read the subscriptions from the file again on the next lookup."""
+    global _registry
+    with _registry_lock:
+        _registry = None
+
+
 def toggle_subscription(nick: str, server: str, topic: str) -> str:
     """Toggle subscription for a nick/channel on a specific server."""
+    global _registry
     if topic not in VALID_TOPICS:
         return f"❌ Invalid topic: {topic}. Valid topics are: {', '.join(VALID_TOPICS)}"
 
     if not is_valid_nick_or_channel(nick):
         return f"❌ Invalid nick/channel: {nick}"
 
-    data = load_subscriptions()
-
-    if server not in data:
-        data[server] = {}
+    with _registry_lock:
+        registry = _get_registry()
+        if registry.toggle(nick, server, topic):
+            action = "✅ Tilaus lisätty"
+        else:
+            action = "❌ Poistettu tilaus"
 
-    if nick not in data[server]:
-        data[server][nick] = []
+        if save_subscriptions(registry.data):
+            return f"{action}: {nick} on network {server} for {topic}"
 
-    if topic in data[server][nick]:
-        data[server][nick].remove(topic)
-        action = "❌ Poistettu tilaus"
-    else:
-        data[server][nick].append(topic)
-        action = "✅ Tilaus lisätty"
-
-    # Clean up empty entries
-    if not data[server][nick]:
-        del data[server][nick]
-
-    if not data[server]:
-        del data[server]
-
-    if save_subscriptions(data):
-        return f"{action}: {nick} on network {server} for {topic}"
-    else:
+        # Reload what is actually stored on the next call
+        _registry = None
         return "❌ Error saving subscription."
 
 
@@ -200,15 +266,13 @@ def get_subscribers(topic: str) -> List[Tuple[str, str]]:
     Returns:
         List of (nick, server) tuples subscribed to the topic
     """
-    data = load_subscriptions()
-    subscribers = []
-
-    for server_name, server_data in data.items():
-        for nick, topics in server_data.items():
-            if topic in topics:
-                subscribers.append((nick, server_name))
-
-    return subscribers
+    with _registry_lock:
+        servers = _get_registry().by_topic.get(topic, {})
+        return [
+            (nick, server_name)
+            for server_name, targets in servers.items()
+            for nick in targets
+        ]
 
 
 def get_server_subscribers(topic: str, server: str) -> List[str]:
@@ -217,12 +281,8 @@ def get_server_subscribers(topic: str, server: str) -> List[str]:
     Returns:
         List of nicks/channels subscribed to the topic on the server
     """
-    data = load_subscriptions()
-
-    if server not in data:
-        return []
-
-    return [nick for nick, topics in data[server].items() if topic in topics]
+    with _registry_lock:
+        return list(_get_registry().by_topic.get(topic, {}).get(server, {}))
 
 
 def get_user_subscriptions(nick: str, server: str) -> List[str]:
@@ -231,12 +291,8 @@ def get_user_subscriptions(nick: str, server: str) -> List[str]:
     Returns:
         List of topics the user is subscribed to
     """
-    data = load_subscriptions()
-
-    if server not in data or nick not in data[server]:
-        return []
-
-    return data[server][nick].copy()
+    with _registry_lock:
+        return list(_get_registry().data.get(server, {}).get(nick, []))
 
 
 def format_user_subscriptions(nick: str, server: str) -> str:
@@ -262,7 +318,8 @@ def get_all_subscriptions() -> Dict[str, Dict[str, List[str]]]:
     Returns:
         Dictionary with server -> {nick: [topics]} structure
     """
-    return load_subscriptions()
+    with _registry_lock:
+        return copy.deepcopy(_get_registry().data)
 
 
 def format_all_subscriptions() -> str:
@@ -294,7 +351,7 @@ def format_server_subscriptions(server: str) -> str:
     Returns:
         Formatted string showing all subscriptions for the server
     """
-    data = load_subscriptions()
+    data = get_all_subscriptions()
 
     if server not in data or not data[server]:
         return f"📋 Ei tilauksia palvelimella {server}."
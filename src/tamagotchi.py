@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Tuple
 
 import logger as log
 from word_tracking.data_manager import DataManager
+from word_tracking.pattern_matcher import PatternMatcher
 
 secure_random = secrets.SystemRandom()
 
@@ -36,6 +37,11 @@ class TamagotchiBot:
 
         # Load trigger words configuration
         self.trigger_words = self._load_trigger_words()
+        self.trigger_matcher = PatternMatcher(
+            (word, category)
+            for category, words in self.trigger_words.items()
+            for word in words
+        )
 
         # Emotional state mappings
         self.mood_responses = {
@@ -102,16 +108,9 @@ class TamagotchiBot:
         Returns:
             List of triggered categories
         """
-        text_lower = text.lower()
-        triggered = []
-
-        for category, words in self.trigger_words.items():
-            for word in words:
-                if word.lower() in text_lower:
-                    triggered.append(category)
-                    break  # Only trigger each category once per message
-
-        return triggered
+        found = set(self.trigger_matcher.values_in(text))
+        # Report each category once, in configuration order
+        return [category for category in self.trigger_words if category in found]
 
     def _update_state(
         self, server: str, triggered_categories: List[str], interactor: str = None
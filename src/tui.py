@@ -4,19 +4,22 @@ TUI implementation for LeetIRCPythonBot using urwid.
 The default interface. Use --console for the simple interface.
 """
 
+import itertools
 import os
 import re
 import time
 import warnings
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Any, cast
+from functools import lru_cache
+from typing import Any, Callable, Iterable, cast
 
 import urwid
 
 import logger
 from config import AUTO_CONNECT, AUTO_RECONNECT, LOG_BUFFER_SIZE, get_config
 from state_utils import load_json_file, update_json_file
+from structured_log import describe_record
 
 # Suppress urwid deprecation warnings globally for this module
 warnings.filterwarnings("ignore", category=DeprecationWarning, module=".*urwid.*")
@@ -91,19 +94,36 @@ class LogEntry:
         self.level = level.upper()
         self.message = message
         self.source_type = source_type  # SYSTEM, IRC, BOT, AI
+        self.seq: int | None = None  # Arrival number, set by TUIManager
+        self._search_fields: tuple | None = None
+
+    def search_fields(self) -> tuple:
+        """
+        Lower-cased (text, server, level, channels, message) used by
+        LogFilter, computed on first use. ``text`` joins message, level,
+        server and source type with NUL so one substring test covers all four.
+        """
+        if self._search_fields is None:
+            message = self.message.lower()
+            server = self.server.lower()
+            level = self.level.lower()
+            channels = {
+                token.rstrip(".,:;!?)]")
+                for token in message.split()
+                if token.startswith(("#", "&"))
+            }
+            channel = describe_record(self.level, self.server, self.message)[1]
+            if channel:
+                channels.add(channel.lower())
+            text = "\0".join((message, level, server, self.source_type.lower()))
+            self._search_fields = (text, server, level, frozenset(channels), message)
+        return self._search_fields
 
     def matches_filter(self, filter_text: str | None) -> bool:
-        """Check if this log entry matches the given filter."""
+        """Check if this log entry matches the given filter (see LogFilter)."""
         if not filter_text:
             return True
-
-        filter_lower = filter_text.lower()
-        return (
-            filter_lower in self.message.lower()
-            or filter_lower in self.level.lower()
-            or filter_lower in self.server.lower()
-            or filter_lower in self.source_type.lower()
-        )
+        return compile_log_filter(filter_text).matches(self)
 
     def get_display_text(self) -> str:
         """Get formatted display text for this log entry."""
@@ -134,6 +154,86 @@ class LogEntry:
         return level_colors.get(self.level, "log_info")
 
 
+class LogFilter:
+    """
+    A compiled TUI log filter.
+
+    Words of the form ``server:x``, ``level:x``, ``channel:#x`` and
+    ``re:pattern`` must all match; the remaining text is matched as one
+    case-insensitive substring of the message, level, server or source type.
+    Without any such words the whole filter is that substring, as before.
+    """
+
+    KEYS = ("server", "level", "channel", "re")
+
+    def __init__(self, text: str = ""):
+        self.text = text or ""
+        terms: list[tuple[str, str]] = []
+        plain: list[str] = []
+        for word in self.text.split():
+            key, sep, value = word.partition(":")
+            if sep and value and key.lower() in self.KEYS:
+                key = key.lower()
+                if key == "channel" and not value.startswith(("#", "&")):
+                    value = "#" + value
+                terms.append((key, value if key == "re" else value.lower()))
+            else:
+                plain.append(word)
+        needle = " ".join(plain).lower() if terms else self.text.lower()
+        if needle:
+            terms.insert(0, ("text", needle))
+        self.terms = tuple(terms)
+        self._checks = [self._compile(key, value) for key, value in self.terms]
+
+    @staticmethod
+    def _compile(key: str, value: str) -> Callable[[tuple], bool]:
+        if key == "text":
+            return lambda fields: value in fields[0]
+        if key == "server":
+            return lambda fields: value in fields[1]
+        if key == "level":
+            return lambda fields: value in fields[2]
+        if key == "channel":
+            return lambda fields: value in fields[3]
+        try:
+            pattern = re.compile(value, re.IGNORECASE)
+        except re.error:
+            pattern = re.compile(re.escape(value), re.IGNORECASE)
+        return lambda fields: pattern.search(fields[4]) is not None
+
+    def matches(self, entry: LogEntry) -> bool:
+        if not self._checks:
+            return True
+        fields = entry.search_fields()
+        for check in self._checks:
+            if not check(fields):
+                return False
+        return True
+
+    def narrows(self, other: "LogFilter") -> bool:
+        """
+        True if every entry matching this filter also matches ``other``, so
+        this filter's results can be taken from ``other``'s.
+        """
+        for key, value in other.terms:
+            if not any(
+                key == new_key
+                and (
+                    value in new_value
+                    if key in ("text", "server", "level")
+                    else value == new_value
+                )
+                for new_key, new_value in self.terms
+            ):
+                return False
+        return True
+
+
+@lru_cache(maxsize=32)
+def compile_log_filter(text: str) -> LogFilter:
+    return LogFilter(text)
+
+
 def _datetime_from_epoch_ns(timestamp_ns: int) -> datetime:
     """Create a local datetime from an epoch nanosecond timestamp."""
     return datetime.fromtimestamp(timestamp_ns // 1_000_000_000)
@@ -149,6 +249,125 @@ def _epoch_nanosecond_fraction(timestamp_ns: int) -> int:
     return timestamp_ns % 1_000_000_000
 
 
+class LogListWalker(urwid.ListWalker):
+    """
+    List walker over plain items (log entries or text lines) that builds
+    widgets only for the rows the ListBox asks for.
+
+    Built widgets are kept in a small LRU cache keyed by absolute item number,
+    which stays valid while items are appended at the end and dropped from the
+    front. ``append``/``popleft`` do not signal the ListBox; call
+    ``refresh_view`` (or ``set_focus``) once a batch of changes is done.
+    """
+
+    CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        items: Iterable[Any] = (),
+        render: Callable[[Any], Any] | None = None,
+    ):
+        self._items: deque = deque(items)
+        self._render = render or (lambda item: SelectableText(str(item)))
+        self._widgets: OrderedDict[int, Any] = OrderedDict()
+        self._base = 0  # Absolute number of self._items[0]
+        self.focus = 0
+
+    # ---------------- Contents ----------------
+    @property
+    def items(self) -> deque:
+        return self._items
+
+    def set_items(
+        self, items: Iterable[Any], render: Callable[[Any], Any] | None = None
+    ) -> None:
+        """Replace the contents (and optionally the renderer); focus the end."""
+        self._items = deque(items)
+        if render is not None:
+            self._render = render
+        self._widgets.clear()
+        self._base = 0
+        self.focus = max(0, len(self._items) - 1)
+        self._modified()
+
+    def append(self, item: Any) -> None:
+        self._items.append(item)
+
+    def popleft(self) -> Any:
+        item = self._items.popleft()
+        self._widgets.pop(self._base, None)
+        self._base += 1
+        self.focus = max(0, self.focus - 1)
+        return item
+
+    def clear(self) -> None:
+        self.set_items(())
+
+    def refresh_view(self, rebuild: bool = False) -> None:
+        """Tell the ListBox the contents changed; rebuild=True drops widgets."""
+        if rebuild:
+            self._widgets.clear()
+        if self._items and self.focus >= len(self._items):
+            self.focus = len(self._items) - 1
+        self._modified()
+
+    def materialized(self) -> list[tuple[int, Any]]:
+        """(position, widget) pairs of the widgets that have been built."""
+        return [(number - self._base, w) for number, w in self._widgets.items()]
+
+    # ---------------- ListWalker interface ----------------
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, position: int) -> Any:
+        if not isinstance(position, int) or not 0 <= position < len(self._items):
+            raise IndexError(position)
+        number = self._base + position
+        widget = self._widgets.get(number)
+        if widget is None:
+            widget = self._render(self._items[position])
+            self._widgets[number] = widget
+            if len(self._widgets) > self.CACHE_SIZE:
+                self._widgets.popitem(last=False)
+        else:
+            self._widgets.move_to_end(number)
+        return widget
+
+    def __iter__(self):
+        for position in range(len(self._items)):
+            yield self[position]
+
+    def set_focus(self, position: int) -> None:
+        self.focus = position
+        self._modified()
+
+    def next_position(self, position: int) -> int:
+        if position + 1 >= len(self._items):
+            raise IndexError(position)
+        return position + 1
+
+    def prev_position(self, position: int) -> int:
+        if position <= 0:
+            raise IndexError(position)
+        return position - 1
+
+    def positions(self, reverse: bool = False) -> Iterable[int]:
+        if reverse:
+            return range(len(self._items) - 1, -1, -1)
+        return range(len(self._items))
+
+
+def _log_entry_widget(entry: "LogEntry") -> Any:
+    """Formatted, colored and clickable row for the console view."""
+    return SelectableText(entry.get_display_text(), entry.get_color_attr())
+
+
+def _raw_log_entry_widget(entry: "LogEntry") -> Any:
+    """Row for the raw console-style view."""
+    timestamp_str = entry.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+    return urwid.Text(f"[{timestamp_str}] [{entry.level}] {entry.message}")
+
+
 class NonFocusableListBox(urwid.ListBox):
     """A ListBox that is not focusable but allows mouse interactions and scrolling."""
 
@@ -176,6 +395,13 @@ class NonFocusableListBox(urwid.ListBox):
     def _body_set_focus(self, index: int) -> None:
         self._body_walker().set_focus(index)
 
+    def _body_widgets(self):
+        """(index, widget) pairs to restyle; LogListWalker only has built ones."""
+        walker = self._body_walker()
+        if isinstance(walker, LogListWalker):
+            return walker.materialized()
+        return enumerate(walker)
+
     def selectable(self):
         return True  # Allow mouse events to reach child widgets
 
@@ -355,7 +581,7 @@ class NonFocusableListBox(urwid.ListBox):
         """Update the visual display of all affected lines."""
         if not self._selection_active:
             # Clear all selections
-            for i, item in enumerate(self._body_walker()):
+            for i, item in self._body_widgets():
                 if hasattr(item, "_update_selection_display"):
                     item._selection_start = None
                     item._selection_end = None
@@ -368,7 +594,7 @@ class NonFocusableListBox(urwid.ListBox):
         start_line, start_col, end_line, end_col = selection
 
         # Update each line in the selection
-        for i, item in enumerate(self._body_walker()):
+        for i, item in self._body_widgets():
             if hasattr(item, "_update_selection_display"):
                 if start_line <= i <= end_line:
                     # This line is in the selection range
@@ -1305,6 +1531,9 @@ class FocusProtectingFrame(urwid.Frame):
 class TUIManager:
     """Main TUI manager class with statistics and configuration editor."""
 
+    # Log entries arriving faster than this are drawn together in one frame
+    REDRAW_INTERVAL = 1 / 20
+
     def __init__(self, bot_manager=None):
         self.bot_manager = bot_manager
 
@@ -1324,9 +1553,19 @@ class TUIManager:
 
         self.log_buffer_size = log_buf
         self.log_entries = deque(maxlen=int(self.log_buffer_size))
+        self._entry_seq = itertools.count()
+        # Entries waiting for the next frame, and the newest one shown
+        self._pending_entries: deque = deque()
+        self._shown_seq = -1
+        self._redraw_fd = None
+        self._redraw_pending = False
+        self._last_redraw = 0.0
         self.command_history = []
         self.history_index = 0
         self.current_filter = ""
+        self._log_filter = compile_log_filter("")
+        # Filter whose results the walker holds, None while it shows other text
+        self._walker_filter: LogFilter | None = self._log_filter
         self.current_view = "console"  # console, stats, config, help
 
         # Channel tracking
@@ -1340,13 +1579,14 @@ class TUIManager:
 
         # Initialize basic UI components for tests
         self.header = urwid.Text("", wrap="clip")
-        self.log_walker = urwid.SimpleListWalker([])
+        self.log_walker = LogListWalker(render=_log_entry_widget)
         self.log_display = NonFocusableListBox(self.log_walker)
         self.channel_bar = urwid.Text("", wrap="clip")
         self.input_field = urwid.Edit(
             "> Enter message (! for bot, - for AI): ", wrap="clip"
         )
         self.log_file = None
+        self._log_writer = None
 
         if bot_manager:
             self.set_bot_manager(bot_manager)
@@ -1361,7 +1601,7 @@ class TUIManager:
             self._hook_set = True
 
         # Initialize log file for immediate writing
-        self.log_file = None
+        self._close_log_file()
         self._open_log_file()
 
         # Track if wrap mode has been loaded to prevent duplicate logging
@@ -1391,7 +1631,8 @@ class TUIManager:
 
         # UI components
         self.header = urwid.Text("", wrap="clip")
-        self.log_walker = urwid.SimpleListWalker([])
+        self.log_walker = LogListWalker(render=_log_entry_widget)
+        self._walker_filter = None
         self.log_display = NonFocusableListBox(self.log_walker)
         self.channel_bar = urwid.Text("", wrap="clip")
         self.input_field = urwid.Edit(
@@ -1692,8 +1933,13 @@ class TUIManager:
         source_type: str = "SYSTEM",
         timestamp_ns: int | None = None,
     ):
-        """Add a new log entry to the display."""
+        """Add a new log entry to the display.
+
+        Safe to call from any thread: the entry is queued and shown in the
+        next frame on the UI loop (right away while the loop is not running).
+        """
         entry = LogEntry(timestamp, server, level, message, source_type, timestamp_ns)
+        entry.seq = next(self._entry_seq)
         self.log_entries.append(entry)
 
         # Write to log file immediately
@@ -1702,33 +1948,94 @@ class TUIManager:
         if self.current_view != "console":
             return
 
-        # Check if entry matches current filter
-        if entry.matches_filter(self.current_filter):
-            # Check if we were at the bottom before adding the new item
-            was_at_bottom = self.log_display.is_at_bottom()
+        self._pending_entries.append(entry)
+        self._schedule_redraw()
 
-            # Create selectable text widget with mouse support
-            color_attr = entry.get_color_attr()
-            selectable_text = SelectableText(entry.get_display_text(), color_attr)
-            self.log_walker.append(selectable_text)
+    def _schedule_redraw(self):
+        """Ask the UI loop for a frame; many requests share one frame."""
+        if self._redraw_fd is None:
+            self._show_pending_entries()
+            return
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        try:
+            os.write(self._redraw_fd, b"\n")
+        except OSError:
+            self._redraw_pending = False
+
+    def _on_redraw_wakeup(self, _data):
+        """Pipe callback on the UI loop: draw now or when the frame is due."""
+        delay = self._last_redraw + self.REDRAW_INTERVAL - time.monotonic()
+        if delay > 0:
+            self.loop.set_alarm_in(delay, lambda *args: self._redraw())
+        else:
+            self._redraw()
+        return True
+
+    def _redraw(self):
+        self._redraw_pending = False
+        self._show_pending_entries()
+        self._last_redraw = time.monotonic()
+        self.loop.draw_screen()
+
+    def _show_pending_entries(self):
+        """Move queued entries into the console view and trim evicted rows."""
+        pending = self._pending_entries
+        if not pending:
+            return
+        if self.current_view != "console":
+            pending.clear()
+            return
 
+        # Check if we were at the bottom before adding new items
+        was_at_bottom = self.log_display.is_at_bottom()
+        walker = self.log_walker
+        changed = False
+        while pending:
+            entry = pending.popleft()
+            if entry.seq <= self._shown_seq:
+                continue  # already included by apply_filter
+            self._shown_seq = entry.seq
+            if self._log_filter.matches(entry):
+                walker.append(entry)
+                changed = True
+
+        # Drop rows whose entries have fallen out of the log buffer
+        if self.log_entries:
+            oldest = self.log_entries[0].seq
+            while walker.items and walker.items[0].seq < oldest:
+                walker.popleft()
+                changed = True
+
+        if changed:
+            walker.refresh_view()
             # Auto-scroll to bottom only if we were previously at bottom or auto-scroll is enabled
             if was_at_bottom or self.log_display.should_auto_scroll():
                 self.log_display.scroll_to_bottom()
 
     def apply_filter(self, filter_text: str):
         """Apply a filter to the log display."""
+        log_filter = compile_log_filter(filter_text or "")
+        previous = self._walker_filter
         self.current_filter = filter_text
+        self._log_filter = log_filter
 
-        # Rebuild the display with filtered entries
-        self.log_walker.clear()
-
-        for entry in self.log_entries:
-            if entry.matches_filter(filter_text):
-                # Create selectable text widget with mouse support
-                color_attr = entry.get_color_attr()
-                selectable_text = SelectableText(entry.get_display_text(), color_attr)
-                self.log_walker.append(selectable_text)
+        if previous is not None and log_filter.narrows(previous):
+            # A narrower filter only needs to refine the rows already shown;
+            # queued entries are still checked when they are shown
+            candidates = list(self.log_walker.items)
+        else:
+            # Rebuild the display with filtered entries; widgets are created
+            # only for the rows that get drawn
+            self._pending_entries.clear()
+            candidates = list(self.log_entries)
+            self._shown_seq = candidates[-1].seq if candidates else -1
+        self.log_walker.set_items(
+            [entry for entry in candidates if log_filter.matches(entry)],
+            _log_entry_widget,
+        )
+        self._walker_filter = log_filter
 
         # Auto-scroll to bottom after filtering
         self.log_display.scroll_to_bottom()
@@ -2188,9 +2495,9 @@ class TUIManager:
 
     def _render_static_view(self, text: str):
         """Render static, scrollable body text without mixing it with live logs."""
-        self.log_walker.clear()
-        for line in text.strip("\n").split("\n"):
-            self.log_walker.append(SelectableText(line))
+        self._pending_entries.clear()
+        self._walker_filter = None
+        self.log_walker.set_items(text.strip("\n").split("\n"), SelectableText)
         self.log_display.scroll_to_top()
 
     def _focus_body(self):
@@ -2344,17 +2651,14 @@ class TUIManager:
 
     def show_raw_console_logs(self):
         """Show raw console-style logs instead of formatted TUI logs."""
-        # Clear current display
-        self.log_walker.clear()
-
-        # Display raw console-style logs
-        for entry in self.log_entries:
-            if entry.matches_filter(self.current_filter):
-                # Create raw console-style text (like what would appear in console mode)
-                timestamp_str = entry.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                raw_text = f"[{timestamp_str}] [{entry.level}] {entry.message}"
-                text_widget = urwid.Text(raw_text)
-                self.log_walker.append(text_widget)
+        # Display raw console-style logs (like what would appear in console mode)
+        self._pending_entries.clear()
+        self._walker_filter = None
+        matches = self._log_filter.matches
+        self.log_walker.set_items(
+            [entry for entry in list(self.log_entries) if matches(entry)],
+            _raw_log_entry_widget,
+        )
 
         # Scroll to bottom
         self.log_display.scroll_to_bottom()
@@ -2405,12 +2709,7 @@ class TUIManager:
             self.apply_filter(self.current_filter)  # This rebuilds the log display
         elif self.current_view == "stats":
             # Refresh stats display
-            stats_text = self.stats_view.get_stats_display()
-            self.log_walker.clear()
-            for line in stats_text.split("\n"):
-                text_widget = urwid.Text(line)
-                self.log_walker.append(text_widget)
-            self.log_display.scroll_to_top()
+            self._render_static_view(self.stats_view.get_stats_display())
         elif self.current_view == "config":
             # Refresh config display
             self._render_static_view(self.config_editor.get_config_display())
@@ -2481,6 +2780,9 @@ class TUIManager:
                 )
                 self.log_file.write("=" * 80 + "\n\n")
             self.log_file.flush()
+            self._log_writer = logger.QueuedLogWriter(
+                self._write_log_entries, self.log_file.flush, name="TUILogWriter"
+            )
         except Exception as e:
             # Try to log the error, but don't fail if we can't
             try:
@@ -2490,19 +2792,26 @@ class TUIManager:
             self.log_file = None
 
     def _write_log_entry_to_file(self, entry: LogEntry):
-        """Write a single log entry to the file immediately."""
+        """Queue a log entry for the background log file writer."""
+        if self._log_writer is not None:
+            self._log_writer.submit(entry, urgent=entry.level == "ERROR")
+
+    def _write_log_entries(self, entries):
+        """Write a batch of log entries to the file (on the writer thread)."""
         if self.log_file is None:
             return
 
-        try:
+        lines = []
+        for entry in entries:
             nanoseconds = _epoch_nanosecond_fraction(entry.timestamp_ns)
             timestamp_str = (
                 entry.timestamp.strftime("%Y-%m-%d %H:%M:%S") + f".{nanoseconds:09d}"
             )
-            self.log_file.write(
+            lines.append(
                 f"[{timestamp_str}] [{entry.server}] [{entry.level}] {entry.message}\n"
             )
-            self.log_file.flush()  # Ensure it's written immediately
+        try:
+            self.log_file.write("".join(lines))
         except Exception:
             # Silently ignore errors to prevent infinite recursion
             # (logging errors would trigger this method again)
@@ -2510,6 +2819,9 @@ class TUIManager:
 
     def _close_log_file(self):
         """Close the log file."""
+        if self._log_writer is not None:
+            self._log_writer.close()
+            self._log_writer = None
         if self.log_file is not None:
             try:
                 self.log_file.close()
@@ -2599,6 +2911,8 @@ Keyboard Shortcuts:
 
 Tips:
   - Use 'filter:ERROR' to show only error messages
+  - Combine 'server:', 'level:', 'channel:' and 're:' words, e.g.
+    'filter:server:libera channel:#test join'
   - Use 'filter:' to clear all filters
   - Command history remembers your previous inputs
   - Commands run asynchronously - you can type while commands process
@@ -2758,6 +3072,8 @@ Tips:
             unhandled_input=self.handle_key,
             handle_mouse=True,  # Enable mouse support
         )
+        # Log entries from other threads wake the loop through this pipe
+        self._redraw_fd = self.loop.watch_pipe(self._on_redraw_wakeup)
 
         # Set up periodic updates
         def update_callback():
@@ -2795,6 +3111,9 @@ Tips:
         try:
             self.loop.run()
         finally:
+            redraw_fd, self._redraw_fd = self._redraw_fd, None
+            if redraw_fd is not None:
+                self.loop.remove_watch_pipe(redraw_fd)
             # Clean up Voikko to avoid deallocator errors on shutdown
             try:
                 from lemmatizer import cleanup_voikko
@@ -12,14 +12,22 @@ Modules:
     - drink_tracker: Enhanced drink word tracking system
     - general_words: General word counting functionality
     - data_manager: Unified data management with JSON storage
+    - pattern_matcher: Multi-pattern word matcher shared by the trackers
 """
 
 from .data_manager import DataManager
 from .drink_tracker import DrinkTracker
 from .general_words import GeneralWords
+from .pattern_matcher import PatternMatcher
 from .word_associations import WordAssociations
 
 __version__ = "1.0.0"
 __author__ = "LeetIRCPythonBot"
 
-__all__ = ["DrinkTracker", "GeneralWords", "DataManager", "WordAssociations"]
+__all__ = [
+    "DrinkTracker",
+    "GeneralWords",
+    "DataManager",
+    "PatternMatcher",
+    "WordAssociations",
+]
@@ -5,16 +5,28 @@ Handles all data persistence using JSON format.
 Creates a backup file from the last file.
 """
 
+import copy
 import json
 import os
 import socket
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from src.logger import get_logger
 from src.state_utils import save_json_atomic, update_json_file
 
 
+def _file_signature(file_path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 class DataManager:
     """Manages all data persistence for the word tracking system."""
 
@@ -38,6 +50,17 @@ class DataManager:
             state_file or os.getenv("STATE_FILE", os.path.join(data_dir, "state.json"))
         )
 
+        # In-memory copies kept while the files are unchanged on disk:
+        # JSON data as path -> (signature, data, views built from the data),
+        # opt-outs as (signature, sets)
+        self._cache_lock = threading.RLock()
+        self._json_cache: Dict[
+            str, Tuple[Tuple[int, int], Dict[str, Any], Dict[str, Any]]
+        ] = {}
+        self._opt_out_cache: Optional[Tuple[Tuple[int, int], Dict[str, Set[str]]]] = (
+            None
+        )
+
         # Initialize data structures
         self._ensure_data_files()
 
@@ -166,22 +189,108 @@ class DataManager:
         except Exception:
             return "unknown_server"
 
+    def _load_cached_json(self, file_path: str) -> Dict[str, Any]:
+        """
+        Load a JSON file, reusing the parsed data while the file is unchanged.
+
+        The cached object is returned as-is, so callers that modify it must
+        save it again through _save_cached_json.
+        """
+        with self._cache_lock:
+            signature = _file_signature(file_path)
+            cached = self._json_cache.get(file_path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            data = self.load_json(file_path)
+            if signature:
+                self._json_cache[file_path] = (signature, data, {})
+            return data
+
+    def _save_cached_json(self, file_path: str, data: Dict[str, Any]):
+        """
+        Save a JSON file and make the saved data the cached copy. Views of
+        the cached data are kept when the same object is saved back.
+        """
+        with self._cache_lock:
+            self.save_json(file_path, data)
+            signature = _file_signature(file_path)
+            cached = self._json_cache.get(file_path)
+            views = cached[2] if cached is not None and cached[1] is data else {}
+            if signature:
+                self._json_cache[file_path] = (signature, data, views)
+            else:
+                self._json_cache.pop(file_path, None)
+
+    def cached_view(
+        self, file_path: str, name: str, build: Callable[[Dict[str, Any]], Any]
+    ) -> Any:
+        """
+        Return ``build(data)`` for the cached data of a JSON file, built once.
+
+        The view lives in the cache entry and goes away with it when the file
+        is reloaded or replaced. Callers that update a view along with the
+        data must do both inside the data's ``with`` block.
+        """
+        with self._cache_lock:
+            data = self._load_cached_json(file_path)
+            cached = self._json_cache.get(file_path)
+            if cached is None:
+                return build(data)
+            views = cached[2]
+            if name not in views:
+                views[name] = build(data)
+            return views[name]
+
+    @contextmanager
+    def _locked_json(self, file_path: str, save: bool) -> Iterator[Dict[str, Any]]:
+        """
+        Hold the cache lock around the cached data of a JSON file.
+
+        With ``save`` the data is written back when the block exits normally.
+        If the block raises, the cached copy is dropped so that a half-made
+        change is not served or saved later.
+        """
+        with self._cache_lock:
+            data = self._load_cached_json(file_path)
+            try:
+                yield data
+            except BaseException:
+                self._json_cache.pop(file_path, None)
+                raise
+            if save:
+                self._save_cached_json(file_path, data)
+
     # Data accessor methods
+    def drink_data(self, save: bool = False):
+        """
+        Context manager giving the shared, cached drink tracking data.
+
+        No other thread reads or changes the data while the block runs, so it
+        may be modified in place; pass ``save=True`` to write it back.
+        """
+        return self._locked_json(self.drink_data_file, save)
+
     def load_drink_data(self) -> Dict[str, Any]:
-        """Load drink tracking data."""
-        return self.load_json(self.drink_data_file)
+        """Load a private copy of the drink tracking data."""
+        with self._cache_lock:
+            return copy.deepcopy(self._load_cached_json(self.drink_data_file))
 
     def save_drink_data(self, data: Dict[str, Any]):
         """Save drink tracking data."""
-        self.save_json(self.drink_data_file, data)
+        self._save_cached_json(self.drink_data_file, data)
+
+    def general_words_data(self, save: bool = False):
+        """Context manager giving the shared general words data (see drink_data)."""
+        return self._locked_json(self.general_words_file, save)
 
     def load_general_words_data(self) -> Dict[str, Any]:
-        """Load general words data."""
-        return self.load_json(self.general_words_file)
+        """Load a private copy of the general words data."""
+        with self._cache_lock:
+            return copy.deepcopy(self._load_cached_json(self.general_words_file))
 
     def save_general_words_data(self, data: Dict[str, Any]):
         """Save general words data."""
-        self.save_json(self.general_words_file, data)
+        self._save_cached_json(self.general_words_file, data)
 
     def load_tamagotchi_state(self) -> Dict[str, Any]:
         """Load tamagotchi state data from merged state.json."""
@@ -231,7 +340,9 @@ class DataManager:
         state_data["drink_tracking_opt_out"] = data
 
         # Save the full state file
-        self.update_state_section("drink_tracking_opt_out", data)
+        with self._cache_lock:
+            self._opt_out_cache = None
+            self.update_state_section("drink_tracking_opt_out", data)
 
     def is_user_opted_out(self, server: str, nick: str) -> bool:
         """
@@ -244,9 +355,22 @@ class DataManager:
         Returns:
             True if user has opted out, False otherwise
         """
-        opt_out_data = self.load_drink_tracking_opt_out_state()
-        server_opts = opt_out_data.get(server, [])
-        return nick.lower() in [n.lower() for n in server_opts]
+        return nick.lower() in self._opted_out_nicks().get(server, ())
+
+    def _opted_out_nicks(self) -> Dict[str, Set[str]]:
+        """Lower-cased opted-out nicks per server, re-read when state.json changes."""
+        with self._cache_lock:
+            signature = _file_signature(self.state_file)
+            if self._opt_out_cache is not None and self._opt_out_cache[0] == signature:
+                return self._opt_out_cache[1]
+            nicks = {
+                server: {nick.lower() for nick in server_opts}
+                for server, server_opts in (
+                    self.load_drink_tracking_opt_out_state().items()
+                )
+            }
+            self._opt_out_cache = (signature, nicks) if signature else None
+            return nicks
 
     def set_user_opt_out(self, server: str, nick: str, opt_out: bool = True) -> bool:
         """
@@ -491,8 +615,8 @@ class DataManager:
         """
         Return a list of all server names present in general words data.
         """
-        data = self.load_general_words_data()
-        return list(data.get("servers", {}).keys())
+        with self.general_words_data() as data:
+            return list(data.get("servers", {}).keys())
 
     # AI Teachings methods
     def load_ai_teachings(
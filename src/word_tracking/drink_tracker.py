@@ -7,12 +7,81 @@ Supports per-server tracking and rich statistics.
 
 import re
 from collections import Counter
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.logger import get_logger
 
 from .data_manager import DataManager
+from .pattern_matcher import PatternMatcher
+
+# What may follow a drink word: "(specific drink)" and "@ HH:MM", both optional
+_DRINK_TAIL = re.compile(r"\s*(?:\(([^)]+)\))?\s*(?:@\s*(\d{1,2}:\d{2}))?(?!\w)")
+
+
+def _starts_entry(text: str, start: int) -> bool:
+    """True if ``start`` is the beginning of the text or follows "|" and spaces."""
+    if start == 0:
+        return True
+    before = start
+    while before and text[before - 1].isspace():
+        before -= 1
+    return before > 0 and text[before - 1] == "|"
+
+
+# Drink counters are kept per hour for HOURLY_RETENTION, then folded into days
+HOUR_KEY = "%Y-%m-%dT%H"
+DAY_KEY = "%Y-%m-%d"
+HOURLY_RETENTION = timedelta(hours=48)
+
+
+def _add_to_buckets(
+    buckets: Dict[str, Any], specific_drink: str, when: datetime, count: int = 1
+) -> None:
+    """Count a drink in the hour bucket of ``when``."""
+    drinks = buckets.setdefault("hours", {}).setdefault(when.strftime(HOUR_KEY), {})
+    drinks[specific_drink] = drinks.get(specific_drink, 0) + count
+
+
+def _compact_buckets(buckets: Dict[str, Any], now: datetime) -> None:
+    """Merge hour buckets older than HOURLY_RETENTION into day totals."""
+    cutoff = (now - HOURLY_RETENTION).strftime(HOUR_KEY)
+    hours = buckets.setdefault("hours", {})
+    days = buckets.setdefault("days", {})
+    for hour in [hour for hour in hours if hour < cutoff]:
+        day = days.setdefault(hour.split("T")[0], {})
+        for specific_drink, count in hours.pop(hour).items():
+            day[specific_drink] = day.get(specific_drink, 0) + count
+
+
+def _buckets_from_timestamps(user_data: Dict[str, Any], now: datetime) -> Dict:
+    """Build buckets from the (capped) timestamp history of older data."""
+    buckets = {"hours": {}, "days": {}}
+    for drink_data in user_data.get("drink_words", {}).values():
+        for entry in drink_data.get("timestamps", []):
+            try:
+                when = datetime.fromisoformat(entry.get("time", ""))
+            except (AttributeError, TypeError, ValueError):
+                continue
+            _add_to_buckets(buckets, entry.get("specific_drink", "unspecified"), when)
+    _compact_buckets(buckets, now)
+    return buckets
+
+
+def count_buckets_since(buckets: Dict[str, Any], since: datetime) -> Counter:
+    """
+    Drinks per specific drink recorded at or after ``since``.
+
+    The window starts at the beginning of the hour (for recent data) or day
+    (for compacted data) that contains ``since``.
+    """
+    counts = Counter()
+    for section, key_format in (("hours", HOUR_KEY), ("days", DAY_KEY)):
+        cutoff = since.strftime(key_format)
+        for key, drinks in buckets.get(section, {}).items():
+            if key >= cutoff:
+                counts.update(drinks)
+    return counts
 
 
 class DrinkTracker:
@@ -47,15 +116,11 @@ class DrinkTracker:
         }
         self._load_custom_drink_words()
 
-        # Regex pattern for detecting drink words with specific drinks and optional opening time
+        # Drink words are found with a multi-pattern matcher; _DRINK_TAIL then
+        # reads the optional drink and opening time after each word.
         # Matches: "krak (Karhu 5,5%)" or "krak (karhu)" or "krak (5,0% 0.5L) @ 02:15" or just "krak"
         # Allows multiple drink entries when separated with "|".
-        self.drink_pattern = re.compile(
-            r"(?:^|\|\s*)("
-            + "|".join(self.drink_words)
-            + r")\s*(?:\(([^)]+)\))?\s*(?:@\s*(\d{1,2}:\d{2}))?(?!\w)",
-            re.IGNORECASE,
-        )  # noqa: E501
+        self.drink_matcher = PatternMatcher((word, None) for word in self.drink_words)
 
         # Standard drink definition
         self.STANDARD_DRINK_GRAMS = 12.2  # Standard krak = 12.2g pure alcohol
@@ -67,11 +132,11 @@ class DrinkTracker:
 
     def _load_custom_drink_words(self) -> None:
         """Load persisted custom drink words into the active matcher set."""
-        data = self.data_manager.load_drink_data()
-        for server_data in data.get("servers", {}).values():
-            mappings = server_data.get("drink_word_mappings", {})
-            if isinstance(mappings, dict):
-                self.drink_words.update(word.lower() for word in mappings)
+        with self.data_manager.drink_data() as data:
+            for server_data in data.get("servers", {}).values():
+                mappings = server_data.get("drink_word_mappings", {})
+                if isinstance(mappings, dict):
+                    self.drink_words.update(word.lower() for word in mappings)
 
     def add_drink_word_mapping(
         self, word: str, drink_name: str, server: str = "console"
@@ -82,24 +147,16 @@ class DrinkTracker:
         if not word or not drink_name or not re.fullmatch(r"\w+", word):
             return False
 
-        data = self.data_manager.load_drink_data()
-        data.setdefault("servers", {})
-        server_data = data["servers"].setdefault(server, {"nicks": {}})
-        server_data.setdefault("nicks", {})
-        mappings = server_data.setdefault("drink_word_mappings", {})
-        mappings[word] = drink_name
-        data["last_updated"] = datetime.now().isoformat()
-        self.data_manager.save_drink_data(data)
+        with self.data_manager.drink_data(save=True) as data:
+            data.setdefault("servers", {})
+            server_data = data["servers"].setdefault(server, {"nicks": {}})
+            server_data.setdefault("nicks", {})
+            mappings = server_data.setdefault("drink_word_mappings", {})
+            mappings[word] = drink_name
+            data["last_updated"] = datetime.now().isoformat()
 
         self.drink_words.add(word)
-        self.drink_pattern = re.compile(
-            r"(?:^|\|\s*)("
-            + "|".join(
-                re.escape(w) for w in sorted(self.drink_words, key=len, reverse=True)
-            )
-            + r")\s*(?:\(([^)]+)\))?\s*(?:@\s*(\d{1,2}:\d{2}))?(?!\w)",
-            re.IGNORECASE,
-        )
+        self.drink_matcher.add(word)
         return True
 
     def set_alko_service(self, alko_service):
@@ -129,34 +186,69 @@ class DrinkTracker:
         if self.data_manager.is_user_opted_out(server, nick):
             return []
 
-        # Find all drink word matches
-        matches = []
-        for match in self.drink_pattern.finditer(text):
-            drink_word = match.group(1).lower()
-            specific_drink = match.group(2) if match.group(2) else "unspecified"
-            opened_time = match.group(3) if match.group(3) else None
-            if specific_drink == "unspecified":
-                mappings = (
-                    self.data_manager.load_drink_data()
-                    .get("servers", {})
-                    .get(server, {})
-                    .get("drink_word_mappings", {})
-                )
-                specific_drink = mappings.get(drink_word, specific_drink)
-
-            # Clean up specific drink name
-            if specific_drink != "unspecified":
-                specific_drink = specific_drink.strip()
+        found = self._find_drink_words(text)
+        if not found:
+            return []
 
-            # Parse alcohol content from drink description
-            alcohol_grams = self._parse_alcohol_content(specific_drink)
+        # One load serves the mappings and every recorded match; one save at the end
+        drinks = []
+        with self.data_manager.drink_data(save=True) as data:
+            mappings = (
+                data.get("servers", {}).get(server, {}).get("drink_word_mappings", {})
+            )
 
-            matches.append((drink_word, specific_drink, alcohol_grams, opened_time))
+            # Find all drink word matches
+            for drink_word, match in found:
+                specific_drink = match.group(1) if match.group(1) else "unspecified"
+                opened_time = match.group(2) if match.group(2) else None
+                if specific_drink == "unspecified":
+                    specific_drink = mappings.get(drink_word, specific_drink)
+
+                # Clean up specific drink name
+                if specific_drink != "unspecified":
+                    specific_drink = specific_drink.strip()
+
+                drinks.append((drink_word, specific_drink, opened_time))
+
+                # Record the drink word
+                self._add_drink_word(data, server, nick, drink_word, specific_drink)
+
+        # Parse alcohol content from drink descriptions, outside the data lock
+        return [
+            (
+                drink_word,
+                specific_drink,
+                self._parse_alcohol_content(specific_drink),
+                opened_time,
+            )
+            for drink_word, specific_drink, opened_time in drinks
+        ]
 
-            # Record the drink word
-            self._record_drink_word(server, nick, drink_word, specific_drink)
+    def _find_drink_words(self, text: str) -> List[Tuple[str, "re.Match"]]:
+        """
+        Find drink words that start the message or follow a "|" separator.
 
-        return matches
+        Returns:
+            List of (drink_word, tail_match) where the tail match holds the
+            optional specific drink and opening time groups
+        """
+        candidates: Dict[int, List[int]] = {}
+        for start, end, _ in self.drink_matcher.finditer(text):
+            candidates.setdefault(start, []).append(end)
+
+        found = []
+        position = 0
+        for start in sorted(candidates):
+            if start < position or not _starts_entry(text, start):
+                continue
+            # Prefer the longest word starting here, as the old alternation did
+            for end in sorted(candidates[start], reverse=True):
+                tail = _DRINK_TAIL.match(text, end)
+                if tail:
+                    found.append((text[start:end].lower(), tail))
+                    position = tail.end()
+                    break
+        return found
 
     def _record_drink_word(
         self, server: str, nick: str, drink_word: str, specific_drink: str
@@ -170,8 +262,18 @@ class DrinkTracker:
             drink_word: The drink word (e.g., "krak")
             specific_drink: The specific drink (e.g., "Karhu 5,5%")
         """
-        data = self.data_manager.load_drink_data()
+        with self.data_manager.drink_data(save=True) as data:
+            self._add_drink_word(data, server, nick, drink_word, specific_drink)
 
+    def _add_drink_word(
+        self,
+        data: Dict[str, Any],
+        server: str,
+        nick: str,
+        drink_word: str,
+        specific_drink: str,
+    ):
+        """Update loaded drink data with one drink word occurrence (no saving)."""
         # Set statistics_started if this is the first drink word ever recorded
         if "statistics_started" not in data:
             data["statistics_started"] = datetime.now().isoformat()
@@ -205,6 +307,14 @@ class DrinkTracker:
             }
 
         drink_data = user_data["drink_words"][drink_word]
+        now = datetime.now()
+
+        # Time-bucketed counters; seeded from the timestamp history the first
+        # time a user is recorded after buckets were introduced
+        if "buckets" not in user_data:
+            user_data["buckets"] = _buckets_from_timestamps(user_data, now)
+        _add_to_buckets(user_data["buckets"], specific_drink, now)
+        _compact_buckets(user_data["buckets"], now)
 
         # Update counts
         drink_data["total"] += 1
@@ -213,7 +323,7 @@ class DrinkTracker:
         drink_data["drinks"][specific_drink] += 1
 
         # Add timestamp
-        timestamp = datetime.now().isoformat()
+        timestamp = now.isoformat()
         drink_data["timestamps"].append(
             {"time": timestamp, "specific_drink": specific_drink}
         )
@@ -228,9 +338,6 @@ class DrinkTracker:
             dw["total"] for dw in user_data["drink_words"].values()
         )
 
-        # Save data
-        self.data_manager.save_drink_data(data)
-
     def _parse_alcohol_content(self, drink_description: str) -> float:
         """
         Parse alcohol content from drink description.
@@ -412,6 +519,8 @@ class DrinkTracker:
                 "drink_words": user_data.get("drink_words", {}),
                 "first_seen": user_data.get("first_seen", ""),
                 "last_activity": user_data.get("last_activity", ""),
+                "buckets": user_data.get("buckets")
+                or _buckets_from_timestamps(user_data, datetime.now()),
             }
         except KeyError:
             return {
@@ -421,6 +530,7 @@ class DrinkTracker:
                 "drink_words": {},
                 "first_seen": "",
                 "last_activity": "",
+                "buckets": {"hours": {}, "days": {}},
             }
 
     def get_server_stats(self, server: str) -> Dict[str, Any]:
@@ -770,18 +880,19 @@ class DrinkTracker:
         Returns:
             True if reset was successful, False otherwise
         """
-        data = self.data_manager.load_drink_data()
-
+        # Edit the shared data under its lock so drinks recorded meanwhile
+        # are not lost; a failed edit makes drink_data drop the cached copy
         try:
-            if server in data.get("servers", {}):
-                nicks = data["servers"][server].get("nicks", {})
-                if nick in nicks:
-                    del nicks[nick]
-                    # Clean up empty server entries
-                    if not nicks:
-                        del data["servers"][server]
-                    self.data_manager.save_drink_data(data)
-                    return True
+            with self.data_manager.drink_data() as data:
+                if server in data.get("servers", {}):
+                    nicks = data["servers"][server].get("nicks", {})
+                    if nick in nicks:
+                        del nicks[nick]
+                        # Clean up empty server entries
+                        if not nicks:
+                            del data["servers"][server]
+                        self.data_manager.save_drink_data(data)
+                        return True
         except Exception as e:
             self.logger.error(f"Error resetting drink stats for {nick}: {e}")
 
@@ -5,16 +5,103 @@ Handles general word counting functionality (renamed from tamagotchi).
 Provides server-specific word tracking and statistics.
 """
 
+import copy
+import heapq
 import re
 from collections import Counter
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from src.logger import get_logger as log
 
 from .data_manager import DataManager
 
 
+class _TopK:
+    """
+    Exact top-k over counters that only grow.
+
+    Keeps the ``size`` largest counters seen so far. When a counter outside
+    the table grows past the smallest one inside, the two swap; since counts
+    never decrease, nothing outside can ever exceed a member.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.top: Dict[Hashable, int] = {}
+        self._floor_key: Optional[Hashable] = None
+
+    def update(self, key: Hashable, count: int) -> None:
+        """Report the new value of a counter."""
+        top = self.top
+        if key in top:
+            top[key] = count
+            if key == self._floor_key:
+                self._floor_key = None
+        elif len(top) < self.size:
+            top[key] = count
+            self._floor_key = None
+        else:
+            if self._floor_key is None:
+                self._floor_key = min(top, key=top.__getitem__)
+            if count > top[self._floor_key]:
+                del top[self._floor_key]
+                top[key] = count
+                self._floor_key = None
+
+    def most_common(self, limit: int) -> List[Tuple[Hashable, int]]:
+        return sorted(self.top.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+class _WordAggregates:
+    """
+    Per-server and global totals for one loaded general words dataset.
+
+    Kept as a DataManager cached view of the dataset, so trackers sharing a
+    DataManager share the aggregates and a reloaded dataset gets fresh ones.
+    """
+
+    TOP_SIZE = 50
+
+    def __init__(self, data: Dict[str, Any]):
+        self.server_totals: Dict[str, int] = Counter()
+        self.server_words: Dict[str, Counter] = {}
+        self.server_top_users: Dict[str, _TopK] = {}
+        self.server_top_words: Dict[str, _TopK] = {}
+        self.global_words = Counter()
+        self.global_top_users = _TopK(self.TOP_SIZE)
+        self.global_top_words = _TopK(self.TOP_SIZE)
+
+        for server, server_data in (data.get("servers") or {}).items():
+            for nick, user_data in (server_data.get("nicks") or {}).items():
+                total = user_data.get("total_words", 0)
+                self.add(server, nick, total, user_data.get("general_words", {}), total)
+
+    def add(
+        self,
+        server: str,
+        nick: str,
+        user_total: int,
+        counts: Dict[str, int],
+        added: int,
+    ) -> None:
+        """Add ``added`` words (``counts`` per word) to a user now at ``user_total``."""
+        if server not in self.server_words:
+            self.server_words[server] = Counter()
+            self.server_top_users[server] = _TopK(self.TOP_SIZE)
+            self.server_top_words[server] = _TopK(self.TOP_SIZE)
+        server_words = self.server_words[server]
+        server_top_words = self.server_top_words[server]
+        for word, count in counts.items():
+            server_words[word] += count
+            self.global_words[word] += count
+            server_top_words.update(word, server_words[word])
+            self.global_top_words.update(word, self.global_words[word])
+        self.server_totals[server] += added
+        self.server_top_users[server].update(nick, user_total)
+        self.global_top_users.update((server, nick), user_total)
+
+
 class GeneralWords:
     """General word counting and tracking functionality."""
 
@@ -29,6 +116,12 @@ class GeneralWords:
         self.data_manager = data_manager
         self.lemmatizer = lemmatizer
 
+    def _aggregates(self) -> _WordAggregates:
+        """Aggregates of the cached dataset; use inside general_words_data()."""
+        return self.data_manager.cached_view(
+            self.data_manager.general_words_file, "aggregates", _WordAggregates
+        )
+
     def process_message(self, server: str, nick: str, text: str, target: str = None):
         """
         Process a message for general word tracking.
@@ -73,49 +166,49 @@ class GeneralWords:
             words: List of words to count
             target: Channel or target where message was sent
         """
-        data = self.data_manager.load_general_words_data()
-
-        # Ensure structure exists
-        if "servers" not in data:
-            data["servers"] = {}
-
-        if server not in data["servers"]:
-            data["servers"][server] = {"nicks": {}}
-
-        if "nicks" not in data["servers"][server]:
-            data["servers"][server]["nicks"] = {}
-
-        if nick not in data["servers"][server]["nicks"]:
-            data["servers"][server]["nicks"][nick] = {
-                "general_words": {},
-                "first_seen": datetime.now().isoformat(),
-                "last_activity": datetime.now().isoformat(),
-                "total_words": 0,
-                "channels": {},
-            }
-
-        user_data = data["servers"][server]["nicks"][nick]
+        with self.data_manager.general_words_data(save=True) as data:
+            aggregates = self._aggregates()
+
+            # Ensure structure exists
+            if "servers" not in data:
+                data["servers"] = {}
+
+            if server not in data["servers"]:
+                data["servers"][server] = {"nicks": {}}
+
+            if "nicks" not in data["servers"][server]:
+                data["servers"][server]["nicks"] = {}
+
+            if nick not in data["servers"][server]["nicks"]:
+                data["servers"][server]["nicks"][nick] = {
+                    "general_words": {},
+                    "first_seen": datetime.now().isoformat(),
+                    "last_activity": datetime.now().isoformat(),
+                    "total_words": 0,
+                    "channels": {},
+                }
 
-        # Update word counts
-        for word in words:
-            if word not in user_data["general_words"]:
-                user_data["general_words"][word] = 0
-            user_data["general_words"][word] += 1
+            user_data = data["servers"][server]["nicks"][nick]
 
-        # Update channel-specific stats if target is provided
-        if target:
-            if "channels" not in user_data:
-                user_data["channels"] = {}
-            if target not in user_data["channels"]:
-                user_data["channels"][target] = {"word_count": 0}
-            user_data["channels"][target]["word_count"] += len(words)
+            # Update word counts
+            counts = Counter(words)
+            for word, count in counts.items():
+                user_data["general_words"][word] = (
+                    user_data["general_words"].get(word, 0) + count
+                )
 
-        # Update totals and timestamps
-        user_data["last_activity"] = datetime.now().isoformat()
-        user_data["total_words"] = sum(user_data["general_words"].values())
+            # Update channel-specific stats if target is provided
+            if target:
+                if "channels" not in user_data:
+                    user_data["channels"] = {}
+                if target not in user_data["channels"]:
+                    user_data["channels"][target] = {"word_count": 0}
+                user_data["channels"][target]["word_count"] += len(words)
 
-        # Save data
-        self.data_manager.save_general_words_data(data)
+            # Update totals and timestamps
+            user_data["last_activity"] = datetime.now().isoformat()
+            user_data["total_words"] = user_data.get("total_words", 0) + len(words)
+            aggregates.add(server, nick, user_data["total_words"], counts, len(words))
 
     def get_user_stats(self, server: str, nick: str) -> Dict[str, Any]:
         """
@@ -128,29 +221,28 @@ class GeneralWords:
         Returns:
             Dictionary containing user's word statistics
         """
-        data = self.data_manager.load_general_words_data()
-
-        try:
-            user_data = data["servers"][server]["nicks"][nick]
-            return {
-                "nick": nick,
-                "server": server,
-                "total_words": user_data.get("total_words", 0),
-                "general_words": user_data.get("general_words", {}),
-                "channels": user_data.get("channels", {}),
-                "first_seen": user_data.get("first_seen", ""),
-                "last_activity": user_data.get("last_activity", ""),
-            }
-        except KeyError:
-            return {
-                "nick": nick,
-                "server": server,
-                "total_words": 0,
-                "general_words": {},
-                "channels": {},
-                "first_seen": "",
-                "last_activity": "",
-            }
+        with self.data_manager.general_words_data() as data:
+            try:
+                user_data = copy.deepcopy(data["servers"][server]["nicks"][nick])
+                return {
+                    "nick": nick,
+                    "server": server,
+                    "total_words": user_data.get("total_words", 0),
+                    "general_words": user_data.get("general_words", {}),
+                    "channels": user_data.get("channels", {}),
+                    "first_seen": user_data.get("first_seen", ""),
+                    "last_activity": user_data.get("last_activity", ""),
+                }
+            except KeyError:
+                return {
+                    "nick": nick,
+                    "server": server,
+                    "total_words": 0,
+                    "general_words": {},
+                    "channels": {},
+                    "first_seen": "",
+                    "last_activity": "",
+                }
 
     def get_user_top_words(
         self, server: str, nick: str, limit: int = 10
@@ -169,63 +261,72 @@ class GeneralWords:
         user_stats = self.get_user_stats(server, nick)
         general_words = user_stats["general_words"]
 
-        # Create list of word stats
-        word_list = [
-            {"word": word, "count": count} for word, count in general_words.items()
-        ]
-
-        # Sort by count and return top results
-        return sorted(word_list, key=lambda x: x["count"], reverse=True)[:limit]
+        top_words = heapq.nlargest(
+            limit, general_words.items(), key=lambda item: item[1]
+        )
+        return [{"word": word, "count": count} for word, count in top_words]
 
-    def get_server_stats(self, server: str) -> Dict[str, Any]:
+    def get_server_stats(self, server: str, limit: int = 10) -> Dict[str, Any]:
         """
         Get general word statistics for an entire server.
 
         Args:
             server: Server name
+            limit: Number of top users and top words to include
 
         Returns:
             Dictionary containing server's word statistics
         """
-        data = self.data_manager.load_general_words_data()
+        with self.data_manager.general_words_data() as data:
+            if server not in data.get("servers", {}):
+                return {
+                    "server": server,
+                    "total_users": 0,
+                    "total_words": 0,
+                    "top_users": [],
+                    "top_words": [],
+                }
+
+            server_data = data["servers"][server]["nicks"]
+            aggregates = self._aggregates()
+
+            if limit <= _WordAggregates.TOP_SIZE:
+                top_users = aggregates.server_top_users[server].most_common(limit)
+                top_words = aggregates.server_top_words[server].most_common(limit)
+            else:
+                top_users = heapq.nlargest(
+                    limit,
+                    (
+                        (nick, user.get("total_words", 0))
+                        for nick, user in server_data.items()
+                    ),
+                    key=lambda item: item[1],
+                )
+                top_words = aggregates.server_words[server].most_common(limit)
 
-        if server not in data.get("servers", {}):
             return {
                 "server": server,
-                "total_users": 0,
-                "total_words": 0,
-                "top_users": [],
-                "top_words": [],
+                "total_users": len(server_data),
+                "total_words": aggregates.server_totals[server],
+                "top_users": top_users,
+                "top_words": top_words,
             }
 
-        server_data = data["servers"][server]["nicks"]
-
-        # Calculate totals
-        total_users = len(server_data)
-        total_words = sum(user.get("total_words", 0) for user in server_data.values())
-
-        # Get top users
-        top_users = sorted(
-            [(nick, user.get("total_words", 0)) for nick, user in server_data.items()],
-            key=lambda x: x[1],
-            reverse=True,
-        )[:10]
-
-        # Get top words across all users
-        all_words = Counter()
-        for user_data in server_data.values():
-            general_words = user_data.get("general_words", {})
-            all_words.update(general_words)
+    def get_top_words(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Get the most used words across all servers.
 
-        top_words = [(word, count) for word, count in all_words.most_common(10)]
+        Args:
+            limit: Maximum number of results to return
 
-        return {
-            "server": server,
-            "total_users": total_users,
-            "total_words": total_words,
-            "top_users": top_users,
-            "top_words": top_words,
-        }
+        Returns:
+            List of (word, count) tuples
+        """
+        with self.data_manager.general_words_data():
+            aggregates = self._aggregates()
+            if limit <= _WordAggregates.TOP_SIZE:
+                return aggregates.global_top_words.most_common(limit)
+            return aggregates.global_words.most_common(limit)
 
     def search_word(self, word: str, server_filter: str = None) -> Dict[str, Any]:
         """
@@ -237,43 +338,42 @@ class GeneralWords:
         Returns:
             Dictionary containing statistics for the word
         """
-        data = self.data_manager.load_general_words_data()
         word = word.lower()
-
         results = {"word": word, "total_occurrences": 0, "users": [], "servers": {}}
 
-        servers_to_search = data.get("servers", {})
-        if server_filter:
-            servers_to_search = {
-                server_filter: servers_to_search.get(server_filter, {})
-            }
+        with self.data_manager.general_words_data() as data:
+            servers_to_search = data.get("servers", {})
+            if server_filter:
+                servers_to_search = {
+                    server_filter: servers_to_search.get(server_filter, {})
+                }
 
-        for server_name, server_data in servers_to_search.items():
-            server_total = 0
-            server_users = []
+            for server_name, server_data in servers_to_search.items():
+                server_total = 0
+                server_users = []
 
-            for nick, user_data in server_data.get("nicks", {}).items():
-                general_words = user_data.get("general_words", {})
-                if word in general_words:
-                    user_total = general_words[word]
+                for nick, user_data in server_data.get("nicks", {}).items():
+                    general_words = user_data.get("general_words", {})
+                    if word in general_words:
+                        user_total = general_words[word]
 
-                    server_total += user_total
-                    results["total_occurrences"] += user_total
+                        server_total += user_total
+                        results["total_occurrences"] += user_total
 
-                    user_info = {
-                        "nick": nick,
-                        "server": server_name,
-                        "count": user_total,
-                    }
+                        user_info = {
+                            "nick": nick,
+                            "server": server_name,
+                            "count": user_total,
+                        }
 
-                    server_users.append(user_info)
-                    results["users"].append(user_info)
+                        server_users.append(user_info)
+                        results["users"].append(user_info)
 
-            if server_total > 0:
-                results["servers"][server_name] = {
-                    "total": server_total,
-                    "users": server_users,
-                }
+                if server_total > 0:
+                    results["servers"][server_name] = {
+                        "total": server_total,
+                        "users": server_users,
+                    }
 
         # Sort users by count
         results["users"] = sorted(
@@ -295,36 +395,40 @@ class GeneralWords:
         Returns:
             List of dictionaries containing user statistics
         """
-        data = self.data_manager.load_general_words_data()
-
-        users = []
-
-        if server:
-            # Server-specific leaderboard
-            if server in data.get("servers", {}):
-                server_data = data["servers"][server]["nicks"]
-                for nick, user_data in server_data.items():
-                    users.append(
-                        {
-                            "nick": nick,
-                            "server": server,
-                            "total_words": user_data.get("total_words", 0),
-                        }
-                    )
-        else:
-            # Global leaderboard
-            for server_name, server_data in data.get("servers", {}).items():
-                for nick, user_data in server_data.get("nicks", {}).items():
-                    users.append(
-                        {
-                            "nick": nick,
-                            "server": server_name,
-                            "total_words": user_data.get("total_words", 0),
-                        }
-                    )
+        with self.data_manager.general_words_data() as data:
+            servers = data.get("servers", {})
+            if server and (server not in servers or "nicks" not in servers[server]):
+                return []
+
+            aggregates = self._aggregates()
+            if limit <= _WordAggregates.TOP_SIZE:
+                if server:
+                    # Server-specific leaderboard
+                    top = [
+                        ((server, nick), total)
+                        for nick, total in aggregates.server_top_users[
+                            server
+                        ].most_common(limit)
+                    ]
+                else:
+                    # Global leaderboard
+                    top = aggregates.global_top_users.most_common(limit)
+            else:
+                top = heapq.nlargest(
+                    limit,
+                    (
+                        ((server_name, nick), user_data.get("total_words", 0))
+                        for server_name, server_data in servers.items()
+                        if not server or server_name == server
+                        for nick, user_data in server_data.get("nicks", {}).items()
+                    ),
+                    key=lambda item: item[1],
+                )
 
-        # Sort by total words and return top results
-        return sorted(users, key=lambda x: x["total_words"], reverse=True)[:limit]
+        return [
+            {"nick": nick, "server": server_name, "total_words": total}
+            for (server_name, nick), total in top
+        ]
 
     # =====================
     # Single-word command helpers
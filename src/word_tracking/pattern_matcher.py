@@ -0,0 +1,123 @@
+"""
+Multi-pattern Matcher
+
+Aho-Corasick automaton for finding many fixed words in a message with a
+single pass over the text. Used by the drink tracker for drink words and by
+the tamagotchi for its trigger words.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+class PatternMatcher:
+    """Case-insensitive substring matcher for a growing set of patterns."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]] = ()):
+        """
+        Initialize the matcher.
+
+        Args:
+            patterns: Optional (pattern, value) pairs to add
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Patterns ending at each node, and those plus the ones ending at
+        # its failure chain (filled in by _compile).
+        self._terminal: List[List[Tuple[int, Any]]] = [[]]
+        self._outputs: List[List[Tuple[int, Any]]] = [[]]
+        self._patterns: Dict[Tuple[str, Any], None] = {}
+        self._compiled = True
+        for pattern, value in patterns:
+            self.add(pattern, value)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, pattern: str) -> bool:
+        node = 0
+        for char in pattern.lower():
+            node = self._goto[node].get(char)
+            if node is None:
+                return False
+        return bool(self._terminal[node])
+
+    def add(self, pattern: str, value: Any = None) -> bool:
+        """
+        Add a pattern; matches report ``value`` (the pattern itself if None).
+
+        Adding is cheap: the trie grows in place and the failure links are
+        rebuilt on the next search, in time linear in the total pattern length.
+
+        Returns:
+            False if the pattern is empty or the pair is already present
+        """
+        pattern = pattern.lower()
+        value = pattern if value is None else value
+        if not pattern or (pattern, value) in self._patterns:
+            return False
+        self._patterns[(pattern, value)] = None
+
+        node = 0
+        for char in pattern:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._terminal.append([])
+            node = child
+        self._terminal[node].append((len(pattern), value))
+        self._compiled = False
+        return True
+
+    def _compile(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        self._outputs = [list(outputs) for outputs in self._terminal]
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._outputs[child] = (
+                    self._terminal[child] + self._outputs[self._fail[child]]
+                )
+                queue.append(child)
+        self._compiled = True
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """
+        Yield (start, end, value) for every occurrence, overlapping ones
+        included, ordered by end position. Offsets index the original text.
+        """
+        if not self._compiled:
+            self._compile()
+        lowered = text.lower()
+        origin = None
+        if len(lowered) != len(text):
+            # Some characters lower-case to several; map offsets back.
+            origin = [i for i, char in enumerate(text) for _ in char.lower()]
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        node = 0
+        for index, char in enumerate(lowered):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, value in outputs[node]:
+                start, end = index + 1 - length, index + 1
+                if origin is not None:
+                    start, end = origin[start], origin[end - 1] + 1
+                yield start, end, value
+
+    def values_in(self, text: str) -> List[Any]:
+        """Distinct values of the patterns found in ``text``, in match order."""
+        return list(dict.fromkeys(value for _, _, value in self.finditer(text)))
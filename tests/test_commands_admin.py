@@ -296,3 +296,67 @@ class TestIgnoreCommand:
             admin_privileged.ignore_command_command(context, {})
             == "❌ Invalid admin password"
         )
+
+
+class TestLogsearchCommand:
+    """Tests for the !logsearch privileged admin command."""
+
+    def test_logsearch_lists_records_in_range(self, tmp_path, monkeypatch):
+        from datetime import datetime
+
+        import logger
+        from cmd_modules import admin_privileged
+        from structured_log import StructuredLogSink
+
+        path = str(tmp_path / "leet.jsonl")
+        base = datetime(2026, 10, 17, 13, 36)
+        sink = StructuredLogSink(path)
+        sink.write_batch(
+            [
+                (
+                    int((base.timestamp() + minute * 60) * 1_000_000_000),
+                    "SERVER",
+                    "libera",
+                    f":nick!u@h PRIVMSG #kanava :viesti {minute}",
+                )
+                for minute in range(4)
+            ]
+        )
+        sink.close()
+        monkeypatch.setattr(
+            admin_privileged,
+            "get_config",
+            lambda: SimpleNamespace(admin_password="secret"),
+        )
+        monkeypatch.setattr(logger, "get_structured_sink", lambda: sink)
+
+        context = CommandContext(
+            command="logsearch",
+            args=["secret", "2026-10-17T13:37", "2026-10-17T13:38", "viesti"],
+            raw_message="!logsearch secret 2026-10-17T13:37 2026-10-17T13:38 viesti",
+            is_console=False,
+        )
+        result = admin_privileged.logsearch_command(context, {})
+
+        assert result.splitlines() == [
+            "🔎 2 log records matching 'viesti'",
+            "2026-10-17 13:37:00 [SERVER] [libera] [#kanava]"
+            " :nick!u@h PRIVMSG #kanava :viesti 1",
+            "2026-10-17 13:38:00 [SERVER] [libera] [#kanava]"
+            " :nick!u@h PRIVMSG #kanava :viesti 2",
+        ]
+
+        context.args = ["secret", "2026-10-18", "2026-10-18"]
+        assert (
+            admin_privileged.logsearch_command(context, {})
+            == "🔎 No log records in that range"
+        )
+        context.args = ["secret", "eilen", "13:38"]
+        assert admin_privileged.logsearch_command(context, {}).startswith(
+            "❌ Invalid time"
+        )
+        context.args = ["wrong", "13:37", "13:38"]
+        assert (
+            admin_privileged.logsearch_command(context, {})
+            == "❌ Invalid admin password"
+        )
@@ -213,3 +213,45 @@ class TestAlkoHalvinCommand:
 
         result = alko_command(console_context, mock_bot_functions)
         assert "Error finding cheapest products" in result
+
+    def test_alko_command_faceted_ranking(self, console_context, mock_bot_functions):
+        """Ranking keywords with filters go to query_products."""
+        from cmd_modules.services import alko_command
+
+        console_context.args_text = "cheapest 3 ciders under 6%"
+        console_context.args = console_context.args_text.split()
+
+        mock_alko_service = Mock()
+        mock_alko_service.query_products.return_value = [
+            {
+                "name": "Kuiva Siideri",
+                "price": 2.00,
+                "alcohol_grams": 12.2,
+                "value_ratio": 6.1,
+                "bottle_size_raw": "0.33 l",
+                "alcohol_percent": 4.7,
+            }
+        ]
+        mock_bot_functions = {"get_alko_service": lambda: mock_alko_service}
+
+        result = alko_command(console_context, mock_bot_functions)
+        assert result == (
+            "🍺 Halvimmat juomat arvoltaan:\n"
+            "1. Kuiva Siideri 0.33 l 4.7% (12.2g) - 2.00€ (arvo: 6.10g/€)"
+        )
+        mock_alko_service.query_products.assert_called_once_with(
+            "value", 3, max_abv=6.0, product_type="siider"
+        )
+
+        console_context.args_text = "litrahinta viinit 3l"
+        mock_alko_service.query_products.return_value = []
+        result = alko_command(console_context, mock_bot_functions)
+        assert result == "🍺 Ei hakuehtoja vastaavia tuotteita"
+        mock_alko_service.query_products.assert_called_with(
+            "litre", 5, min_size=3.0, max_size=3.0, product_type="viinit"
+        )
+
+        console_context.args_text = "vahvin alle x"
+        assert alko_command(console_context, mock_bot_functions) == (
+            "🍺 Invalid filter: alle x"
+        )
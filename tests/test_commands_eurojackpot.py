@@ -102,3 +102,25 @@ class TestEurojackpotCommand:
 
             assert "Eurojackpot error" in result
             assert "Service error" in result
+
+    def test_eurojackpot_command_backtest(self, console_context, mock_bot_functions):
+        """Backtest subcommand passes strategy and window to the service."""
+        from cmd_modules.services import command_eurojackpot
+
+        console_context.args = ["backtest", "hot", "20"]
+        service = Mock()
+        service.backtest_strategy.return_value = {
+            "success": True,
+            "message": "🎯 Backtest hot",
+        }
+        with patch(
+            "services.eurojackpot_service.get_eurojackpot_service",
+            return_value=service,
+        ):
+            result = command_eurojackpot(console_context, mock_bot_functions)
+
+        assert result == "🎯 Backtest hot"
+        service.backtest_strategy.assert_called_once_with("hot", window=20)
+
+        console_context.args = ["backtest"]
+        assert "Usage" in command_eurojackpot(console_context, mock_bot_functions)
@@ -184,6 +184,28 @@ class TestKrakstatsCommand:
 
         assert callable(krakstats_command)
 
+    def test_krakstats_counts_more_than_timestamp_history(
+        self, console_context, tmp_path
+    ):
+        """Windowed counts are not limited by the 100-entry timestamp list."""
+        from cmd_modules.word_tracking import krakstats_command
+        from word_tracking import DataManager, DrinkTracker
+
+        tracker = DrinkTracker(DataManager(str(tmp_path)))
+        for _ in range(120):
+            tracker._record_drink_word("console", "alice", "krak", "Karhu")
+        console_context.sender = "alice"
+
+        result = krakstats_command(console_context, {"drink_tracker": tracker})
+
+        lines = result.splitlines()
+        assert lines[0] == (
+            "🐧 alice krak statistics: Total kraks: 120 | Last 30 days: 120"
+            " | Last week: 120 | Last 24h: 120"
+        )
+        assert "Drink types: Karhu: 120" in lines
+        assert "Last 24h drink types: Karhu: 120" in lines
+
 
 class TestKraksdebugCommand:
     """Tests for the !kraksdebug command."""
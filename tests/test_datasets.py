@@ -0,0 +1,71 @@
+import json
+
+from src.datasets import (
+    DatasetRegistry,
+    NameDays,
+    TransformationIndex,
+    build_transformations,
+)
+
+
+def test_registry_reuses_result_until_file_changes(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({"a": "b"}), encoding="utf-8")
+    registry = DatasetRegistry()
+    calls = []
+
+    def builder(file_path):
+        calls.append(file_path)
+        with open(file_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    first = registry.get(str(path), builder)
+    assert registry.get(str(path), builder) is first
+    assert len(calls) == 1
+
+    path.write_text(json.dumps({"a": "b", "c": "d"}), encoding="utf-8")
+    assert registry.get(str(path), builder) == {"a": "b", "c": "d"}
+    assert len(calls) == 2
+
+    registry.invalidate(str(path))
+    registry.get(str(path), builder)
+    assert len(calls) == 3
+
+
+def test_transformation_search_matches_linear_scan(tmp_path):
+    pairs = {
+        "Kalja kuppi": "kuppa kalji",
+        "lokki kivellä": "kikki lovella",
+        "Mätti": "hillittömästi",
+        "ab": "ba",
+    }
+    path = tmp_path / "muunnokset.json"
+    path.write_text(json.dumps(pairs, ensure_ascii=False), encoding="utf-8")
+    index = build_transformations(str(path))
+
+    for term in ["kal", "a", "ll", "ÄTT", "kikki l", "zzz", "ba"]:
+        term = term.lower()
+        expected = [
+            (original, transformed)
+            for original, transformed in pairs.items()
+            if term in original.lower() or term in transformed.lower()
+        ]
+        assert index.search(term) == expected
+    assert len(TransformationIndex({})) == 0
+
+
+def test_name_days_index_by_day_and_name():
+    name_days = NameDays(
+        {
+            "_scrape_timestamp": "2025-01-01T00:00:00",
+            "01-02": {"official": ["Aapeli"], "unofficial": []},
+            "02-02": {"official": ["Ansgar", "Aapo"]},
+            "bad": {"official": ["Aaro"]},
+        }
+    )
+
+    assert name_days.timestamp == "2025-01-01T00:00:00"
+    assert "_scrape_timestamp" not in name_days.entries
+    assert name_days.official.by_day[2] == [(1, ["Aapeli"]), (2, ["Ansgar", "Aapo"])]
+    assert name_days.official.search("aap") == [(1, 2, "Aapeli"), (2, 2, "Aapo")]
+    assert name_days.official.names_on("02-02") == ["Ansgar", "Aapo"]
@@ -4,6 +4,7 @@ Tests for drug data APIs and services.
 """
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -122,3 +123,93 @@ class TestDrugService:
         assert isinstance(result, dict)
         assert result["interactions"] == [("cannabis", "alcohol", "Caution")]
         assert result["warnings"]
+
+    def test_indexed_lookups(self, drug_service):
+        """Alias, substring and category lookups go through the index."""
+        assert drug_service.get_drug_info("Weed")["name"] == "Cannabis"
+        assert drug_service.get_drug_info("ETHANOL")["name"] == "Alcohol"
+        assert drug_service.get_drug_info("coh")["name"] == "Alcohol"
+        assert drug_service.get_drug_info("heroin") is None
+
+        results = drug_service.search_drugs("DEPRESS")
+        assert [r["name"] for r in results] == ["Cannabis", "Alcohol"]
+        assert [r["name"] for r in drug_service.search_drugs("ed", limit=1)] == [
+            "Cannabis"
+        ]
+        assert drug_service.search_drugs("juana")[0]["name"] == "Cannabis"
+
+        # Replacing the data rebuilds the index
+        drug_service.drugs_data = {"lsd": {"name": "LSD", "aliases": ["acid"]}}
+        assert drug_service.get_drug_info("acid")["name"] == "LSD"
+        assert drug_service.search_drugs("weed") == []
+
+    def test_packed_data_is_used_when_present(self, drug_data_dir):
+        """Packed .pjson files are preferred and decoded per lookup."""
+        from packed_json import PackedJson, pack_json_file
+        from services.drug_service import DRUG_INDEX_FIELDS, DrugService
+
+        pack_json_file(drug_data_dir / "drugs.json", index_fields=DRUG_INDEX_FIELDS)
+        pack_json_file(drug_data_dir / "interactions.json")
+        (drug_data_dir / "drugs.json").unlink()
+
+        service = DrugService(data_dir=str(drug_data_dir))
+        assert isinstance(service.drugs_data, PackedJson)
+        assert isinstance(service.interactions_data, PackedJson)
+        assert service.drugs_data.index_fields == DRUG_INDEX_FIELDS
+
+        # The drug index comes from the key table and summaries, not records
+        decoded = []
+        original = PackedJson._value
+        with patch.object(
+            PackedJson,
+            "_value",
+            lambda packed, i: decoded.append(i) or original(packed, i),
+        ):
+            service._get_index()
+        assert decoded == []
+        assert dict(service.drugs_data) == DRUGS_DATA
+        assert list(service.drugs_data) == ["cannabis", "alcohol"]
+        assert "alcohol" in service.drugs_data
+        assert "beer" not in service.drugs_data
+        assert service.get_drug_info("weed")["name"] == "Cannabis"
+        assert service.check_interactions(["cannabis", "alcohol"])["interactions"] == [
+            ("cannabis", "alcohol", "Caution")
+        ]
+        assert service.get_stats()["total_drugs"] == 2
+
+    def test_batch_interactions_sorted_by_severity(self, tmp_path):
+        """Pairs come from the interaction index, most severe first."""
+        from services.drug_service import DrugService
+
+        drugs = dict(DRUGS_DATA)
+        drugs["mdma"] = {"name": "mdma", "aliases": ["molly"], "categories": []}
+        interactions = {
+            "cannabis": {"alcohol": {"status": "Caution"}},
+            "alcohol": {"mdma": {"status": "Low Risk & Synergy"}},
+            "mdma": {
+                "cannabis": {"status": "Dangerous"},
+                "alcohol": {"status": "Unsafe"},
+            },
+        }
+        (tmp_path / "drugs.json").write_text(json.dumps(drugs), encoding="utf-8")
+        (tmp_path / "interactions.json").write_text(
+            json.dumps(interactions), encoding="utf-8"
+        )
+        service = DrugService(data_dir=str(tmp_path))
+
+        # The symmetric pair index is built at load; lookups only read it
+        index = service._interaction_index
+        assert index is not None
+        assert index.status("alcohol", "cannabis") == "Caution"
+        assert index.status("alcohol", "mdma") == "Low Risk & Synergy"
+        assert index.status("mdma", "alcohol") == "Unsafe"
+
+        result = service.check_interactions(["weed", "alcohol", "molly", "nope"])
+        assert result["interactions"] == [
+            ("weed", "molly", "Dangerous"),
+            ("weed", "alcohol", "Caution"),
+            # alcohol -> mdma is listed first in the data, so it wins
+            ("alcohol", "molly", "Low Risk & Synergy"),
+        ]
+        assert result["unknown_drugs"] == ["nope"]
+        assert result["warnings"][0].startswith("☠️ weed + molly:")
@@ -6,6 +6,7 @@ Pytest tests for logger module.
 import builtins
 import os
 import re
+import time
 
 import logger as lg
 
@@ -92,3 +93,66 @@ def test_get_log_files_ignores_files_removed_during_rotation(monkeypatch):
     monkeypatch.setattr(lg.os.path, "getmtime", getmtime)
 
     assert lg.get_log_files("data/leet.log") == [os.path.join("data", "leet.log")]
+
+
+def test_queued_writer_batches_and_flushes_on_error():
+    batches = []
+    flushes = []
+    writer = lg.QueuedLogWriter(
+        batches.append, lambda: flushes.append(1), flush_every=1000, flush_interval=60
+    )
+    try:
+        writer.submit("a")
+        writer.submit("b")
+        writer.submit("boom", urgent=True)
+        # The ERROR alone triggers the flush, long before the 60 s interval
+        deadline = time.monotonic() + 2
+        while not flushes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert flushes
+        assert writer.flush(2)
+        assert [record for batch in batches for record in batch] == ["a", "b", "boom"]
+        assert len(batches) <= 2
+        assert flushes
+    finally:
+        writer.close()
+    writer.submit("after close")
+    assert [record for batch in batches for record in batch][-1] == "boom"
+
+
+def test_queued_writer_drops_oldest_when_full():
+    writer = lg.QueuedLogWriter(lambda batch: None, max_queue=3, flush_interval=60)
+    writer._thread = object()  # keep the writer from draining
+    for i in range(5):
+        writer.submit(i)
+    assert list(writer._queue) == [2, 3, 4]
+    assert writer.dropped == 2
+
+
+def test_file_hook_runs_off_the_calling_thread(monkeypatch):
+    import threading
+
+    lines = []
+    threads = set()
+
+    def hook(timestamp, level, message):
+        threads.add(threading.current_thread().name)
+        lines.append((timestamp, level, message))
+
+    monkeypatch.setattr(lg, "_LOG_LEVEL", "INFO")
+    lg.set_file_hook(hook)
+    try:
+        pl = lg.PrecisionLogger("Ctx")
+        pl.debug("skipped")
+        pl.info("hello")
+        pl.error("bad")
+        assert lg.flush_file_log(2)
+    finally:
+        lg.clear_file_hook()
+
+    assert [(level, message) for _, level, message in lines] == [
+        ("INFO", "[INFO   ] [Ctx] hello"),
+        ("ERROR", "[ERROR  ] [Ctx] bad"),
+    ]
+    assert re.match(r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{9}\]$", lines[0][0])
+    assert threads == {"FileLogWriter"}
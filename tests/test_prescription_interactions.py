@@ -88,6 +88,21 @@ def test_pair_analysis_reports_inhibitor_and_inducer_directions(tmp_path):
     )
 
 
+def test_find_interactions_orders_by_strength(tmp_path):
+    _write_data(tmp_path)
+    service = PrescriptionInteractionService(str(tmp_path))
+    result = service.find_interactions(
+        ["St. John's Wort", "midazolam", "clarithromycin", "nope"]
+    )
+    assert result["unknown"] == ["nope"]
+    assert [
+        (finding["modifier"], finding["severity"]) for finding in result["interactions"]
+    ] == [("Clarithromycin", 3), ("St. John's Wort", 0)]
+    assert result["interactions"][1]["message"] == (
+        "Rx: St. John's Wort inducer of 3A4/5 may reduce exposure to Midazolam"
+    )
+
+
 def test_duplicate_and_unknown_names_are_handled(tmp_path):
     _write_data(tmp_path)
     service = PrescriptionInteractionService(str(tmp_path))
@@ -0,0 +1,140 @@
+import threading
+import time
+
+from scheduler import Scheduler
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_interval_job_runs_repeatedly_and_records_metrics():
+    scheduler = Scheduler(max_workers=2)
+    calls = []
+    job = scheduler.add_job("tick", lambda: calls.append(1), interval=0.02)
+    scheduler.start()
+    try:
+        assert _wait_for(lambda: job.runs >= 3)
+    finally:
+        scheduler.stop()
+
+    stats = scheduler.stats()["tick"]
+    assert stats["runs"] >= 3
+    assert stats["failures"] == 0
+    assert stats["last_duration"] is not None
+    assert stats["last_run"] is not None
+
+
+def test_failures_are_counted_and_the_job_keeps_running():
+    scheduler = Scheduler()
+
+    def boom():
+        raise RuntimeError("feed down")
+
+    job = scheduler.add_job("boom", boom, interval=0.01)
+    scheduler.start()
+    try:
+        assert _wait_for(lambda: job.failures >= 2)
+    finally:
+        scheduler.stop()
+
+    assert job.last_error == "feed down"
+
+
+def test_overlapping_runs_are_skipped_and_timeouts_reported():
+    scheduler = Scheduler(max_workers=4)
+    release = threading.Event()
+    active = []
+    peak = []
+
+    def slow():
+        active.append(1)
+        peak.append(len(active))
+        release.wait(2)
+        active.pop()
+
+    job = scheduler.add_job("slow", slow, interval=0.01, timeout=0.05)
+    scheduler.start()
+    try:
+        assert _wait_for(lambda: job.skipped >= 3 and job.timeouts == 1)
+        release.set()
+        assert _wait_for(lambda: job.runs >= 1)
+    finally:
+        release.set()
+        scheduler.stop()
+
+    assert max(peak) == 1
+
+
+def test_next_delay_jobs_and_removal():
+    scheduler = Scheduler()
+    calls = []
+    scheduler.add_job("later", lambda: calls.append("later"), next_delay=lambda: 60)
+    job = scheduler.add_job("now", lambda: calls.append("now"), interval=0.01)
+    scheduler.start()
+    try:
+        assert _wait_for(lambda: job.runs >= 1)
+        assert scheduler.remove_job("now")
+        runs = job.runs
+        time.sleep(0.05)
+        assert job.runs <= runs + 1
+        assert scheduler.stats()["later"]["next_run"] > time.time() + 50
+    finally:
+        started = time.monotonic()
+        scheduler.stop()
+
+    assert time.monotonic() - started < 1
+    assert "later" not in calls
+    assert not scheduler.remove_job("now")
+
+
+def test_next_delay_is_asked_after_the_run_returns():
+    # Like the dream window: due right away until the run marks the day handled
+    scheduler = Scheduler()
+    handled = threading.Event()
+
+    def slow():
+        time.sleep(0.1)
+        handled.set()
+
+    job = scheduler.add_job(
+        "window", slow, next_delay=lambda: 60 if handled.is_set() else 0
+    )
+    scheduler.start()
+    try:
+        assert _wait_for(lambda: job.runs == 1)
+        time.sleep(0.05)
+    finally:
+        scheduler.stop()
+
+    assert job.runs == 1
+    assert job.skipped <= 2
+    assert scheduler.stats()["window"]["next_run"] > time.time() + 50
+
+
+def test_monitor_service_polls_from_scheduler(tmp_path):
+    from services.fmi_warning_service import FMIWarningService
+
+    polled = threading.Event()
+    service = FMIWarningService(
+        callback=lambda warnings: None, state_file=str(tmp_path / "state.json")
+    )
+    service.POLL_JITTER = 0
+    service.check_new_warnings = lambda: polled.set() or []
+    scheduler = Scheduler()
+
+    service.schedule(scheduler)
+    scheduler.start()
+    try:
+        assert polled.wait(2)
+        assert service.thread is None
+    finally:
+        service.unschedule(scheduler)
+        scheduler.stop()
+
+    assert scheduler.get_job(FMIWarningService.JOB_NAME) is None
@@ -17,6 +17,9 @@ import pytest
 # Import the service we're testing
 from services.alko_service import AlkoService, create_alko_service
 
+# Captured before the test fixtures patch it out
+_real_parse_excel_file = AlkoService._parse_excel_file
+
 
 class TestAlkoService:
     """Test cases for AlkoService functionality."""
@@ -73,7 +76,7 @@ class TestAlkoService:
         expected_excel_path = (
             Path(self.data_dir) / "alkon-hinnasto-tekstitiedostona.xlsx"
         )
-        expected_cache_path = Path(self.data_dir) / "alko_cache.json"
+        expected_cache_path = Path(self.data_dir) / "alko_cache.bin"
 
         assert (
             service.excel_url
@@ -650,6 +653,31 @@ class TestAlkoService:
         result = service.get_product_by_number("319027")
         assert result is None
 
+    def test_partial_product_number_decodes_only_the_match(self):
+        """Partial numbers are found from the number column of the store."""
+        from services.alko_service import _ProductStore
+
+        service = AlkoService(data_dir=self.data_dir)
+        service.products_cache = _ProductStore.from_products(
+            [
+                {"name": "Test Beer 1", "number": "123456", "bottle_size": 0.33},
+                {"name": "Test Beer 2", "number": "005183", "bottle_size": 0.5},
+                {"name": "Test Beer 3", "number": "7183", "bottle_size": 0.33},
+            ]
+        )
+        service._get_index()
+
+        with patch.object(
+            _ProductStore,
+            "__getitem__",
+            autospec=True,
+            side_effect=_ProductStore.__getitem__,
+        ) as getitem:
+            result = service.get_product_by_number("183")
+        assert result["number"] == "005183"
+        assert getitem.call_count == 1
+        assert service.get_product_by_number("9999") is None
+
     def test_get_product_info_with_product_number(self):
         """Test get_product_info detects and handles product number queries."""
         service = AlkoService(data_dir=self.data_dir)
@@ -722,6 +750,144 @@ class TestAlkoService:
         result = service.search_products("gambina", limit=5)
         assert len(result) == 2  # Both Gambina products
 
+    def test_search_products_index_semantics(self):
+        """Indexed search keeps substring semantics and follows cache swaps."""
+        service = AlkoService(data_dir=self.data_dir)
+        service.products_cache = [
+            {"name": "Lapin Kulta", "number": "000123", "bottle_size": 0.5},
+            {"name": "Karhu III", "number": "456", "bottle_size": 0.5},
+            {"name": "Karhu", "number": "789", "bottle_size": 0.33},
+            {"name": "Koskenkorva Viina", "number": "321", "bottle_size": 0.7},
+        ]
+
+        # Infix substrings and short words still match like a plain scan
+        assert [p["name"] for p in service.search_products("enkor")] == [
+            "Koskenkorva Viina"
+        ]
+        assert [p["name"] for p in service.search_products("karhu ii")] == ["Karhu III"]
+        assert [p["name"] for p in service.search_products("ar 0.33")] == ["Karhu"]
+        assert service.search_products("karhu 0.7") == []
+        assert service.get_product_by_number("123")["name"] == "Lapin Kulta"
+
+        # Replacing the cache rebuilds the index
+        service.products_cache = [{"name": "Gambina", "bottle_size": 0.75}]
+        assert service.search_products("karhu") == []
+        assert service.get_product_info("gambina 0.75")["name"] == "Gambina"
+
+    def test_columnar_cache_round_trip_and_legacy_migration(self):
+        """Cache is stored column-wise and the old JSON cache is migrated."""
+        service = AlkoService(data_dir=self.data_dir)
+        products = [
+            {
+                "name": "Lapin Kulta",
+                "number": "000123",
+                "bottle_size_raw": "0,5 l",
+                "bottle_size": 0.5,
+                "alcohol_percent": 5.2,
+                "alcohol_grams": 20.5,
+                "price": 2.49,
+                "type": "oluet",
+            },
+            {"name": "Vesi ääkkösillä"},
+        ]
+        service.products_cache = products
+        service._save_cache()
+        assert service.cache_file.read_bytes().startswith(b"ALKOCOL1")
+
+        new_service = AlkoService(data_dir=self.data_dir)
+        assert new_service.products_cache == products
+        assert new_service.cache_last_updated == service.cache_last_updated
+        assert new_service.products_cache[-1] == {"name": "Vesi ääkkösillä"}
+        assert new_service.search_products("kulta 0.5")[0]["price"] == 2.49
+
+        # A JSON cache from older versions is converted once, keeping its timestamp
+        os.remove(service.cache_file)
+        legacy = {"products": products, "last_updated": "2024-01-01T00:00:00"}
+        with open(service.legacy_cache_file, "w", encoding="utf-8") as f:
+            json.dump(legacy, f)
+        migrated = AlkoService(data_dir=self.data_dir)
+        assert migrated.products_cache == products
+        assert migrated.cache_last_updated == "2024-01-01T00:00:00"
+        assert migrated.cache_file.exists()
+
+    def test_parse_excel_file_streams_sheet(self):
+        """Excel import finds the header below the preamble and parses rows."""
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Alkon hinnasto 1.1.2025"])
+        sheet.append([])
+        sheet.append(["Numero", "Nimi", "Pullokoko", "Hinta", "Tyyppi", "Alkoholi-%"])
+        sheet.append(["000123", "Lapin Kulta", "0.5 l", 2.49, "oluet", 5.2])
+        sheet.append(["456", None, "0.7 l", 20.0, "viinat", 38.0])
+        sheet.append(["789", "Koskenkorva", "0.7 l", 19.99, "viinat", 38.0])
+        workbook.save(self.mock_excel_path)
+
+        service = AlkoService(data_dir=self.data_dir)
+        products = _real_parse_excel_file(service)
+
+        assert [p["name"] for p in products] == ["Lapin Kulta", "Koskenkorva"]
+        assert products[0]["number"] == "000123"
+        assert products[0]["type"] == "oluet"
+        assert products[0]["bottle_size"] == 0.5
+        assert products[0]["alcohol_grams"] == 20.5
+
+    def test_query_products_rankings_and_facets(self):
+        """Rankings are precomputed per cache and filtered by facets."""
+        service = AlkoService(data_dir=self.data_dir)
+        service.products_cache = [
+            {
+                "name": "Kuiva Siideri",
+                "type": "siiderit",
+                "country": "Suomi",
+                "bottle_size": 0.33,
+                "alcohol_percent": 4.7,
+                "alcohol_grams": 12.2,
+                "price": 2.0,
+            },
+            {
+                "name": "Vahva Siideri",
+                "type": "siiderit",
+                "country": "Ranska",
+                "bottle_size": 0.5,
+                "alcohol_percent": 8.0,
+                "alcohol_grams": 31.6,
+                "price": 3.5,
+            },
+            {
+                "name": "Koskenkorva",
+                "type": "vodkat ja viinat",
+                "country": "Suomi",
+                "bottle_size": 0.7,
+                "alcohol_percent": 38.0,
+                "alcohol_grams": 209.9,
+                "price": 19.99,
+            },
+            {"name": "Paperikassi", "price": 0.2},
+        ]
+
+        best = service.find_cheapest_by_value(2)
+        assert [p["name"] for p in best] == ["Koskenkorva", "Vahva Siideri"]
+        assert best[0]["value_ratio"] == pytest.approx(209.9 / 19.99)
+        assert "value_ratio" not in service.products_cache[0]
+
+        ciders = service.query_products("value", 5, product_type="siideri")
+        assert [p["name"] for p in ciders] == ["Vahva Siideri", "Kuiva Siideri"]
+        weak = service.query_products("price", 5, product_type="siider", max_abv=6)
+        assert [p["name"] for p in weak] == ["Kuiva Siideri"]
+        assert service.query_products("abv", 1, country="suomi")[0]["name"] == (
+            "Koskenkorva"
+        )
+        litre = service.query_products("litre", 5, min_size=0.5, max_size=0.7)
+        assert [p["name"] for p in litre] == ["Vahva Siideri", "Koskenkorva"]
+        assert litre[0]["price_per_litre"] == pytest.approx(7.0)
+        assert service.query_products("price", 5)[0]["name"] == "Paperikassi"
+
+        # New products rebuild the rankings
+        service.products_cache = [{"name": "Olut", "alcohol_grams": 10, "price": 1}]
+        assert [p["name"] for p in service.find_cheapest_by_value()] == ["Olut"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -74,6 +74,38 @@ def test_service_manager_weather_initialization():
         pytest.skip("No WEATHER_API_KEY configured")
 
 
+def test_service_manager_loads_dataset_services_lazily():
+    """Alko and drug services are only built when first requested."""
+    from unittest.mock import patch
+
+    from service_manager import ServiceManager
+
+    calls = []
+
+    def fake_init(self):
+        calls.append("drug")
+        self.services["drug"] = "drug-service"
+
+    with (
+        patch.object(ServiceManager, "_initialize_drug_service", fake_init),
+        patch(
+            "services.alko_service.create_alko_service",
+            side_effect=RuntimeError("boom"),
+        ),
+    ):
+        sm = ServiceManager()
+        assert "drug" not in sm.services
+        assert calls == []
+
+        assert sm.get_service("drug") == "drug-service"
+        assert sm.is_service_available("drug")
+        assert calls == ["drug"]
+
+        # A failing loader marks the service unavailable instead of raising
+        assert sm.get_service("alko") is None
+        assert "alko" in sm.get_unavailable_services()
+
+
 def test_np_command_works():
     """
     Test that !np (name day) command works.
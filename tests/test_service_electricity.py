@@ -6,6 +6,7 @@ Tests electricity price functionality including API integration,
 command parsing, and message formatting.
 """
 
+import io
 import os
 import unittest
 from datetime import datetime
@@ -103,6 +104,51 @@ class TestElectricityService(unittest.TestCase):
         self.assertTrue(result["error"])
         self.assertIn("Failed to fetch daily prices.", result["message"])
 
+    @patch("requests.get")
+    def test_get_daily_prices_streams_xml(self, mock_get):
+        """Points are mapped to local quarters from the streamed document."""
+        points = "".join(
+            f"<Point><position>{pos}</position>"
+            f"<price.amount>{pos}.0</price.amount></Point>"
+            for pos in range(1, 101)
+        )
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:3">'
+            "<period.timeInterval><start>2024-01-14T22:00Z</start>"
+            "<end>2024-01-15T22:00Z</end></period.timeInterval>"
+            "<TimeSeries><Period><timeInterval><start>2024-01-14T22:00Z</start>"
+            "<end>2024-01-15T23:00Z</end></timeInterval>"
+            f"<resolution>PT15M</resolution>{points}</Period></TimeSeries>"
+            "</Publication_MarketDocument>"
+        )
+        mock_get.return_value.raw = io.BytesIO(xml.encode("utf-8"))
+
+        result = self.service.get_daily_prices(datetime(2024, 1, 15))
+
+        self.assertFalse(result["error"])
+        prices = result["interval_prices"]
+        self.assertEqual(len(prices), 96)
+        self.assertEqual(prices[(0, 1)], 1.0)
+        self.assertEqual(prices[(13, 2)], 54.0)
+        self.assertEqual(prices[(23, 4)], 96.0)
+
+    @patch("requests.get")
+    def test_get_daily_prices_reports_api_reason(self, mock_get):
+        """An acknowledgement document without TimeSeries is reported as an error."""
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Acknowledgement_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">'
+            "<Reason><code>999</code><text>No matching data found</text></Reason>"
+            "</Acknowledgement_MarketDocument>"
+        )
+        mock_get.return_value.raw = io.BytesIO(xml.encode("utf-8"))
+
+        result = self.service.get_daily_prices(datetime(2024, 1, 15))
+
+        self.assertTrue(result["error"])
+        self.assertIn("No matching data found", result["message"])
+
     def test_longbar_output_is_96_blocks(self):
         """Longbar should always output 96 blocks (24h × 4 quarters)."""
         interval_prices = {}
@@ -258,20 +304,27 @@ class TestElectricityServiceIntegration(unittest.TestCase):
         self.mock_server.send_message = Mock()
         self.mock_server.send_notice = Mock()
 
-        # Create service instance for testing
+        # Create service instance for testing and let the commands use it
         self.service = ElectricityService("test_integration_key")
+        self.bot_manager.service_manager.services["electricity"] = self.service
 
         # Mock requests to avoid actual API calls in tests
         self.requests_patcher = patch("requests.get")
         self.mock_get = self.requests_patcher.start()
-        # Mock successful API response
-        self.mock_get.return_value.status_code = 200
-        self.mock_get.return_value.text = (
+        # Mock successful API responses; the service streams each body from raw
+        xml = (
             '<?xml version="1.0" encoding="UTF-8"?>'
             '<Publication_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-3:publicationdocument:7:0">'
             "<TimeSeries><Period><Point><position>1</position><price.amount>50.0</price.amount></Point></Period></TimeSeries>"
             "</Publication_MarketDocument>"
-        )
+        ).encode("utf-8")
+
+        def respond(*args, **kwargs):
+            response = Mock(status_code=200)
+            response.raw = io.BytesIO(xml)
+            return response
+
+        self.mock_get.side_effect = respond
 
     def tearDown(self):
         """Clean up after tests."""
@@ -351,6 +404,10 @@ class TestElectricityServiceIntegration(unittest.TestCase):
                     # Exceptions are OK (like API errors), we just want to ensure no crashes
                     pass
 
+        # The prices were requested and streamed from the mocked response
+        self.mock_get.assert_called()
+        self.assertTrue(self.mock_get.call_args.kwargs["stream"])
+
 
 if __name__ == "__main__":
     # Run the tests
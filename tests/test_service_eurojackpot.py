@@ -478,7 +478,7 @@ def test_scrape_all_draws_exception_in_loop(service, monkeypatch):
     monkeypatch.setattr(service, "_make_request", lambda *a, **k: next(seq))
     monkeypatch.setattr(
         service,
-        "_save_draw_to_database",
+        "_save_database",
         lambda *a, **k: (_ for _ in ()).throw(RuntimeError("x")),
     )
     res = service.scrape_all_draws(start_year=2025, max_api_calls=1)
@@ -1274,3 +1274,171 @@ def test_real_database_file_smoke(monkeypatch):
 
         freq = service.get_frequent_numbers()
         assert freq.get("success") is True
+
+
+def _analytics_draws():
+    """Six draws, newest first: 2025-01-30 ... 2025-01-25."""
+    rows = [
+        ["01", "02", "03", "04", "05", "01", "02"],
+        ["01", "02", "10", "11", "12", "01", "03"],
+        ["01", "02", "20", "21", "22", "01", "04"],
+        ["30", "31", "32", "33", "34", "05", "06"],
+        ["40", "41", "42", "43", "44", "07", "08"],
+        ["45", "46", "47", "48", "49", "09", "10"],
+    ]
+    # Stored out of order on purpose; analytics must sort by date_iso
+    return [
+        {"date_iso": f"2025-01-{30 - i}", "numbers": nums}
+        for i, nums in reversed(list(enumerate(rows)))
+    ]
+
+
+def test_draw_matrix_analytics(service):
+    service._save_database({"draws": _analytics_draws(), "last_updated": None})
+
+    hot = service.get_hot_cold_numbers(mode="hot", top=3)
+    assert hot["primary_numbers"] == [1, 2, 3]
+    assert hot["secondary_numbers"][0] == 1
+
+    cold = service.get_hot_cold_numbers(mode="cold", top=2)
+    assert cold["primary_numbers"] == [6, 7]  # never seen -> 6 draws absent
+    assert "(6 arvontaa)" in cold["message"]
+
+    pairs = service.get_common_pairs(top=1)
+    assert pairs["pairs"] == [{"a": 1, "b": 2, "count": 3}]
+
+    streaks = service.get_streaks(top=1)
+    assert streaks["primary_streaks"] == {6: 6}
+
+    trends = service.get_trends(window=3, top=2)
+    assert trends["up"] == [1, 2] and trends["down"] == [30, 31]
+
+    freq = service._calculate_frequency_from_database(extended=True, limit=5)
+    assert freq["primary_counts"] == {1: 3, 2: 3, 3: 1, 4: 1, 5: 1}
+    assert "25.1.25 - 30.1.25" in freq["message"]
+
+
+def test_draw_matrix_cached_until_save(service, monkeypatch):
+    service._save_database({"draws": _analytics_draws(), "last_updated": None})
+    service.get_streaks()
+
+    calls = []
+    original = service._load_database
+    monkeypatch.setattr(
+        service, "_load_database", lambda: calls.append(1) or original()
+    )
+    service.get_hot_cold_numbers(mode="hot")
+    service.get_common_pairs()
+    assert calls == []
+
+    service._save_draw_to_database(
+        {"date_iso": "2025-02-01", "numbers": ["50"] * 5 + ["12", "12"]}
+    )
+    streaks = service.get_streaks()
+    assert calls  # rebuilt after the write
+    assert 50 not in streaks["primary_numbers"]
+
+
+def test_scrape_all_draws_batches_writes_and_checkpoints(service, monkeypatch):
+    from datetime import date, timedelta
+
+    service.api_key = "x"
+    # Newest Tuesday/Friday strictly before today -> checkpointed as empty
+    d = date.today() - timedelta(days=1)
+    while d.weekday() not in (1, 4):
+        d -= timedelta(days=1)
+    empty_date = d.strftime("%Y-%m-%d")
+
+    def fake_make_request(url, params, timeout=10):
+        if params["draw"] == empty_date:
+            return {"error": 0, "draw": "-", "results": "-"}
+        return {
+            "error": 0,
+            "draw": params["draw"],
+            "results": "01,02,03,04,05,06,07",
+        }
+
+    saves = []
+    original_save = service._save_database
+    monkeypatch.setattr(service, "_make_request", fake_make_request)
+    monkeypatch.setattr(
+        service, "_save_database", lambda db: saves.append(1) or original_save(db)
+    )
+
+    res = service.scrape_all_draws(
+        start_year=2012, max_api_calls=12, max_workers=4, batch_size=5
+    )
+    assert res["api_calls_used"] == 12
+    assert res["new_draws"] == 11
+    assert len(saves) == 3  # 5 + 5 + 1 draws, not one write per draw
+
+    db = service._load_database()
+    dates = [dr["date_iso"] for dr in db["draws"]]
+    assert empty_date not in dates and dates == sorted(dates, reverse=True)
+
+    # Resume: stored and checkpointed dates are not requested again
+    requested = []
+    monkeypatch.setattr(
+        service,
+        "_make_request",
+        lambda url, params, timeout=10: (
+            requested.append(params["draw"]) or fake_make_request(url, params)
+        ),
+    )
+    service.scrape_all_draws(start_year=2012, max_api_calls=3)
+    assert empty_date not in requested
+    assert not set(requested) & set(dates)
+
+
+def test_backtest_strategies(service):
+    import random
+    from datetime import date, timedelta
+
+    rng = random.Random(7)  # noqa: S311 - reproducible fake draws
+    draws = []
+    for i in range(120):
+        main = sorted(rng.sample(range(1, 51), 5))
+        euro = sorted(rng.sample(range(1, 13), 2))
+        draws.append(
+            {
+                "date_iso": (date(2015, 1, 2) + timedelta(days=7 * i)).isoformat(),
+                "numbers": [f"{n:02d}" for n in main + euro],
+            }
+        )
+    service._save_database({"draws": draws, "last_updated": None})
+
+    for strategy in ("hot", "cold", "pairs"):
+        res = service.backtest_strategy(strategy, window=20)
+        assert res["success"] is True, res
+        assert res["draws_evaluated"] == 100
+        assert sum(res["main_distribution"]) == 100
+        assert sum(res["euro_distribution"]) == 100
+
+    res = service.backtest_strategy("random", window=20, tickets=500, seed=1)
+    assert sum(res["main_distribution"]) == 500 * 100
+    assert 0.35 < res["mean_main_matches"] < 0.65
+
+    assert service.backtest_strategy("bogus")["success"] is False
+    assert service.backtest_strategy("hot", window=500)["success"] is False
+
+
+def test_backtest_hot_ticket_uses_only_prior_draws(service):
+    # Oldest two draws repeat 01-05; the newest draw is exactly that ticket
+    draws = [
+        {
+            "date_iso": "2025-01-03",
+            "numbers": ["01", "02", "03", "04", "05", "01", "02"],
+        },
+        {
+            "date_iso": "2025-01-07",
+            "numbers": ["01", "02", "03", "04", "05", "01", "02"],
+        },
+        {
+            "date_iso": "2025-01-10",
+            "numbers": ["01", "02", "03", "04", "05", "01", "02"],
+        },
+    ]
+    service._save_database({"draws": draws, "last_updated": None})
+    res = service.backtest_strategy("hot", window=2)
+    assert res["draws_evaluated"] == 1
+    assert res["main_distribution"][5] == 1 and res["euro_distribution"][2] == 1
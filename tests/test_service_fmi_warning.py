@@ -226,6 +226,76 @@ def test_check_new_warnings_happy_path_and_saves(tmp_path):
     save_data.assert_called_once()
 
 
+def test_check_new_warnings_uses_conditional_get(tmp_path):
+    svc = FMIWarningService(callback=Mock(), state_file=str(tmp_path / "state.json"))
+    entry = {"title": "Keltainen tuulivaroitus Joensuu", "summary": "test"}
+
+    with (
+        patch("services.fmi_warning_service.feedparser.parse") as p,
+        patch.object(svc, "_save_seen_hashes") as save_hashes,
+    ):
+        p.return_value = Mock(
+            status=200, etag='"v1"', modified="Mon, 01 Jan 2024", entries=[entry]
+        )
+        assert len(svc.check_new_warnings()) == 1
+
+        p.return_value = Mock(status=304, entries=[])
+        assert svc.check_new_warnings() == []
+
+        # Unchanged content without validators is not saved again
+        p.return_value = Mock(status=200, etag=None, modified=None, entries=[entry])
+        assert svc.check_new_warnings() == []
+
+    assert p.call_args_list[1].kwargs == {
+        "etag": '"v1"',
+        "modified": "Mon, 01 Jan 2024",
+    }
+    save_hashes.assert_called_once()
+
+
+def test_check_new_warnings_failed_poll_is_not_skipped_next_time(tmp_path):
+    svc = FMIWarningService(callback=Mock(), state_file=str(tmp_path / "state.json"))
+    entry = {"title": "Keltainen tuulivaroitus Joensuu", "summary": "test"}
+    feed = Mock(status=200, etag='"v1"', modified="Mon, 01 Jan 2024", entries=[entry])
+
+    with (
+        patch("services.fmi_warning_service.feedparser.parse", return_value=feed) as p,
+        patch.object(svc, "_save_seen_hashes"),
+        patch.object(
+            svc, "_format_warning_message", side_effect=[RuntimeError("boom"), "msg"]
+        ),
+    ):
+        assert svc.check_new_warnings() == []
+        assert svc.check_new_warnings() == ["msg"]
+        assert svc.check_new_warnings() == []
+
+    # The failed poll stores no validators, so the retry is unconditional
+    assert p.call_args_list[1].kwargs == {"etag": None, "modified": None}
+    assert p.call_args_list[2].kwargs == {
+        "etag": '"v1"',
+        "modified": "Mon, 01 Jan 2024",
+    }
+
+
+def test_check_new_warnings_trims_oldest_seen_hashes(tmp_path):
+    state = tmp_path / "state.json"
+    old_hashes = [f"h{i}" for i in range(FMIWarningService.SEEN_HASH_LIMIT)]
+    state.write_text(
+        json.dumps({"fmi_warnings": {"seen_hashes": old_hashes, "seen_data": []}}),
+        encoding="utf-8",
+    )
+    svc = FMIWarningService(callback=Mock(), state_file=str(state))
+    entry = {"title": "Keltainen tuulivaroitus Joensuu", "summary": "test"}
+
+    with patch("services.fmi_warning_service.feedparser.parse") as p:
+        p.return_value.entries = [entry]
+        assert len(svc.check_new_warnings()) == 1
+
+    saved = json.loads(state.read_text(encoding="utf-8"))["fmi_warnings"]
+    assert saved["seen_hashes"] == old_hashes[1:] + [svc._get_entry_hash(entry)]
+    assert len(saved["seen_data"]) == 1
+
+
 def test_check_new_warnings_exception_returns_empty(tmp_path, capsys):
     cb = Mock()
     svc = FMIWarningService(callback=cb, state_file=str(tmp_path / "state.json"))
@@ -303,7 +373,7 @@ def test_load_and_save_seen_hashes_and_data(tmp_path):
 
     svc = FMIWarningService(callback=lambda x: None, state_file=str(state))
 
-    assert svc._load_seen_hashes() == {"a", "b"}
+    assert svc._load_seen_hashes() == ["a", "b"]
     assert svc._load_seen_data() == [{"title": "t"}]
 
     # Save merges/preserves complementary fields
@@ -323,12 +393,12 @@ def test_load_seen_hashes_and_data_missing_or_corrupt(tmp_path, capsys):
     svc = FMIWarningService(callback=lambda x: None, state_file=str(state))
 
     # Missing file
-    assert svc._load_seen_hashes() == set()
+    assert svc._load_seen_hashes() == []
     assert svc._load_seen_data() == []
 
     # Corrupt file
     state.write_text("not-json", encoding="utf-8")
-    assert svc._load_seen_hashes() == set()
+    assert svc._load_seen_hashes() == []
     assert svc._load_seen_data() == []
     out = capsys.readouterr().out
     assert "State file corrupted" in out
@@ -7,6 +7,8 @@ parsing, state management, and callback functionality.
 """
 
 import json
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -17,11 +19,14 @@ from services.otiedote_json_service import (
     JSON_FILE,
     RELEASE_URL_TEMPLATE,
     STATE_FILE,
+    OtiedoteReleaseFields,
     OtiedoteService,
     create_otiedote_service,
     fetch_release,
     get_otiedote_target_filters,
     load_existing_ids,
+    load_otiedote_filters,
+    otiedote_release_matches_filters,
 )
 
 
@@ -46,6 +51,46 @@ def test_get_otiedote_target_filters_is_case_insensitive():
     ]
 
 
+def test_otiedote_release_matches_filters_by_field():
+    release = {
+        "id": 1,
+        "title": "Tulipalo",
+        "organization": "Pohjois-Karjalan pelastuslaitos",
+        "units": ["Joensuu", "Kontiolahti"],
+    }
+
+    assert otiedote_release_matches_filters(release, [])
+    assert otiedote_release_matches_filters(release, ["pohjois-karjalan"])
+    assert otiedote_release_matches_filters(release, ["Kuopio", "kontio:units"])
+    assert otiedote_release_matches_filters(release, ["tulipalo:*"])
+    assert not otiedote_release_matches_filters(release, ["tulipalo"])
+    assert not otiedote_release_matches_filters(release, ["  :units"])
+
+
+def test_load_otiedote_filters_recompiles_when_state_changes(tmp_path):
+    state_file = tmp_path / "state.json"
+    state_file.write_text(
+        json.dumps({"otiedote": {"filters": {"#JoensuuTest": ["Savon"]}}}),
+        encoding="utf-8",
+    )
+    release = {"organization": "Pohjois-Savon pelastuslaitos"}
+
+    filters = load_otiedote_filters(str(state_file))
+    assert load_otiedote_filters(str(state_file)) is filters
+    assert filters.for_target("#joensuutest").patterns
+    assert not filters.for_target("#other").patterns
+
+    state_file.write_text(
+        json.dumps({"otiedote": {"filters": {"#JoensuuTest": ["Karjalan"]}}}),
+        encoding="utf-8",
+    )
+    reloaded = load_otiedote_filters(str(state_file))
+    assert reloaded is not filters
+    assert not reloaded.for_target("#JoensuuTest").matches(
+        OtiedoteReleaseFields(release)
+    )
+
+
 @pytest.fixture
 def mock_requests():
     """Mock requests module."""
@@ -657,10 +702,145 @@ class TestOtiedoteServiceIntegration:
         ) as mock_fetch:
             assert service.check_new_releases(max_attempts=1) == [new_release]
 
-        assert [call.args[0] for call in mock_fetch.call_args_list] == [2833, 2834]
-        saved = json.loads(json_file.read_text(encoding="utf-8"))
+        # The gap at 2831 is retried; after the hit the batch widens to two.
+        assert sorted(call.args[0] for call in mock_fetch.call_args_list) == [
+            2831,
+            2833,
+            2834,
+            2835,
+        ]
+        saved = service.load_otiedote_data()
         assert [release["id"] for release in saved] == [2830, 2832, 2833]
 
+    def test_check_new_releases_recovers_gap_published_later(
+        self, tmp_path, mock_callback
+    ):
+        json_file = tmp_path / "test_otiedote.json"
+        json_file.write_text(json.dumps([{"id": 10}, {"id": 12}]), encoding="utf-8")
+        state_file = tmp_path / "test_state.json"
+        state_file.write_text(
+            json.dumps({"otiedote": {"latest_release": 0}}),
+            encoding="utf-8",
+        )
+        service = OtiedoteService(
+            mock_callback,
+            state_file=str(state_file),
+            json_file=str(json_file),
+            probe_interval=0,
+        )
+        late = {"id": 11, "title": "Late"}
+
+        with patch("services.otiedote_json_service.fetch_release", return_value=None):
+            assert service.check_new_releases(max_attempts=1) == []
+        with patch(
+            "services.otiedote_json_service.fetch_release",
+            side_effect=lambda release_id: late if release_id == 11 else None,
+        ):
+            assert service.check_new_releases(max_attempts=1) == [late]
+        with patch(
+            "services.otiedote_json_service.fetch_release", return_value=None
+        ) as mock_fetch:
+            service.check_new_releases(max_attempts=1)
+
+        mock_fetch.assert_called_once_with(13)
+
+    def test_fetch_all_releases_probes_concurrently_and_skips_stored_ids(
+        self, tmp_path, mock_callback
+    ):
+        json_file = tmp_path / "test_otiedote.json"
+        json_file.write_text(json.dumps([{"id": 3}]), encoding="utf-8")
+        service = OtiedoteService(
+            mock_callback,
+            state_file=str(tmp_path / "test_state.json"),
+            json_file=str(json_file),
+            probe_concurrency=3,
+            probe_interval=0,
+        )
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def fake_fetch(release_id):
+            with lock:
+                in_flight.append(release_id)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(release_id)
+            if release_id <= 20:
+                return {"id": release_id, "title": f"#{release_id}"}
+            return None
+
+        with patch(
+            "services.otiedote_json_service.fetch_release", side_effect=fake_fetch
+        ) as mock_fetch:
+            result = service.fetch_all_releases(start_id=1)
+
+        requested = [call.args[0] for call in mock_fetch.call_args_list]
+        assert 3 not in requested
+        assert max(peak) <= 3
+        assert result["count"] == 19
+        assert result["latest_id"] == 20
+        assert result["total_count"] == 20
+        assert len(service.load_otiedote_data()) == 20
+
+    def test_fetch_all_releases_works_after_monitor_is_unscheduled(
+        self, tmp_path, mock_callback
+    ):
+        service = OtiedoteService(
+            mock_callback,
+            state_file=str(tmp_path / "test_state.json"),
+            json_file=str(tmp_path / "test_otiedote.json"),
+            probe_interval=0,
+        )
+        service.unschedule(Mock())
+
+        with patch(
+            "services.otiedote_json_service.fetch_release",
+            side_effect=lambda i: {"id": i, "title": f"#{i}"} if i <= 5 else None,
+        ):
+            result = service.fetch_all_releases(start_id=1)
+
+        assert result["success"] is True
+        assert result["count"] == 5
+
+    def test_release_store_appends_and_indexes_new_lines_only(self, tmp_path):
+        from services.otiedote_json_service import _ReleaseStore
+
+        json_file = tmp_path / "otiedote.json"
+        json_file.write_text(json.dumps([{"id": 5}, {"id": 3}]), encoding="utf-8")
+
+        store = _ReleaseStore(str(json_file))
+        assert store.ids == {3, 5} and store.max_id == 5
+        assert store.append([{"id": 5}, {"id": 6, "title": "Ä"}]) == [
+            {"id": 6, "title": "Ä"}
+        ]
+        index = json.loads((tmp_path / "otiedote.jsonl.idx").read_text())
+        assert index["ids"] == [[3, 3], [5, 6]]
+
+        # A line appended behind the index's back, then a torn write
+        log_file = tmp_path / "otiedote.jsonl"
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"id": 9}) + "\n" + '{"id": 1')
+
+        reopened = _ReleaseStore(str(json_file))
+        assert reopened.ids == {3, 5, 6, 9} and reopened.max_id == 9
+        assert log_file.read_text(encoding="utf-8").endswith('{"id": 9}\n')
+        assert [r["id"] for r in reopened.releases()] == [3, 5, 6, 9]
+
+    def test_release_store_imports_changed_legacy_file(self, tmp_path):
+        from services.otiedote_json_service import _ReleaseStore
+
+        json_file = tmp_path / "otiedote.json"
+        json_file.write_text(json.dumps([{"id": 1}]), encoding="utf-8")
+        store = _ReleaseStore(str(json_file))
+        assert store.refresh() is False
+
+        json_file.write_text(json.dumps([{"id": 1}, {"id": 2}]), encoding="utf-8")
+        assert store.refresh() is True
+        assert store.ids == {1, 2}
+        assert len(_ReleaseStore(str(json_file)).releases()) == 2
+
     def test_check_new_releases_resumes_after_persisted_latest_release(
         self, tmp_path, mock_callback
     ):
@@ -0,0 +1,129 @@
+import json
+
+import logger as lg
+from structured_log import (
+    StructuredLogSink,
+    describe_record,
+    index_path,
+    read_index,
+    search,
+)
+
+SECOND = 1_000_000_000
+BASE = 1_760_000_000 * SECOND
+
+
+def _write(sink, count, step=SECOND, start=BASE):
+    sink.write_batch(
+        [(start + i * step, "INFO", "Bot", f"message {i}") for i in range(count)]
+    )
+    sink.flush()
+
+
+def test_describe_record_reads_irc_lines_and_responses():
+    assert describe_record(
+        "SERVER", "libera", ":nick!u@h PRIVMSG #kanava :hei kaikki"
+    ) == ("libera", "#kanava", "PRIVMSG")
+    assert describe_record("SERVER", "libera", ":nick!u@h JOIN :#kanava") == (
+        "libera",
+        "#kanava",
+        "JOIN",
+    )
+    assert describe_record("MSG", "MessageHandler", "[libera:#kanava] moi") == (
+        "libera",
+        "#kanava",
+        "IRC",
+    )
+    # Other contexts are component names, not servers
+    assert describe_record("INFO", "GPTService", "ready") == ("", None, "AI")
+    assert describe_record("INFO", "Scheduler", "started") == ("", None, "SYSTEM")
+
+
+def test_sink_writes_json_lines_with_sparse_index(tmp_path):
+    path = str(tmp_path / "leet.jsonl")
+    sink = StructuredLogSink(path, index_interval=10)
+    _write(sink, 35)
+    sink.close()
+
+    with open(path, "rb") as f:
+        lines = f.readlines()
+    record = json.loads(lines[0])
+    assert record == {
+        "ts": BASE,
+        "server": "",
+        "channel": None,
+        "context": "Bot",
+        "level": "INFO",
+        "event": "SYSTEM",
+        "message": "message 0",
+    }
+    offsets = [sum(len(line) for line in lines[:i]) for i in (0, 10, 20, 30)]
+    assert read_index(path) == [
+        (BASE + i * SECOND, offset) for i, offset in zip((0, 10, 20, 30), offsets)
+    ]
+
+    # Reopening continues the index instead of restarting it
+    sink = StructuredLogSink(path, index_interval=10)
+    _write(sink, 1, start=BASE + 35 * SECOND)
+    _write(sink, 1, start=BASE + 41 * SECOND)
+    sink.close()
+    assert [ts for ts, _ in read_index(path)][-1] == BASE + 41 * SECOND
+    assert len(read_index(path)) == 5
+
+
+def test_search_seeks_by_index_across_rotated_files(tmp_path):
+    path = str(tmp_path / "leet.jsonl")
+    sink = StructuredLogSink(path, index_interval=5, max_size=2000, max_count=5)
+    _write(sink, 60)
+    sink.close()
+    assert (tmp_path / "leet.jsonl.1").exists()
+    assert (tmp_path / "leet.jsonl.1.idx").exists()
+
+    records, total = search(path, BASE + 10 * SECOND, BASE + 40 * SECOND)
+    assert total == 31
+    assert [r["message"] for r in records] == [f"message {i}" for i in range(10, 41)]
+
+    records, total = search(
+        path, BASE, BASE + 59 * SECOND, pattern=r"message 5\d", limit=3
+    )
+    assert total == 10
+    assert [r["message"] for r in records] == ["message 50", "message 51", "message 52"]
+
+    assert search(path, BASE + 100 * SECOND, BASE + 200 * SECOND) == ([], 0)
+
+
+def test_search_rebuilds_a_missing_index(tmp_path):
+    path = str(tmp_path / "leet.jsonl")
+    sink = StructuredLogSink(path, index_interval=5)
+    _write(sink, 20)
+    sink.close()
+    (tmp_path / "leet.jsonl.idx").unlink()
+
+    assert [ts for ts, _ in read_index(path, 5 * SECOND)] == [
+        BASE + i * SECOND for i in (0, 5, 10, 15)
+    ]
+    records, total = search(path, BASE + 18 * SECOND, BASE + 30 * SECOND)
+    assert [r["message"] for r in records] == ["message 18", "message 19"]
+    assert total == 2
+
+
+def test_logger_feeds_structured_sink(tmp_path, monkeypatch):
+    monkeypatch.setattr(lg, "_LOG_LEVEL", "DEBUG")
+    path = str(tmp_path / "leet.jsonl")
+    lg.set_structured_sink(StructuredLogSink(path))
+    try:
+        assert lg.get_structured_sink().path == path
+        lg.get_logger("libera").server(":nick!u@h PRIVMSG #kanava :moi")
+        assert lg.flush_structured_log(2)
+    finally:
+        lg.clear_structured_sink()
+
+    assert lg.get_structured_sink() is None
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records[-1]["server"] == "libera"
+    assert records[-1]["context"] == "libera"
+    assert records[-1]["channel"] == "#kanava"
+    assert records[-1]["event"] == "PRIVMSG"
+    assert records[-1]["level"] == "SERVER"
+    assert (tmp_path / index_path("leet.jsonl")).exists()
@@ -504,6 +504,65 @@ def test_cleanup_empty_entries(temp_subscriptions_file):
         assert load_subscriptions() == {}
 
 
+def test_lookups_do_not_reparse_the_file(temp_subscriptions_file):
+    import subscriptions
+
+    with patch("subscriptions.SUBSCRIBERS_FILE", temp_subscriptions_file):
+        toggle_subscription("#kanava", "server1", "varoitukset")
+        toggle_subscription("user1", "server1", "varoitukset")
+        toggle_subscription("user1", "server2", "onnettomuustiedotteet")
+
+        with (
+            patch("subscriptions.load_subscriptions", side_effect=AssertionError),
+            patch("subscriptions.save_subscriptions", side_effect=AssertionError),
+        ):
+            assert get_subscribers("varoitukset") == [
+                ("#kanava", "server1"),
+                ("user1", "server1"),
+            ]
+            assert get_server_subscribers("onnettomuustiedotteet", "server2") == [
+                "user1"
+            ]
+            assert get_user_subscriptions("user1", "server1") == ["varoitukset"]
+            assert get_subscribers("tiedotteet") == []
+
+        # Removing the last subscriber drops the topic from the index
+        toggle_subscription("user1", "server2", "onnettomuustiedotteet")
+        assert "onnettomuustiedotteet" not in subscriptions._get_registry().by_topic
+
+
+def test_registry_picks_up_external_edits_on_reload(temp_subscriptions_file):
+    import subscriptions
+
+    with patch("subscriptions.SUBSCRIBERS_FILE", temp_subscriptions_file):
+        toggle_subscription("user1", "server1", "varoitukset")
+        assert get_server_subscribers("varoitukset", "server1") == ["user1"]
+
+        with open(temp_subscriptions_file, "w", encoding="utf-8") as f:
+            json.dump({"subscriptions": {"server1": {"other2": ["varoitukset"]}}}, f)
+        assert get_server_subscribers("varoitukset", "server1") == ["user1"]
+
+        subscriptions.reload_subscriptions()
+        assert get_server_subscribers("varoitukset", "server1") == ["other2"]
+
+
+def test_broadcasts_do_not_reparse_after_other_state_writes(temp_subscriptions_file):
+    from state_utils import update_json_file
+
+    with patch("subscriptions.SUBSCRIBERS_FILE", temp_subscriptions_file):
+        toggle_subscription("user1", "server1", "varoitukset")
+
+        # A poller saves its own section right before broadcasting
+        update_json_file(
+            temp_subscriptions_file,
+            lambda state: state.setdefault("fmi_warnings", {}).update(
+                seen_hashes=["a" * 2000]
+            ),
+        )
+        with patch("subscriptions.load_subscriptions", side_effect=AssertionError):
+            assert get_subscribers("varoitukset") == [("user1", "server1")]
+
+
 def test_concurrent_access(temp_subscriptions_file):
     with patch("subscriptions.SUBSCRIBERS_FILE", temp_subscriptions_file):
         for i in range(10):
@@ -682,7 +741,7 @@ def test_otiedote_subscriptions(otiedote_setup):
         assert not sent_messages
 
 
-def test_otiedote_subscriptions_respect_channel_filters(otiedote_setup, monkeypatch):
+def test_otiedote_subscriptions_respect_channel_filters(otiedote_setup, tmp_path):
     manager, fake_server, sent_messages = otiedote_setup
 
     class MockSubscriptions:
@@ -691,20 +750,20 @@ def test_otiedote_subscriptions_respect_channel_filters(otiedote_setup, monkeypa
                 return [("#general", "test_server")]
             return []
 
-    def fake_load_json_file(path, default=None):
-        return {
-            "otiedote": {
-                "filters": {
-                    "#general": ["Pohjois-Karjalan pelastuslaitos:organization"]
+    state_file = tmp_path / "state.json"
+    state_file.write_text(
+        json.dumps(
+            {
+                "otiedote": {
+                    "filters": {
+                        "#general": ["Pohjois-Karjalan pelastuslaitos:organization"]
+                    }
                 }
             }
-        }
-
-    monkeypatch.setattr(
-        "services.otiedote_json_service.load_json_file",
-        fake_load_json_file,
-        raising=True,
+        ),
+        encoding="utf-8",
     )
+    manager.service_manager.services["otiedote"] = Mock(state_file=str(state_file))
 
     with patch.object(
         manager, "_get_subscriptions_module", return_value=MockSubscriptions()
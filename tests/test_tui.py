@@ -7,6 +7,7 @@ and related classes with comprehensive coverage.
 """
 
 import os
+import time
 from collections import deque
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -18,6 +19,8 @@ from tui import (  # WRAP_MODE,; _current_tui,
     ConfigEditor,
     FocusProtectingFrame,
     LogEntry,
+    LogFilter,
+    LogListWalker,
     NonFocusableListBox,
     SelectableText,
     StatsView,
@@ -551,6 +554,44 @@ class TestNonFocusableListBox:
         assert listbox.should_auto_scroll() is False
 
 
+class TestLogListWalker:
+    """Test the virtualized log list walker."""
+
+    def test_widgets_are_built_only_for_drawn_rows(self):
+        built = []
+
+        def render(item):
+            built.append(item)
+            return SelectableText(item)
+
+        walker = LogListWalker([f"line {i}" for i in range(5000)], render)
+        listbox = NonFocusableListBox(walker)
+        listbox.scroll_to_bottom()
+
+        canvas = listbox.render((40, 10), focus=False)
+
+        assert canvas.text[-1].decode().rstrip() == "line 4999"
+        assert len(built) <= 12
+        assert len(walker.materialized()) == len(set(built))
+
+        for i in range(300):
+            walker[i]
+        assert len(walker.materialized()) == LogListWalker.CACHE_SIZE
+
+    def test_popleft_keeps_positions_and_cache_consistent(self):
+        walker = LogListWalker(["a", "b", "c"], SelectableText)
+        first_c = walker[2]
+        walker.set_focus(2)
+
+        assert walker.popleft() == "a"
+
+        assert len(walker) == 2
+        assert walker.focus == 1
+        assert walker[1] is first_c
+        assert walker.materialized() == [(1, first_c)]
+        assert [w._text_content for w in walker] == ["b", "c"]
+
+
 class TestStatsView:
     """Test StatsView class functionality."""
 
@@ -1022,6 +1063,120 @@ class TestTUIManager:
 
         assert tui_manager.current_view == expected_view
 
+    def test_log_view_follows_buffer_and_filter(self):
+        """The console view shows filtered entries still in the log buffer."""
+        tui_manager = TUIManager()
+        tui_manager.log_entries = deque(maxlen=5)
+        tui_manager.apply_filter("keep")
+
+        for i in range(10):
+            tui_manager.add_log_entry(
+                datetime.now(), "S", "INFO", f"{'keep' if i % 2 else 'drop'} {i}"
+            )
+
+        assert [entry.message for entry in tui_manager.log_walker.items] == [
+            "keep 5",
+            "keep 7",
+            "keep 9",
+        ]
+        assert tui_manager.log_display.focus_position == 2
+
+        tui_manager.apply_filter("")
+        assert len(tui_manager.log_walker) == 5
+
+    def test_log_entries_from_threads_are_drawn_in_one_frame(self):
+        """Entries queued while the loop runs share one wakeup and redraw."""
+        tui_manager = TUIManager()
+        tui_manager.loop = Mock()
+        read_fd, write_fd = os.pipe()
+        tui_manager._redraw_fd = write_fd
+        try:
+            for i in range(50):
+                tui_manager.add_log_entry(datetime.now(), "S", "INFO", f"msg {i}")
+
+            assert len(tui_manager.log_walker) == 0
+            assert os.read(read_fd, 100) == b"\n"
+
+            tui_manager._last_redraw = 0.0
+            assert tui_manager._on_redraw_wakeup(b"\n") is True
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        assert len(tui_manager.log_walker) == 50
+        tui_manager.loop.draw_screen.assert_called_once()
+        assert tui_manager._redraw_pending is False
+
+        # A second wakeup inside the frame interval waits for an alarm
+        tui_manager._last_redraw = time.monotonic()
+        tui_manager._on_redraw_wakeup(b"\n")
+        assert tui_manager.loop.set_alarm_in.call_count == 1
+        assert tui_manager.loop.draw_screen.call_count == 1
+
+    def test_structured_filter_terms(self):
+        """server:, level:, channel: and re: words must all match."""
+        entries = [
+            LogEntry(datetime.now(), "libera", "SERVER", ":a!u@h PRIVMSG #Kanava :moi"),
+            LogEntry(datetime.now(), "libera", "MSG", "[libera:#other] vastaus"),
+            LogEntry(datetime.now(), "IRCnet", "ERROR", "Lost #kanava, reconnecting"),
+        ]
+
+        def matching(text):
+            return [
+                i for i, entry in enumerate(entries) if LogFilter(text).matches(entry)
+            ]
+
+        assert matching("channel:kanava") == [0, 2]
+        assert matching("channel:#kanava server:lib") == [0]
+        assert matching("channel:#other") == [1]
+        assert matching("level:error reconnect") == [2]
+        assert matching("re:mo+i") == [0]
+        assert matching("re:([") == []
+        # Plain text is one substring, as before structured terms existed
+        assert matching("lost #kanava") == [2]
+        assert entries[0].matches_filter("SERVER")
+        assert entries[2].matches_filter("") and not entries[2].matches_filter("x y")
+
+    def test_filter_narrows(self):
+        """Only refinements of a filter count as narrowing it."""
+        assert LogFilter("error").narrows(LogFilter(""))
+        assert LogFilter("errors").narrows(LogFilter("error"))
+        assert LogFilter("level:error server:lib").narrows(LogFilter("level:err"))
+        assert not LogFilter("error").narrows(LogFilter("errors"))
+        assert not LogFilter("level:error").narrows(LogFilter("error"))
+        assert not LogFilter("channel:#ab").narrows(LogFilter("channel:#a"))
+        assert not LogFilter("re:ab").narrows(LogFilter("re:a"))
+
+    def test_narrowed_filter_refines_shown_rows(self):
+        """Typing more of a filter rescans only the rows already shown."""
+        tui_manager = TUIManager()
+        for i in range(6):
+            tui_manager.add_log_entry(
+                datetime.now(), "S", "INFO", f"{'keep' if i % 2 else 'drop'} {i}"
+            )
+        tui_manager.apply_filter("kee")
+        assert len(tui_manager.log_walker) == 3
+
+        checked = []
+        original = LogEntry.search_fields
+
+        def counting(entry):
+            checked.append(entry.message)
+            return original(entry)
+
+        with patch.object(LogEntry, "search_fields", counting):
+            tui_manager.apply_filter("keep 1")
+        assert checked == ["keep 1", "keep 3", "keep 5"]
+        assert [entry.message for entry in tui_manager.log_walker.items] == ["keep 1"]
+
+        # Widening goes back to the whole buffer
+        tui_manager.apply_filter("drop")
+        assert [entry.message for entry in tui_manager.log_walker.items] == [
+            "drop 0",
+            "drop 2",
+            "drop 4",
+        ]
+
 
 class TestGlobalFunctions:
     """Test global functions and utilities."""
@@ -228,5 +228,240 @@ def test_drink_tracker_repairs_structures_caps_history_and_falls_back_from_alko(
     alko.get_product_info.side_effect = RuntimeError("lookup failed")
     assert tracker._parse_alcohol_content("beer 5% 0.5L") == 19.73
 
-    manager.load_drink_data = Mock(return_value={"servers": None})
+    manager.save_drink_data({"servers": None})
     assert not tracker.reset_user_stats("srv", "alice")
+
+
+def test_pattern_matcher_finds_overlapping_words_after_insertion():
+    from word_tracking.pattern_matcher import PatternMatcher
+
+    matcher = PatternMatcher([("he", "short"), ("she", "long")])
+    matcher.add("hers")
+
+    hits = list(matcher.finditer("uSHErs"))
+
+    assert hits == [(1, 4, "long"), (2, 4, "short"), (2, 6, "hers")]
+    assert matcher.values_in("ushers he") == ["long", "short", "hers"]
+    assert "HERS" in matcher and "her" not in matcher
+    assert matcher.add("") is False
+
+
+def test_drink_tracker_custom_word_matches_only_as_entry(tmp_path):
+    manager = DataManager(str(tmp_path))
+    tracker = DrinkTracker(manager)
+    tracker.add_drink_word_mapping("kippis", "Karhu", server="srv")
+
+    matches = tracker.process_message("srv", "alice", "kippis | krak (Olut 5%) @ 1:30")
+    assert [(m[0], m[1], m[3]) for m in matches] == [
+        ("kippis", "Karhu", None),
+        ("krak", "Olut 5%", "1:30"),
+    ]
+    assert tracker.process_message("srv", "alice", "no kippis here") == []
+    assert tracker.process_message("srv", "alice", "kippiskuppi") == []
+
+
+def test_drink_data_is_cached_and_written_through(tmp_path):
+    manager = DataManager(str(tmp_path))
+    tracker = DrinkTracker(manager)
+    tracker.add_drink_word_mapping("krak", "Karhu", server="srv")
+    manager.is_user_opted_out("srv", "alice")
+    manager.load_json = Mock(side_effect=AssertionError("unexpected file read"))
+
+    matches = tracker.process_message("srv", "alice", "krak | krak | krak")
+
+    assert [m[1] for m in matches] == ["Karhu"] * 3
+    stats = manager.load_drink_data()["servers"]["srv"]["nicks"]["alice"]
+    assert stats["total_drink_words"] == 3
+    with open(manager.drink_data_file, encoding="utf-8") as f:
+        assert '"total_drink_words": 3' in f.read()
+
+
+def test_drink_data_readers_get_copies_while_writers_hold_the_lock(tmp_path):
+    import threading
+
+    manager = DataManager(str(tmp_path))
+    tracker = DrinkTracker(manager)
+    snapshot = manager.load_drink_data()
+    snapshot["servers"]["srv"] = {"nicks": {}}
+    assert manager.load_drink_data()["servers"] == {}
+
+    def drink():
+        for _ in range(25):
+            tracker.process_message("srv", "alice", "krak | krak")
+
+    threads = [threading.Thread(target=drink) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        # Iterating a copy never sees the writers' changes mid-way
+        for server_data in manager.load_drink_data()["servers"].values():
+            for user_data in server_data["nicks"].values():
+                sum(dw["total"] for dw in user_data["drink_words"].values())
+    for thread in threads:
+        thread.join()
+
+    stats = manager.load_drink_data()["servers"]["srv"]["nicks"]["alice"]
+    assert stats["total_drink_words"] == 200
+
+
+def test_drink_data_cache_notices_external_writes(tmp_path):
+    import json
+    import os
+
+    manager = DataManager(str(tmp_path))
+    assert manager.load_drink_data()["servers"] == {}
+    with open(manager.drink_data_file, "w", encoding="utf-8") as f:
+        json.dump({"servers": {"srv": {"nicks": {}}}}, f)
+    stat = os.stat(manager.drink_data_file)
+    os.utime(manager.drink_data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert manager.load_drink_data() == {"servers": {"srv": {"nicks": {}}}}
+
+    manager.set_user_opt_out("srv", "Alice", True)
+    assert manager.is_user_opted_out("srv", "alice")
+    manager.set_user_opt_out("srv", "alice", False)
+    assert not manager.is_user_opted_out("srv", "ALICE")
+
+
+def test_drink_buckets_keep_counts_beyond_timestamp_cap(tmp_path):
+    from datetime import datetime, timedelta
+
+    from word_tracking.drink_tracker import count_buckets_since
+
+    manager = DataManager(str(tmp_path))
+    tracker = DrinkTracker(manager)
+    for _ in range(150):
+        tracker._record_drink_word("srv", "alice", "krak", "beer")
+    tracker._record_drink_word("srv", "alice", "narsk", "wine")
+
+    now = datetime.now()
+    buckets = tracker.get_user_stats("srv", "alice")["buckets"]
+    assert count_buckets_since(buckets, now - timedelta(hours=24)) == {
+        "beer": 150,
+        "wine": 1,
+    }
+
+    # Hours older than the hourly retention are folded into day totals
+    old = now - timedelta(days=3)
+    data = manager.load_drink_data()
+    user_buckets = data["servers"]["srv"]["nicks"]["alice"]["buckets"]
+    user_buckets["hours"][old.strftime("%Y-%m-%dT%H")] = {"beer": 2}
+    manager.save_drink_data(data)
+    tracker._record_drink_word("srv", "alice", "krak", "beer")
+    buckets = tracker.get_user_stats("srv", "alice")["buckets"]
+    assert buckets["days"] == {old.strftime("%Y-%m-%d"): {"beer": 2}}
+    assert count_buckets_since(buckets, now - timedelta(days=7))["beer"] == 153
+    assert count_buckets_since(buckets, now - timedelta(hours=24))["beer"] == 151
+
+
+def test_drink_buckets_are_seeded_from_old_timestamps(tmp_path):
+    from datetime import datetime, timedelta
+
+    manager = DataManager(str(tmp_path))
+    tracker = DrinkTracker(manager)
+    ten_days_ago = (datetime.now() - timedelta(days=10)).isoformat()
+    manager.save_drink_data(
+        {
+            "servers": {
+                "srv": {
+                    "nicks": {
+                        "alice": {
+                            "drink_words": {
+                                "krak": {
+                                    "total": 1,
+                                    "drinks": {"beer": 1},
+                                    "timestamps": [
+                                        {"time": ten_days_ago, "specific_drink": "beer"}
+                                    ],
+                                }
+                            },
+                            "total_drink_words": 1,
+                        }
+                    }
+                }
+            }
+        }
+    )
+
+    tracker._record_drink_word("srv", "alice", "krak", "cider")
+
+    buckets = manager.load_drink_data()["servers"]["srv"]["nicks"]["alice"]["buckets"]
+    assert sum(sum(day.values()) for day in buckets["days"].values()) == 1
+    assert sum(sum(hour.values()) for hour in buckets["hours"].values()) == 1
+
+
+def test_general_words_aggregates_follow_updates_from_any_tracker(tmp_path):
+    manager = DataManager(str(tmp_path))
+    words = GeneralWords(manager)
+    other = GeneralWords(manager)
+    words.process_message("srv", "alice", "olut olut siideri")
+    assert words.get_leaderboard("srv")[0]["total_words"] == 3
+
+    other.process_message("srv", "bob", "olut " * 5)
+    other.process_message("srv2", "carol", "siideri")
+
+    assert [row["nick"] for row in words.get_leaderboard("srv")] == ["bob", "alice"]
+    assert words.get_leaderboard(limit=1) == [
+        {"nick": "bob", "server": "srv", "total_words": 5}
+    ]
+    stats = words.get_server_stats("srv")
+    assert stats["total_words"] == 8
+    assert stats["top_words"] == [("olut", 7), ("siideri", 1)]
+    assert words.get_top_words(1) == [("olut", 7)]
+    assert (
+        manager.load_general_words_data()["servers"]["srv"]["nicks"]["bob"][
+            "total_words"
+        ]
+        == 5
+    )
+
+    # A dataset replaced on disk gets fresh aggregates
+    manager.save_general_words_data({"servers": {}})
+    assert words.get_top_words() == []
+
+
+def test_general_words_aggregates_live_with_the_cached_dataset(tmp_path):
+    import threading
+
+    manager = DataManager(str(tmp_path))
+    words = GeneralWords(manager)
+    words.process_message("srv", "alice", "olut")
+    aggregates = words._aggregates()
+
+    def talk(nick):
+        for _ in range(50):
+            words.process_message("srv", nick, "olut siideri")
+
+    threads = [threading.Thread(target=talk, args=(f"n{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        words.get_leaderboard()
+        words.search_word("olut")
+    for thread in threads:
+        thread.join()
+
+    assert words._aggregates() is aggregates
+    assert words.get_top_words(2) == [("olut", 201), ("siideri", 200)]
+    assert words.get_server_stats("srv")["total_words"] == 401
+
+    # Saving a different dataset drops the aggregates along with the old data
+    manager.save_general_words_data(manager.load_general_words_data())
+    assert words._aggregates() is not aggregates
+    assert words.get_top_words(1) == [("olut", 201)]
+
+
+def test_top_k_is_exact_for_growing_counters():
+    import random
+
+    from word_tracking.general_words import _TopK
+
+    rng = random.Random(7)  # noqa: S311 - reproducible test data
+    top = _TopK(5)
+    counts = {}
+    for _ in range(2000):
+        key = rng.randrange(40)
+        counts[key] = counts.get(key, 0) + rng.randint(1, 3)
+        top.update(key, counts[key])
+        expected = sorted(counts.values(), reverse=True)[:5]
+        assert [count for _, count in top.most_common(5)] == expected